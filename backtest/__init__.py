@@ -25,6 +25,8 @@ from .backtester import (
     BacktestConfig,
     Backtester,
     MultiStrategyBacktester,
+    precompute_indicators,
+    resample_ohlcv,
     run_backtest,
 )
 
@@ -49,5 +51,7 @@ __all__ = [
     'BacktestConfig',
     'Backtester',
     'MultiStrategyBacktester',
+    'precompute_indicators',
+    'resample_ohlcv',
     'run_backtest',
 ]
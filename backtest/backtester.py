@@ -50,6 +50,7 @@ class BacktestConfig:
     use_stop_loss: bool = True         # 손절 사용
     use_take_profit: bool = True       # 익절 사용
     allow_short: bool = False          # 공매도 허용
+    resample_freq: Optional[str] = None  # 봉 주기 변환 (예: 'W-FRI', None이면 전략 설정 사용)
 
 
 class Backtester:
@@ -348,6 +349,11 @@ class Backtester:
 
         log_info(f"백테스트 시작: {self.strategy.name} 전략, {len(data)}개 종목")
 
+        # 주봉 등 긴 주기 전략은 종목별로 한 번만 변환
+        freq = self.config.resample_freq or self.strategy.resample_freq
+        if freq:
+            data = {code: resample_ohlcv(df, freq) for code, df in data.items()}
+
         # 모든 날짜 수집
         all_dates = set()
         for code, df in data.items():
@@ -524,6 +530,81 @@ class MultiStrategyBacktester:
         return "\n".join(lines)
 
 
+def resample_ohlcv(df: pd.DataFrame, freq: str = 'W-FRI') -> pd.DataFrame:
+    """
+    일봉 OHLCV를 긴 주기 봉으로 변환
+
+    Args:
+        df: 날짜 인덱스 OHLCV DataFrame
+        freq: 변환 주기 (기본값: 금요일 기준 주봉)
+
+    Returns:
+        변환된 OHLCV DataFrame (거래가 없는 구간 제외, 지표 컬럼은 제거)
+    """
+    if df.empty:
+        return df
+
+    col_lower = {c.lower(): c for c in df.columns}
+    agg = {}
+    for key, how in (('open', 'first'), ('high', 'max'), ('low', 'min'),
+                     ('close', 'last'), ('volume', 'sum')):
+        if key in col_lower:
+            agg[col_lower[key]] = how
+
+    close_col = col_lower.get('close', 'Close')
+    return df.resample(freq).agg(agg).dropna(subset=[close_col])
+
+
+def precompute_indicators(data: Dict[str, pd.DataFrame],
+                          ma_periods: List[int] = None,
+                          volume_period: Optional[int] = None) -> Dict[str, pd.DataFrame]:
+    """
+    전 종목 이동평균/거래량 평균을 패널 단위로 한 번에 계산
+
+    종목을 (code, date) MultiIndex로 쌓아 groupby-rolling 한 번으로 처리한다.
+    rolling 값은 해당 날짜 이전 데이터만 사용하므로 일별 슬라이스에서도 그대로 유효하다.
+    기본값은 전략이 실제로 읽는 ma60 컬럼(BaseStrategy._ma_array)만 계산한다.
+
+    Args:
+        data: {code: OHLCV DataFrame} (컬럼명 통일 필요)
+        ma_periods: 이동평균 기간 리스트 (기본값: 60)
+        volume_period: 거래량 평균 기간 (None이면 계산하지 않음)
+
+    Returns:
+        ma{기간}(및 volume_ma{기간}) 컬럼이 추가된 {code: DataFrame}
+        (calculate_all_ma와 동일하게 min_periods=1)
+    """
+    if ma_periods is None:
+        ma_periods = [60]
+
+    frames = {code: df for code, df in data.items() if not df.empty}
+    if not frames:
+        return dict(data)
+
+    col_lower = {c.lower(): c for c in next(iter(frames.values())).columns}
+    close_col = col_lower.get('close', 'Close')
+
+    panel = pd.concat(frames, names=['code', None])
+    grouped_close = panel[close_col].groupby(level=0, sort=False)
+
+    new_cols = {
+        f'ma{period}': grouped_close.rolling(period, min_periods=1).mean().droplevel(0)
+        for period in ma_periods
+    }
+    if volume_period is not None:
+        vol_col = col_lower.get('volume', 'Volume')
+        grouped_vol = panel[vol_col].groupby(level=0, sort=False)
+        new_cols[f'volume_ma{volume_period}'] = (
+            grouped_vol.rolling(volume_period, min_periods=1).mean().droplevel(0)
+        )
+    panel = panel.assign(**new_cols)
+
+    result = dict(data)
+    for code, df in panel.groupby(level=0, sort=False):
+        result[code] = df.droplevel(0)
+    return result
+
+
 def run_backtest(strategy: Union[str, BaseStrategy],
                  data: Dict[str, pd.DataFrame],
                  initial_capital: float = 10000000,
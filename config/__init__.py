@@ -10,6 +10,7 @@ from .settings import (
     MARKETS,
     DATABASE,
     LOGGING,
+    INDICATOR_CACHE,
     TELEGRAM,
     DATA_COLLECTION,
     TRADING,
@@ -17,6 +18,7 @@ from .settings import (
     BACKTEST,
     get_db_path,
     get_log_path,
+    get_cache_path,
     is_telegram_enabled,
     validate_settings,
 )
@@ -45,6 +47,7 @@ __all__ = [
     'MARKETS',
     'DATABASE',
     'LOGGING',
+    'INDICATOR_CACHE',
     'TELEGRAM',
     'DATA_COLLECTION',
     'TRADING',
@@ -52,6 +55,7 @@ __all__ = [
     'BACKTEST',
     'get_db_path',
     'get_log_path',
+    'get_cache_path',
     'is_telegram_enabled',
     'validate_settings',
     # constants
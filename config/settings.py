@@ -35,6 +35,13 @@ LOGGING = {
     'backup_count': 5,
 }
 
+# 지표 캐시 설정
+INDICATOR_CACHE = {
+    'path': BASE_DIR / 'cache',
+    # 지표 구성이 바뀌면 올려서 기존 캐시 무효화
+    'version': 1,
+}
+
 # 텔레그램 봇 설정
 TELEGRAM = {
     'token': os.getenv('TELEGRAM_BOT_TOKEN', ''),
@@ -57,6 +64,9 @@ DATA_COLLECTION = {
     # API 요청 간격 (초)
     'request_interval': 0.5,
 
+    # 일봉 동시 수집 스레드 수
+    'max_workers': 16,
+
     # 재시도 설정
     'max_retries': 3,
     'retry_delay': 5,
@@ -104,6 +114,11 @@ def get_log_path() -> Path:
     return LOGGING['path']
 
 
+def get_cache_path() -> Path:
+    """지표 캐시 디렉토리 경로 반환"""
+    return INDICATOR_CACHE['path']
+
+
 def is_telegram_enabled() -> bool:
     """텔레그램 알림 활성화 여부"""
     return TELEGRAM['enabled'] and TELEGRAM['token'] and TELEGRAM['chat_id']
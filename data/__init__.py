@@ -5,11 +5,13 @@ Data 모듈
 
 from .database import DatabaseManager, get_db
 from .collector import DataCollector, get_collector
+from .indicator_cache import load_or_compute, compute_indicators, invalidate_cache
 from .kis_api import (
     KISApi,
     get_kis_api,
     fetch_current_price,
     fetch_daily_ohlcv,
+    fetch_daily_ohlcv_many,
     fetch_minute_ohlcv,
     fetch_volume_rank,
     fetch_limit_up_stocks,
@@ -20,11 +22,16 @@ __all__ = [
     'get_db',
     'DataCollector',
     'get_collector',
+    # 지표 캐시
+    'load_or_compute',
+    'compute_indicators',
+    'invalidate_cache',
     # 한투 API
     'KISApi',
     'get_kis_api',
     'fetch_current_price',
     'fetch_daily_ohlcv',
+    'fetch_daily_ohlcv_many',
     'fetch_minute_ohlcv',
     'fetch_volume_rank',
     'fetch_limit_up_stocks',
@@ -4,8 +4,9 @@ SQLite 기반 주식 데이터 저장 및 관리
 """
 
 import sqlite3
+import threading
 from pathlib import Path
-from datetime import datetime, date
+from datetime import datetime, date, timedelta
 from typing import Optional, List, Dict, Any
 from contextlib import contextmanager
 import pandas as pd
@@ -14,6 +15,57 @@ import sys
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 from config import get_db_path, DATABASE
+from utils import normalize_ohlcv
+from data.indicator_cache import invalidate_cache
+
+
+# 일봉 OHLCV 조회 dtype (타입 추론 생략)
+# 가격은 float64 유지: float32 가격이 백테스터 자본/손익 계산에 섞이면
+# NumPy 2 타입 승격으로 자본금까지 float32가 되어 정밀도가 떨어진다
+OHLCV_DTYPES = {
+    'open': 'float64',
+    'high': 'float64',
+    'low': 'float64',
+    'close': 'float64',
+    'volume': 'int64',
+}
+
+
+# 일봉 upsert (거래대금/등락률은 새 값이 없으면 기존 값 유지)
+DAILY_OHLCV_UPSERT_SQL = '''
+    INSERT INTO daily_ohlcv (code, date, open, high, low, close, volume, value, change_rate)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(code, date) DO UPDATE SET
+        open = excluded.open,
+        high = excluded.high,
+        low = excluded.low,
+        close = excluded.close,
+        volume = excluded.volume,
+        value = COALESCE(excluded.value, value),
+        change_rate = COALESCE(excluded.change_rate, change_rate)
+'''
+
+
+def _read_ohlcv_sql(query: str, conn, params: list) -> pd.DataFrame:
+    """
+    OHLCV 조회 (고정 dtype 적용, 결측 거래량이 있으면 타입 추론으로 대체)
+
+    일봉 데이터의 유일한 조회 경로이므로 여기서 컬럼명을 소문자로 보장한다.
+
+    Args:
+        query: SQL 쿼리
+        conn: DB 연결
+        params: 쿼리 파라미터
+
+    Returns:
+        OHLCV DataFrame
+    """
+    try:
+        df = pd.read_sql_query(query, conn, params=params,
+                               parse_dates=['date'], dtype=OHLCV_DTYPES)
+    except (ValueError, TypeError):
+        df = pd.read_sql_query(query, conn, params=params, parse_dates=['date'])
+    return normalize_ohlcv(df)
 
 
 class DatabaseManager:
@@ -25,6 +77,8 @@ class DatabaseManager:
             db_path: 데이터베이스 파일 경로 (기본값: config에서 설정한 경로)
         """
         self.db_path = db_path or get_db_path()
+        # transaction() 중인 스레드의 공유 연결
+        self._local = threading.local()
         self._ensure_db_directory()
         self._init_db()
 
@@ -32,11 +86,34 @@ class DatabaseManager:
         """데이터베이스 디렉토리 생성"""
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
-    @contextmanager
-    def get_connection(self):
-        """데이터베이스 연결 컨텍스트 매니저"""
+    def _connect(self) -> sqlite3.Connection:
+        """새 연결 생성 (WAL 모드에서는 NORMAL 동기화로도 손상 없이 안전)"""
         conn = sqlite3.connect(self.db_path)
         conn.row_factory = sqlite3.Row
+        conn.execute('PRAGMA synchronous=NORMAL')
+        return conn
+
+    @contextmanager
+    def get_connection(self):
+        """
+        데이터베이스 연결 컨텍스트 매니저
+
+        transaction() 안에서 호출되면 공유 연결을 세이브포인트로 감싸 반환하므로
+        실패한 작업만 되돌리고 커밋은 transaction() 종료 시 한 번만 수행한다.
+        """
+        tx_conn = getattr(self._local, 'conn', None)
+        if tx_conn is not None:
+            tx_conn.execute('SAVEPOINT unit')
+            try:
+                yield tx_conn
+                tx_conn.execute('RELEASE unit')
+            except Exception:
+                tx_conn.execute('ROLLBACK TO unit')
+                tx_conn.execute('RELEASE unit')
+                raise
+            return
+
+        conn = self._connect()
         try:
             yield conn
             conn.commit()
@@ -46,8 +123,37 @@ class DatabaseManager:
         finally:
             conn.close()
 
+    @contextmanager
+    def transaction(self):
+        """
+        여러 쓰기 작업을 하나의 트랜잭션으로 묶는 컨텍스트 매니저
+
+        블록 안의 insert_* 호출은 같은 연결을 사용하고 종료 시 한 번만 커밋한다
+        (종목마다 커밋/fsync 하지 않음). 호출한 스레드에만 적용된다.
+        """
+        if getattr(self._local, 'conn', None) is not None:
+            # 이미 트랜잭션 중이면 바깥 트랜잭션에 합류
+            yield self
+            return
+
+        conn = self._connect()
+        self._local.conn = conn
+        try:
+            conn.execute('BEGIN')
+            yield self
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            self._local.conn = None
+            conn.close()
+
     def _init_db(self) -> None:
         """데이터베이스 초기화 및 테이블 생성"""
+        with self.get_connection() as conn:
+            # WAL 모드는 DB 파일에 유지되므로 초기화 시 한 번만 설정
+            conn.execute('PRAGMA journal_mode=WAL')
         self.create_tables()
 
     def create_tables(self) -> None:
@@ -233,23 +339,19 @@ class DatabaseManager:
                           volume: int, value: float = None,
                           change_rate: float = None) -> None:
         """일봉 데이터 삽입"""
+        invalidate_cache(code)
+
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute('''
-                INSERT INTO daily_ohlcv (code, date, open, high, low, close, volume, value, change_rate)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(code, date) DO UPDATE SET
-                    open = excluded.open,
-                    high = excluded.high,
-                    low = excluded.low,
-                    close = excluded.close,
-                    volume = excluded.volume,
-                    value = COALESCE(excluded.value, value),
-                    change_rate = COALESCE(excluded.change_rate, change_rate)
-            ''', (code, date_val, open_price, high, low, close, volume, value, change_rate))
+            cursor.execute(DAILY_OHLCV_UPSERT_SQL,
+                           (code, date_val, open_price, high, low, close, volume, value, change_rate))
 
     def insert_daily_ohlcv_bulk(self, data: List[Dict[str, Any]]) -> int:
         """일봉 데이터 벌크 삽입"""
+        # 과거 봉이 바뀌었을 수 있으므로 종목 지표 캐시 삭제
+        for code in {row['code'] for row in data}:
+            invalidate_cache(code)
+
         with self.get_connection() as conn:
             cursor = conn.cursor()
             cursor.executemany('''
@@ -271,26 +373,43 @@ class DatabaseManager:
         if df.empty:
             return 0
 
-        records = []
-        for idx, row in df.iterrows():
-            record = {
-                'code': code,
-                'date': idx.date() if isinstance(idx, datetime) else idx,
-                'open': row.get('Open', row.get('open')),
-                'high': row.get('High', row.get('high')),
-                'low': row.get('Low', row.get('low')),
-                'close': row.get('Close', row.get('close')),
-                'volume': int(row.get('Volume', row.get('volume', 0))),
-                'value': row.get('Value', row.get('value')),
-                'change_rate': row.get('Change', row.get('change_rate')),
-            }
-            records.append(record)
-
-        return self.insert_daily_ohlcv_bulk(records)
+        def column(*names, default=None):
+            for name in names:
+                if name in df.columns:
+                    return df[name]
+            return pd.Series(default, index=df.index, dtype=object)
+
+        if isinstance(df.index, pd.DatetimeIndex):
+            dates = df.index.date
+        else:
+            dates = df.index
+
+        volume = column('Volume', 'volume', default=0).astype('int64')
+
+        rows = pd.DataFrame({
+            'code': code,
+            'date': dates,
+            'open': column('Open', 'open').to_numpy(),
+            'high': column('High', 'high').to_numpy(),
+            'low': column('Low', 'low').to_numpy(),
+            'close': column('Close', 'close').to_numpy(),
+            'volume': volume.to_numpy(),
+            'value': column('Value', 'value').to_numpy(),
+            'change_rate': column('Change', 'change_rate').to_numpy(),
+        })
+
+        # 재수집/수정주가 반영으로 과거 봉이 바뀌었을 수 있으므로 종목 지표 캐시 삭제
+        invalidate_cache(code)
+
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany(DAILY_OHLCV_UPSERT_SQL,
+                               rows.itertuples(index=False, name=None))
+            return cursor.rowcount
 
     def get_daily_ohlcv(self, code: str, start_date: date = None,
                         end_date: date = None, limit: int = None) -> pd.DataFrame:
-        """일봉 데이터 조회"""
+        """일봉 데이터 조회 (컬럼명은 테이블 기준 소문자: open, high, low, close, volume)"""
         with self.get_connection() as conn:
             query = 'SELECT * FROM daily_ohlcv WHERE code = ?'
             params = [code]
@@ -308,13 +427,58 @@ class DatabaseManager:
                 query += ' LIMIT ?'
                 params.append(limit)
 
-            df = pd.read_sql_query(query, conn, params=params, parse_dates=['date'])
+            df = _read_ohlcv_sql(query, conn, params)
 
             if not df.empty:
                 df.set_index('date', inplace=True)
 
             return df
 
+    # SQLite 바인딩 변수 개수 제한(구버전 999) 이하로 IN 절 분할
+    BULK_QUERY_CHUNK = 900
+
+    def get_daily_ohlcv_bulk(self, codes: List[str], limit_days: int = None,
+                             end_date: date = None) -> pd.DataFrame:
+        """
+        여러 종목 일봉 데이터 일괄 조회 (종목별 개별 쿼리 대신 IN 절 단일 쿼리)
+
+        Args:
+            codes: 종목 코드 리스트
+            limit_days: 조회 기간 (일, end_date 기준 역산)
+            end_date: 조회 종료일 (기본값: 오늘)
+
+        Returns:
+            code 컬럼을 포함한 일봉 DataFrame (date 인덱스, code/date 순 정렬)
+        """
+        if not codes:
+            return pd.DataFrame()
+
+        end_date = end_date or date.today()
+        start_date = end_date - timedelta(days=limit_days) if limit_days else None
+
+        frames = []
+        with self.get_connection() as conn:
+            for i in range(0, len(codes), self.BULK_QUERY_CHUNK):
+                chunk = codes[i:i + self.BULK_QUERY_CHUNK]
+                query = (
+                    'SELECT code, date, open, high, low, close, volume FROM daily_ohlcv '
+                    f'WHERE code IN ({",".join("?" * len(chunk))})'
+                )
+                params = list(chunk)
+
+                if start_date:
+                    query += ' AND date >= ?'
+                    params.append(start_date)
+                query += ' AND date <= ? ORDER BY code, date'
+                params.append(end_date)
+
+                frame = _read_ohlcv_sql(query, conn, params)
+                if not frame.empty or not frames:
+                    frames.append(frame)
+
+        df = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+        return df.set_index('date')
+
     def get_latest_daily_date(self, code: str) -> Optional[date]:
         """종목의 가장 최근 일봉 날짜 조회"""
         with self.get_connection() as conn:
@@ -0,0 +1,129 @@
+"""
+지표 캐시 모듈
+종목별 기술지표를 parquet 파일로 저장해 반복 실행 시 재계산을 생략
+
+캐시 키: (종목코드, 지표 구성 버전, 마지막 날짜, 행 수)
+- 파일명에 버전을 포함해 지표 구성이 바뀌면 자동으로 새로 계산
+- 데이터의 마지막 날짜와 행 수가 같을 때만 캐시 사용
+- 과거 봉이 바뀌는 재수집·수정주가 반영은 DB 저장 시 invalidate_cache()로
+  종목 캐시 파일을 삭제해 처리 (로드할 때마다 OHLCV 전체를 비교하지 않음)
+
+pyarrow(또는 fastparquet)가 없으면 캐시 없이 매번 계산한다.
+"""
+
+from pathlib import Path
+from typing import Callable, Optional
+import pandas as pd
+
+import sys
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from config import INDICATOR_CACHE, get_cache_path
+from indicators import calculate_all_ma, calculate_volume_ratio
+
+try:
+    import pyarrow  # noqa: F401
+    PARQUET_AVAILABLE = True
+except ImportError:  # pragma: no cover - pyarrow 미설치 환경
+    try:
+        import fastparquet  # noqa: F401
+        PARQUET_AVAILABLE = True
+    except ImportError:
+        PARQUET_AVAILABLE = False
+
+# 캐시 대상 이동평균 기간
+CACHED_MA_PERIODS = [5, 20, 60]
+
+# 52주 거래일 수
+WEEKS_52_DAYS = 252
+
+
+def compute_indicators(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    기본 캐시 지표 계산 (MA5/20/60, 거래량 비율, 52주 고가/저가)
+
+    Args:
+        df: OHLCV DataFrame
+
+    Returns:
+        지표 컬럼만 담은 DataFrame (df와 같은 인덱스)
+    """
+    col_lower = {c.lower(): c for c in df.columns}
+    high = df[col_lower.get('high', 'High')]
+    low = df[col_lower.get('low', 'Low')]
+
+    ma = calculate_all_ma(df, periods=CACHED_MA_PERIODS)
+    return pd.DataFrame({
+        **{f'ma{p}': ma[f'ma{p}'] for p in CACHED_MA_PERIODS},
+        'volume_ratio': calculate_volume_ratio(df, 20),
+        'high_52w': high.rolling(window=WEEKS_52_DAYS, min_periods=1).max(),
+        'low_52w': low.rolling(window=WEEKS_52_DAYS, min_periods=1).min(),
+    }, index=df.index)
+
+
+def _cache_file(code: str, cache_dir: Path) -> Path:
+    """종목별 캐시 파일 경로 (지표 구성 버전 포함)"""
+    return cache_dir / f"{code}_v{INDICATOR_CACHE['version']}.parquet"
+
+
+def _is_valid(cached: pd.DataFrame, df: pd.DataFrame) -> bool:
+    """캐시의 마지막 날짜와 행 수가 현재 데이터와 일치하는지 확인"""
+    return (len(cached) == len(df) and len(df) > 0
+            and cached.index[-1] == df.index[-1])
+
+
+def invalidate_cache(code: str, cache_dir: Optional[Path] = None) -> None:
+    """
+    종목 지표 캐시 삭제 (일봉 재수집/수정주가 반영 등 과거 데이터 변경 시)
+
+    Args:
+        code: 종목 코드
+        cache_dir: 캐시 디렉토리 (기본값: config에서 설정한 경로)
+    """
+    try:
+        _cache_file(code, cache_dir or get_cache_path()).unlink(missing_ok=True)
+    except OSError as e:
+        print(f"Error removing indicator cache for {code}: {e}")
+
+
+def load_or_compute(code: str, df: pd.DataFrame,
+                    compute_fn: Callable[[pd.DataFrame], pd.DataFrame] = compute_indicators,
+                    cache_dir: Optional[Path] = None) -> pd.DataFrame:
+    """
+    캐시된 지표를 불러오거나 계산 후 저장
+
+    Args:
+        code: 종목 코드
+        df: OHLCV DataFrame (날짜 인덱스)
+        compute_fn: 지표 계산 함수 (지표 컬럼 DataFrame 반환)
+        cache_dir: 캐시 디렉토리 (기본값: config에서 설정한 경로)
+
+    Returns:
+        OHLCV에 지표 컬럼이 병합된 DataFrame
+    """
+    if df.empty:
+        return df
+
+    if not PARQUET_AVAILABLE:
+        return df.assign(**compute_fn(df))
+
+    path = _cache_file(code, cache_dir or get_cache_path())
+
+    indicators = None
+    if path.exists():
+        try:
+            cached = pd.read_parquet(path)
+            if _is_valid(cached, df):
+                indicators = cached.set_axis(df.index)
+        except Exception as e:
+            print(f"Error reading indicator cache for {code}: {e}")
+
+    if indicators is None:
+        indicators = compute_fn(df)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            indicators.to_parquet(path, compression='snappy')
+        except Exception as e:
+            print(f"Error writing indicator cache for {code}: {e}")
+
+    return df.assign(**indicators)
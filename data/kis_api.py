@@ -5,11 +5,14 @@
 
 import requests
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from typing import Optional, Dict, List
 from pathlib import Path
 import os
 import sys
+import threading
+import time
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
@@ -31,6 +34,13 @@ class KISApi:
     BASE_URL_REAL = "https://openapi.koreainvestment.com:9443"  # 실전
     BASE_URL_MOCK = "https://openapivts.koreainvestment.com:29443"  # 모의
 
+    # 초당 호출 수 제한 (한투 API 실전 20건/초, 모의 2건/초)
+    MAX_REQUESTS_PER_SECOND_REAL = 20
+    MAX_REQUESTS_PER_SECOND_MOCK = 2
+
+    # 동시 요청 수 제한 (requests 기본 커넥션 풀 크기, 초당 제한과는 별개)
+    MAX_CONCURRENT_REQUESTS = 10
+
     def __init__(self,
                  app_key: str = None,
                  app_secret: str = None,
@@ -52,6 +62,17 @@ class KISApi:
         self.access_token = None
         self.token_expired = None
 
+        # 커넥션 재사용을 위한 공유 세션 및 동시 요청 제한
+        self.session = requests.Session()
+        self._semaphore = threading.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+        self._token_lock = threading.Lock()
+
+        # 초당 호출 제한: 스레드 간 공유하는 최소 요청 간격
+        max_rps = self.MAX_REQUESTS_PER_SECOND_MOCK if is_mock else self.MAX_REQUESTS_PER_SECOND_REAL
+        self._min_interval = 1.0 / max_rps
+        self._next_request_at = 0.0
+        self._rate_lock = threading.Lock()
+
         # 계좌번호 파싱
         if self.account_no and '-' in self.account_no:
             parts = self.account_no.split('-')
@@ -94,6 +115,11 @@ class KISApi:
             log_error("한투 API가 설정되지 않았습니다. .env 파일을 확인하세요.")
             return None
 
+        with self._token_lock:
+            return self._issue_access_token()
+
+    def _issue_access_token(self) -> Optional[str]:
+        """토큰 발급 요청 (_token_lock 보유 상태에서 호출)"""
         # 토큰이 유효하면 재사용
         if self.access_token and self.token_expired:
             if datetime.now() < self.token_expired:
@@ -108,7 +134,7 @@ class KISApi:
         }
 
         try:
-            response = requests.post(url, json=body)
+            response = self.session.post(url, json=body)
             response.raise_for_status()
 
             data = response.json()
@@ -127,6 +153,18 @@ class KISApi:
             log_error(f"토큰 발급 오류: {e}")
             return None
 
+    def _wait_rate_limit(self):
+        """초당 호출 제한을 넘지 않도록 다음 요청 시각까지 대기"""
+        with self._rate_lock:
+            now = time.monotonic()
+            scheduled = max(now, self._next_request_at)
+            self._next_request_at = scheduled + self._min_interval
+
+        # 시각 예약은 잠금 안에서, 대기는 잠금 밖에서 (다른 스레드는 다음 슬롯 예약)
+        delay = scheduled - now
+        if delay > 0:
+            time.sleep(delay)
+
     def _request(self, method: str, endpoint: str,
                  tr_id: str = None,
                  params: Dict = None,
@@ -153,10 +191,12 @@ class KISApi:
         headers = self._get_headers(tr_id)
 
         try:
-            if method.upper() == 'GET':
-                response = requests.get(url, headers=headers, params=params)
-            else:
-                response = requests.post(url, headers=headers, json=body)
+            with self._semaphore:
+                self._wait_rate_limit()
+                if method.upper() == 'GET':
+                    response = self.session.get(url, headers=headers, params=params)
+                else:
+                    response = self.session.post(url, headers=headers, json=body)
 
             response.raise_for_status()
             data = response.json()
@@ -519,6 +559,46 @@ def fetch_daily_ohlcv(code: str, days: int = 365) -> Optional[pd.DataFrame]:
     return api.get_daily_ohlcv(code, start_date=start_date)
 
 
+def fetch_daily_ohlcv_many(codes: List[str], days: int = 365,
+                           max_workers: int = 10) -> Dict[str, pd.DataFrame]:
+    """
+    여러 종목 일봉 데이터 병렬 조회
+
+    Args:
+        codes: 종목코드 리스트
+        days: 조회 기간 (일)
+        max_workers: 최대 스레드 수
+
+    Returns:
+        {종목코드: OHLCV DataFrame} 딕셔너리 (조회 실패 종목 제외)
+    """
+    api = get_kis_api()
+    start_date = (datetime.now() - timedelta(days=days)).strftime('%Y%m%d')
+
+    # 토큰을 미리 발급해 워커 간 중복 발급 방지
+    if not api.get_access_token():
+        return {}
+
+    results = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(api.get_daily_ohlcv, code, start_date=start_date): code
+            for code in codes
+        }
+
+        for future in as_completed(futures):
+            code = futures[future]
+            try:
+                df = future.result()
+            except Exception as e:
+                log_error(f"{code} 일봉 조회 실패: {e}")
+                continue
+            if df is not None:
+                results[code] = df
+
+    return results
+
+
 def fetch_minute_ohlcv(code: str, timeframe: int = 15) -> Optional[pd.DataFrame]:
     """분봉 데이터 조회"""
     api = get_kis_api()
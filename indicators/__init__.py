@@ -8,6 +8,7 @@ from .moving_average import (
     calculate_ema,
     calculate_wma,
     calculate_all_ma,
+    calculate_all_ma_batch,
     get_ma_values,
     get_ma_status,
     detect_golden_cross,
@@ -91,6 +92,7 @@ __all__ = [
     'calculate_ema',
     'calculate_wma',
     'calculate_all_ma',
+    'calculate_all_ma_batch',
     'get_ma_values',
     'get_ma_status',
     'detect_golden_cross',
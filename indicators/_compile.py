@@ -0,0 +1,69 @@
+"""
+지표 커널 AOT 컴파일 스크립트
+
+_numba_kernels의 JIT 커널을 시그니처 고정 확장 모듈로 미리 컴파일해
+프로세스 시작 시 JIT 컴파일 시간을 제거한다.
+
+사용법:
+    python -m indicators._compile
+
+생성된 indicators/_indicator_kernels_aot.*.so 파일이 있으면
+_numba_kernels가 자동으로 우선 사용한다 (플랫폼별로 빌드 필요).
+"""
+
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from numba.pycc import CC
+
+from indicators._numba_kernels import (
+    ema_kernel,
+    sma_kernel,
+    multi_sma_kernel,
+    obv_kernel,
+    volume_ratio_kernel,
+    pct_change_kernel,
+    accumulation_stats_kernel,
+    shifted_mean_kernel,
+)
+
+AOT_MODULE_NAME = '_indicator_kernels_aot'
+
+# (내보낼 이름, 시그니처, 원본 커널)
+EXPORTS = [
+    ('ema_f8', 'f8[:](f8[:], f8)', ema_kernel),
+    ('sma_f8', 'f8[:](f8[:], i8)', sma_kernel),
+    ('sma_i8', 'f8[:](i8[:], i8)', sma_kernel),
+    ('multi_sma_f8', 'void(f8[:], i8[:], f8[:, :])', multi_sma_kernel),
+    ('obv_f8', 'f8[:](f8[:], f8[:])', obv_kernel),
+    ('obv_f8i8', 'f8[:](f8[:], i8[:])', obv_kernel),
+    ('volume_ratio_i8', 'f8[:](i8[:], i8)', volume_ratio_kernel),
+    ('pct_change_f8', 'f8[:](f8[:], i8)', pct_change_kernel),
+    ('pct_change_i8', 'f8[:](i8[:], i8)', pct_change_kernel),
+    ('accumulation_stats_f8', 'UniTuple(f8, 5)(f8[:], f8[:])', accumulation_stats_kernel),
+    ('shifted_mean_f8', 'f8[:](f8[:], i8)', shifted_mean_kernel),
+    ('shifted_mean_i8', 'f8[:](i8[:], i8)', shifted_mean_kernel),
+]
+
+
+def build(output_dir: Path = None) -> None:
+    """
+    AOT 확장 모듈 빌드
+
+    Args:
+        output_dir: 출력 디렉토리 (기본값: indicators/)
+    """
+    cc = CC(AOT_MODULE_NAME)
+    cc.output_dir = str(output_dir or Path(__file__).resolve().parent)
+    cc.verbose = True
+
+    for name, signature, kernel in EXPORTS:
+        cc.export(name, signature)(kernel.py_func)
+
+    cc.compile()
+
+
+if __name__ == '__main__':
+    build()
@@ -0,0 +1,332 @@
+"""
+Numba JIT 커널 모듈
+지표 계산 핫루프를 NumPy 배열 단위로 컴파일
+
+numba가 설치되지 않은 환경에서는 순수 파이썬 함수로 동작하므로
+호출 측에서 NUMBA_AVAILABLE을 확인해 pandas 경로를 우선 사용한다.
+
+indicators/_compile.py로 빌드한 AOT 모듈이 있으면 JIT 대신 사용한다.
+AOT 모듈에 포함된 지표 커널은 KERNELS_AVAILABLE(numba 또는 AOT)로 확인하고,
+NUMBA_AVAILABLE은 numba 임포트 가능 여부만 뜻한다 (AOT에 없는 커널용).
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - numba 미설치 환경
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """numba 미설치 시 데코레이터 대체 (원본 함수 그대로 반환)"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+        return decorator
+
+
+@njit(cache=True, fastmath=True)
+def ema_kernel(x, alpha):
+    """
+    지수이동평균 재귀식 (pandas ewm(adjust=False)와 동일)
+
+    Args:
+        x: float64 가격 배열
+        alpha: 평활 계수 (2 / (period + 1))
+
+    Returns:
+        EMA 배열
+    """
+    y = np.empty_like(x)
+    if x.size == 0:
+        return y
+    y[0] = x[0]
+    for i in range(1, x.size):
+        y[i] = alpha * x[i] + (1.0 - alpha) * y[i - 1]
+    return y
+
+
+@njit(cache=True)
+def sma_kernel(x, period):
+    """
+    누적합 기반 단순이동평균 (rolling(min_periods=1).mean()과 동일)
+
+    Args:
+        x: 가격/거래량 배열 (float64 또는 int64)
+        period: 이동평균 기간
+
+    Returns:
+        SMA 배열 (float64)
+    """
+    n = x.size
+    y = np.empty(n, dtype=np.float64)
+    s = 0.0
+    for i in range(n):
+        s += x[i]
+        if i >= period:
+            s -= x[i - period]
+        y[i] = s / min(i + 1, period)
+    return y
+
+
+@njit(cache=True)
+def _multi_sma(x, periods, out):
+    """
+    여러 기간 단순이동평균을 한 번의 순회로 계산
+
+    Args:
+        x: 가격 배열
+        periods: int64 기간 배열 (K개)
+        out: 결과를 기록할 (K, N) float64 배열
+    """
+    n = x.size
+    k = periods.size
+    sums = np.zeros(k, dtype=np.float64)
+    for i in range(n):
+        xi = x[i]
+        for j in range(k):
+            p = periods[j]
+            sums[j] += xi
+            if i >= p:
+                sums[j] -= x[i - p]
+            out[j, i] = sums[j] / min(i + 1, p)
+
+
+multi_sma_kernel = _multi_sma
+
+
+@njit(cache=True, parallel=True, nogil=True)
+def multi_sma_batch_kernel(mat, lengths, periods, out):
+    """
+    여러 종목의 다기간 SMA를 종목 축으로 병렬 계산 (GIL 해제)
+
+    Args:
+        mat: (S, N) float64 종가 행렬 (종목별 길이 이후는 패딩)
+        lengths: int64 종목별 유효 길이 배열
+        periods: int64 기간 배열 (K개)
+        out: 결과를 기록할 (S, K, N) float64 배열
+    """
+    for s in prange(mat.shape[0]):
+        n = lengths[s]
+        _multi_sma(mat[s, :n], periods, out[s, :, :n])
+
+
+@njit(cache=True)
+def obv_kernel(close, volume):
+    """
+    OBV 누적 계산 (부호 결정 + 곱셈 + 누적합을 단일 순회로 처리)
+
+    Args:
+        close: float64 종가 배열
+        volume: float64 거래량 배열
+
+    Returns:
+        OBV 배열
+    """
+    n = close.size
+    out = np.empty(n, dtype=np.float64)
+    if n == 0:
+        return out
+    out[0] = 0.0
+    acc = 0.0
+    for i in range(1, n):
+        d = close[i] - close[i - 1]
+        if d > 0:
+            acc += volume[i]
+        elif d < 0:
+            acc -= volume[i]
+        out[i] = acc
+    return out
+
+
+@njit(cache=True)
+def shifted_mean_kernel(x, window):
+    """
+    직전 window개 평균 (rolling(min_periods=1).mean().shift(1)과 동일)
+
+    Args:
+        x: 거래량 배열 (float64 또는 int64)
+        window: 평균 기간
+
+    Returns:
+        현재 값을 제외한 직전 평균 배열 (첫 값은 NaN)
+    """
+    n = x.size
+    out = np.empty(n, dtype=np.float64)
+    if n == 0:
+        return out
+    out[0] = np.nan
+    s = 0.0
+    for i in range(1, n):
+        s += x[i - 1]
+        if i > window:
+            s -= x[i - 1 - window]
+        out[i] = s / min(i, window)
+    return out
+
+
+@njit(cache=True)
+def volume_ratio_kernel(volume, period):
+    """
+    거래량 비율 (현재 거래량 / 이동평균, rolling(min_periods=1) 기준)
+
+    정수 거래량의 이동합을 int64로 누적하고 마지막에 한 번만 나눔
+
+    Args:
+        volume: int64 거래량 배열
+        period: 이동평균 기간
+
+    Returns:
+        거래량 비율 배열 (float64, 이동합이 0이면 NaN)
+    """
+    n = volume.size
+    out = np.empty(n, dtype=np.float64)
+    s = 0
+    for i in range(n):
+        s += volume[i]
+        if i >= period:
+            s -= volume[i - period]
+        if s == 0:
+            out[i] = np.nan
+        else:
+            out[i] = volume[i] * min(i + 1, period) / s
+    return out
+
+
+@njit(cache=True)
+def pct_change_kernel(x, periods):
+    """
+    변화율 계산 (pct_change(periods)와 동일, 0으로 나누면 inf/NaN)
+
+    기준값 0은 명시적으로 처리한다 (AOT 빌드는 error_model='numpy'를 유지하지 않아
+    나눗셈이 ZeroDivisionError를 낼 수 있음).
+
+    Args:
+        x: 거래량/가격 배열 (float64 또는 int64)
+        periods: 비교 기간
+
+    Returns:
+        변화율 배열 (앞 periods개는 NaN)
+    """
+    n = x.size
+    out = np.empty(n, dtype=np.float64)
+    for i in range(min(periods, n)):
+        out[i] = np.nan
+    for i in range(periods, n):
+        prev = float(x[i - periods])
+        diff = float(x[i]) - prev
+        if prev != 0.0:
+            out[i] = diff / prev
+        elif diff > 0:
+            out[i] = np.inf
+        elif diff < 0:
+            out[i] = -np.inf
+        else:
+            out[i] = np.nan
+    return out
+
+
+@njit(cache=True)
+def accumulation_stats_kernel(close, volume):
+    """
+    매집 구간 판단용 통계를 단일 순회로 계산 (Welford 분산)
+
+    Args:
+        close: float64 종가 배열
+        volume: float64 거래량 배열
+
+    Returns:
+        (종가 최소, 종가 최대, 종가 평균, 거래량 평균, 거래량 표준편차(ddof=1))
+    """
+    n = close.size
+    cmin = close[0]
+    cmax = close[0]
+    csum = 0.0
+    vmean = 0.0
+    m2 = 0.0
+    for i in range(n):
+        c = close[i]
+        if c < cmin:
+            cmin = c
+        if c > cmax:
+            cmax = c
+        csum += c
+
+        delta = volume[i] - vmean
+        vmean += delta / (i + 1)
+        m2 += delta * (volume[i] - vmean)
+
+    vstd = np.sqrt(m2 / (n - 1)) if n > 1 else np.nan
+    return cmin, cmax, csum / n, vmean, vstd
+
+
+# =========================================================
+# AOT 컴파일 모듈 (python -m indicators._compile)
+# =========================================================
+
+try:
+    from indicators import _indicator_kernels_aot as _aot
+except ImportError:
+    _aot = None
+
+AOT_AVAILABLE = _aot is not None
+
+# AOT 모듈에 포함된 지표 커널 사용 가능 여부 (numba 미설치여도 AOT 빌드가 있으면 사용)
+KERNELS_AVAILABLE = NUMBA_AVAILABLE or AOT_AVAILABLE
+
+if AOT_AVAILABLE:
+    ema_kernel = _aot.ema_f8
+    multi_sma_kernel = _aot.multi_sma_f8
+    accumulation_stats_kernel = _aot.accumulation_stats_f8
+    volume_ratio_kernel = _aot.volume_ratio_i8
+
+    def obv_kernel(close, volume):
+        """AOT OBV 커널 (거래량 dtype별 시그니처 선택)"""
+        if volume.dtype == np.int64:
+            return _aot.obv_f8i8(close, volume)
+        return _aot.obv_f8(close, volume)
+
+    def sma_kernel(x, period):
+        """AOT SMA 커널 (dtype별 시그니처 선택)"""
+        if x.dtype == np.int64:
+            return _aot.sma_i8(x, period)
+        return _aot.sma_f8(x, period)
+
+    def pct_change_kernel(x, periods):
+        """AOT 변화율 커널 (dtype별 시그니처 선택)"""
+        if x.dtype == np.int64:
+            return _aot.pct_change_i8(x, periods)
+        return _aot.pct_change_f8(x, periods)
+
+    def shifted_mean_kernel(x, window):
+        """AOT 직전 평균 커널 (dtype별 시그니처 선택)"""
+        if x.dtype == np.int64:
+            return _aot.shifted_mean_i8(x, window)
+        return _aot.shifted_mean_f8(x, window)
+
+
+def _warmup() -> None:
+    """임포트 시 커널 컴파일 (cache=True이면 디스크 캐시 로드)"""
+    dummy = np.arange(4, dtype=np.float64)
+    dummy_int = np.arange(4, dtype=np.int64)
+    ema_kernel(dummy, 0.5)
+    sma_kernel(dummy, 2)
+    sma_kernel(dummy_int, 2)
+    obv_kernel(dummy, dummy)
+    obv_kernel(dummy, dummy_int)
+    volume_ratio_kernel(dummy_int, 2)
+    pct_change_kernel(dummy, 1)
+    pct_change_kernel(dummy_int, 1)
+    accumulation_stats_kernel(dummy, dummy)
+    shifted_mean_kernel(dummy, 2)
+    shifted_mean_kernel(dummy_int, 2)
+    multi_sma_kernel(dummy, np.array([1, 2], dtype=np.int64),
+                     np.empty((2, 4), dtype=np.float64))
+
+
+if NUMBA_AVAILABLE and not AOT_AVAILABLE:
+    _warmup()
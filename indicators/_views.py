@@ -0,0 +1,123 @@
+"""
+OHLCV NumPy 뷰 캐시 모듈
+DataFrame의 가격/거래량 컬럼을 연속 배열로 한 번만 변환해 재사용
+(가격은 float64, 정수 거래량은 int64로 유지해 메모리 대역폭 절감)
+
+df.attrs는 파생 DataFrame 생성 시마다 deepcopy되므로 배열 캐시에 쓰지 않고,
+DataFrame 약한 참조 기반 모듈 캐시에 보관한다.
+
+뷰는 DataFrame 값 블록을 복사 없이 참조할 때만 캐시하고, 조회할 때마다 블록이
+그대로인지 확인한다. 값 수정 시 copy-on-write로 블록이 교체되면 뷰를 다시 만들고,
+블록을 제자리 수정한 경우에는 뷰가 같은 메모리를 보므로 그대로 유효하다.
+결측 여부는 제자리 수정을 감지할 수 없으므로 캐시하지 않는다.
+"""
+
+import weakref
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# 뷰 이름 → 소문자 컬럼명
+VIEW_COLUMNS = {
+    'open': 'open',
+    'high': 'high',
+    'low': 'low',
+    'close': 'close',
+    'vol': 'volume',
+}
+
+# id(df) → (약한 참조, 행 수, id(columns), 값 블록 배열 튜플, 뷰 딕셔너리)
+_view_cache: Dict[int, tuple] = {}
+
+
+def _block_values(df: pd.DataFrame) -> tuple:
+    """DataFrame 값 블록 배열 (copy-on-write로 블록이 교체되면 객체가 바뀜)"""
+    return tuple(blk.values for blk in df._mgr.blocks)
+
+
+def _same_blocks(cached: Optional[tuple], current: tuple) -> bool:
+    """캐시 당시 블록과 현재 블록이 같은 객체인지 확인"""
+    return (cached is not None and len(cached) == len(current)
+            and all(a is b for a, b in zip(cached, current)))
+
+
+def _build_views(df: pd.DataFrame) -> Tuple[Dict[str, np.ndarray], bool]:
+    """
+    컬럼별 연속 배열 생성 (정수 거래량은 int64, 나머지는 float64)
+
+    Returns:
+        (뷰 딕셔너리, 모든 뷰가 값 블록을 복사 없이 참조하는지 여부)
+    """
+    col_lower = {c.lower(): c for c in df.columns if isinstance(c, str)}
+    views = {}
+    shared = True
+    for name, col in VIEW_COLUMNS.items():
+        if col not in col_lower:
+            continue
+        series = df[col_lower[col]]
+        if name == 'vol' and series.dtype.kind in 'iu':
+            dtype = np.int64
+        else:
+            dtype = np.float64
+        source = series.to_numpy()
+        views[name] = np.ascontiguousarray(series.to_numpy(dtype=dtype))
+        shared = shared and np.shares_memory(views[name], source)
+    return views, shared
+
+
+def _get_entry(df: pd.DataFrame) -> tuple:
+    """캐시 엔트리 조회 (행 수/컬럼/값 블록이 바뀌었으면 재생성)"""
+    key = id(df)
+    entry = _view_cache.get(key)
+    blocks = _block_values(df)
+    if (entry is not None and entry[0]() is df
+            and entry[1] == len(df) and entry[2] == id(df.columns)
+            and _same_blocks(entry[3], blocks)):
+        return entry
+
+    views, shared = _build_views(df)
+    ref = weakref.ref(df, lambda _, key=key: _view_cache.pop(key, None))
+    # 형 변환으로 복사된 뷰는 제자리 수정을 반영하지 못하므로 매번 다시 만든다
+    entry = (ref, len(df), id(df.columns), blocks if shared else None, views)
+    _view_cache[key] = entry
+    return entry
+
+
+def get_views(df: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """
+    OHLCV 컬럼의 NumPy 뷰 반환 (캐시)
+
+    Args:
+        df: OHLCV DataFrame
+
+    Returns:
+        {'open', 'high', 'low', 'close', 'vol'} 중 존재하는 컬럼의 배열 딕셔너리
+        (읽기 전용으로 사용, 'vol'은 정수 컬럼이면 int64)
+    """
+    return _get_entry(df)[4]
+
+
+def get_clean_view(df: pd.DataFrame, name: str) -> Optional[np.ndarray]:
+    """
+    결측치가 없는 경우에만 뷰 반환 (JIT 커널 입력용)
+
+    Args:
+        df: OHLCV DataFrame
+        name: 뷰 이름 ('open', 'high', 'low', 'close', 'vol')
+
+    Returns:
+        배열 또는 None (컬럼 없음/결측치 존재)
+    """
+    arr = _get_entry(df)[4].get(name)
+    if arr is None:
+        return None
+
+    # 제자리 수정으로 결측이 생길 수 있으므로 매번 확인
+    clean = arr.dtype.kind != 'f' or not np.isnan(arr).any()
+    return arr if clean else None
+
+
+def invalidate_views(df: pd.DataFrame) -> None:
+    """DataFrame 캐시 엔트리 즉시 제거 (값 수정은 조회 시 자동 감지)"""
+    _view_cache.pop(id(df), None)
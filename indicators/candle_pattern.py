@@ -281,14 +281,27 @@ def detect_spinning_top(df: pd.DataFrame, body_ratio: float = 0.3) -> pd.Series:
     Returns:
         팽이형 여부 Boolean Series
     """
-    body_pct = calculate_candle_body_ratio(df)
-    lower_shadow = calculate_lower_shadow(df)
-    upper_shadow = calculate_upper_shadow(df)
-
-    # 양쪽 꼬리 비율이 비슷한지 확인
-    shadow_ratio = np.minimum(lower_shadow, upper_shadow) / np.maximum(lower_shadow, upper_shadow).replace(0, np.nan)
-
-    return (body_pct <= body_ratio) & (shadow_ratio >= 0.5)
+    cols = get_ohlc_columns(df)
+    open_arr = df[cols['open']].to_numpy(dtype=float)
+    high_arr = df[cols['high']].to_numpy(dtype=float)
+    low_arr = df[cols['low']].to_numpy(dtype=float)
+    close_arr = df[cols['close']].to_numpy(dtype=float)
+
+    body = np.abs(close_arr - open_arr)
+    candle_range = high_arr - low_arr
+    upper_shadow = high_arr - np.maximum(open_arr, close_arr)
+    lower_shadow = np.minimum(open_arr, close_arr) - low_arr
+
+    # 0으로 나누는 경우는 NaN 처리 (비교 시 False)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        body_pct = np.where(candle_range != 0, body / candle_range, np.nan)
+        shadow_max = np.maximum(lower_shadow, upper_shadow)
+        # 양쪽 꼬리 비율이 비슷한지 확인
+        shadow_ratio = np.where(shadow_max != 0,
+                                np.minimum(lower_shadow, upper_shadow) / shadow_max,
+                                np.nan)
+
+    return pd.Series((body_pct <= body_ratio) & (shadow_ratio >= 0.5), index=df.index)
 
 
 # =========================================================
@@ -12,6 +12,14 @@ import sys
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 from config import MAPeriod, CrossSignal
+from indicators._numba_kernels import (
+    NUMBA_AVAILABLE, KERNELS_AVAILABLE,
+    ema_kernel, sma_kernel, multi_sma_kernel, multi_sma_batch_kernel,
+)
+from indicators._views import get_clean_view
+
+# 이 길이 이하에서는 pandas rolling이 JIT 커널 호출 비용보다 유리
+SMA_KERNEL_MIN_LENGTH = 1024
 
 
 def calculate_sma(data: Union[pd.Series, pd.DataFrame], period: int,
@@ -35,6 +43,32 @@ def calculate_sma(data: Union[pd.Series, pd.DataFrame], period: int,
     else:
         series = data
 
+    return rolling_mean(series, period)
+
+
+def rolling_mean(series: pd.Series, period: int) -> pd.Series:
+    """
+    rolling(window=period, min_periods=1).mean() 계산
+
+    긴 시계열은 누적합 JIT 커널을 사용하고, 짧거나 결측치가 있으면 pandas 사용
+
+    Args:
+        series: 입력 Series
+        period: 이동평균 기간
+
+    Returns:
+        이동평균 Series
+    """
+    if KERNELS_AVAILABLE and len(series) > SMA_KERNEL_MIN_LENGTH:
+        arr = series.to_numpy()
+        if arr.dtype.kind == 'i' or (arr.dtype.kind == 'f' and not np.isnan(arr).any()):
+            if arr.dtype.kind == 'i':
+                arr = arr.astype(np.int64, copy=False)
+            else:
+                arr = arr.astype(np.float64, copy=False)
+            out = sma_kernel(np.ascontiguousarray(arr), period)
+            return pd.Series(out, index=series.index, name=series.name)
+
     return series.rolling(window=period, min_periods=1).mean()
 
 
@@ -58,7 +92,14 @@ def calculate_ema(data: Union[pd.Series, pd.DataFrame], period: int,
     else:
         series = data
 
-    return series.ewm(span=period, adjust=False).mean()
+    arr = series.to_numpy(dtype=np.float64)
+    if not KERNELS_AVAILABLE or np.isnan(arr).any():
+        # 결측치 처리는 pandas 규칙을 따름
+        return series.ewm(span=period, adjust=False).mean()
+
+    alpha = 2.0 / (period + 1)
+    out = ema_kernel(np.ascontiguousarray(arr), alpha)
+    return pd.Series(out, index=series.index, name=series.name)
 
 
 def calculate_wma(data: Union[pd.Series, pd.DataFrame], period: int,
@@ -81,11 +122,17 @@ def calculate_wma(data: Union[pd.Series, pd.DataFrame], period: int,
     else:
         series = data
 
-    weights = np.arange(1, period + 1)
-    return series.rolling(window=period).apply(
-        lambda x: np.dot(x, weights) / weights.sum(),
-        raw=True
-    )
+    arr = series.to_numpy(dtype=np.float64)
+    if arr.size == 0:
+        return pd.Series(arr, index=series.index, name=series.name)
+
+    # WMA = 고정 가중치 FIR 필터 → 단일 convolution으로 계산
+    weights = np.arange(1, period + 1, dtype=np.float64)
+    weights /= weights.sum()
+    out = np.convolve(arr, weights[::-1], mode='full')[:arr.size]
+    out[:period - 1] = np.nan
+
+    return pd.Series(out, index=series.index, name=series.name)
 
 
 def calculate_all_ma(df: pd.DataFrame, periods: List[int] = None,
@@ -104,14 +151,66 @@ def calculate_all_ma(df: pd.DataFrame, periods: List[int] = None,
     if periods is None:
         periods = MAPeriod.ALL_PERIODS
 
-    df = df.copy()
-    ma_func = calculate_ema if ma_type.lower() == 'ema' else calculate_sma
+    use_kernel = KERNELS_AVAILABLE and ma_type.lower() != 'ema' and len(periods) > 0
+    close = get_clean_view(df, 'close') if use_kernel else None
 
-    for period in periods:
-        col_name = f'ma{period}'
-        df[col_name] = ma_func(df, period)
+    if close is not None:
+        # 모든 기간을 한 번의 순회로 계산
+        out = np.empty((len(periods), close.size), dtype=np.float64)
+        multi_sma_kernel(close, np.asarray(periods, dtype=np.int64), out)
+        new_cols = {f'ma{period}': out[k] for k, period in enumerate(periods)}
+    else:
+        ma_func = calculate_ema if ma_type.lower() == 'ema' else calculate_sma
+        new_cols = {f'ma{period}': ma_func(df, period) for period in periods}
+
+    # 원본 복사 + 컬럼 추가를 한 번에 처리
+    return df.assign(**new_cols)
+
+
+def calculate_all_ma_batch(symbol_arrays: Dict[str, np.ndarray],
+                           periods: List[int] = None) -> Dict[str, Dict[int, np.ndarray]]:
+    """
+    여러 종목의 단순이동평균 일괄 계산 (종목 단위 병렬 처리)
+
+    Args:
+        symbol_arrays: {종목코드: 종가 배열} 딕셔너리
+        periods: 이동평균 기간 리스트 (기본값: 5, 10, 20, 60, 120, 240)
+
+    Returns:
+        {종목코드: {기간: SMA 배열}} 딕셔너리
+    """
+    if periods is None:
+        periods = MAPeriod.ALL_PERIODS
+
+    codes = list(symbol_arrays)
+    arrays = [np.asarray(symbol_arrays[code], dtype=np.float64) for code in codes]
+    result = {}
+
+    # 결측치가 있는 종목은 pandas 경로로 개별 계산
+    batch_idx = []
+    for i, arr in enumerate(arrays):
+        if NUMBA_AVAILABLE and not np.isnan(arr).any():
+            batch_idx.append(i)
+        else:
+            series = pd.Series(arr)
+            result[codes[i]] = {
+                p: series.rolling(window=p, min_periods=1).mean().to_numpy() for p in periods
+            }
+
+    if batch_idx:
+        lengths = np.array([arrays[i].size for i in batch_idx], dtype=np.int64)
+        mat = np.zeros((len(batch_idx), int(lengths.max(initial=0))), dtype=np.float64)
+        for row, i in enumerate(batch_idx):
+            mat[row, :lengths[row]] = arrays[i]
 
-    return df
+        out = np.empty((mat.shape[0], len(periods), mat.shape[1]), dtype=np.float64)
+        multi_sma_batch_kernel(mat, lengths, np.asarray(periods, dtype=np.int64), out)
+
+        for row, i in enumerate(batch_idx):
+            n = lengths[row]
+            result[codes[i]] = {p: out[row, k, :n] for k, p in enumerate(periods)}
+
+    return {code: result[code] for code in codes}
 
 
 def get_ma_values(df: pd.DataFrame, periods: List[int] = None) -> Dict[int, float]:
@@ -132,7 +231,7 @@ def get_ma_values(df: pd.DataFrame, periods: List[int] = None) -> Dict[int, floa
     for period in periods:
         col_name = f'ma{period}'
         if col_name in df.columns:
-            result[period] = df[col_name].iloc[-1]
+            result[period] = df[col_name].iat[-1]
 
     return result
 
@@ -151,26 +250,21 @@ def get_ma_status(price: float, ma_values: Dict[int, float]) -> str:
     if not ma_values:
         return 'UNKNOWN'
 
-    # 기간 순으로 정렬
-    sorted_periods = sorted(ma_values.keys())
-    values = [ma_values[p] for p in sorted_periods]
+    # 기간 순으로 정렬 후 인접 MA 간 차이로 배열 상태 판단
+    sorted_periods = sorted(ma_values)
+    values = np.fromiter((ma_values[p] for p in sorted_periods),
+                         dtype=np.float64, count=len(sorted_periods))
+    diffs = np.diff(values)
 
     # 정배열: 가격 > 단기MA > 장기MA
-    is_bullish = (price >= values[0]) and all(
-        values[i] >= values[i + 1] for i in range(len(values) - 1)
-    )
+    if price >= values[0] and np.all(diffs <= 0):
+        return 'BULLISH'
 
     # 역배열: 가격 < 단기MA < 장기MA
-    is_bearish = (price <= values[0]) and all(
-        values[i] <= values[i + 1] for i in range(len(values) - 1)
-    )
-
-    if is_bullish:
-        return 'BULLISH'
-    elif is_bearish:
+    if price <= values[0] and np.all(diffs >= 0):
         return 'BEARISH'
-    else:
-        return 'MIXED'
+
+    return 'MIXED'
 
 
 def detect_golden_cross(ma_short: pd.Series, ma_long: pd.Series,
@@ -228,22 +322,33 @@ def detect_all_crosses(df: pd.DataFrame,
     if pairs is None:
         pairs = CrossSignal.CROSS_PAIRS
 
-    df = df.copy()
+    valid_pairs = [
+        (short_p, long_p) for short_p, long_p in pairs
+        if f'ma{short_p}' in df.columns and f'ma{long_p}' in df.columns
+    ]
+    if not valid_pairs:
+        return df.copy()
 
-    for short_period, long_period in pairs:
-        short_col = f'ma{short_period}'
-        long_col = f'ma{long_period}'
+    # 필요한 MA 컬럼을 2차원 배열로 한 번만 추출
+    periods = sorted({p for pair in valid_pairs for p in pair})
+    col_idx = {p: i for i, p in enumerate(periods)}
+    ma_arr = df[[f'ma{p}' for p in periods]].to_numpy(dtype=np.float64)
 
-        if short_col not in df.columns or long_col not in df.columns:
-            continue
+    signals = {}
+    for short_period, long_period in valid_pairs:
+        shorts = ma_arr[:, col_idx[short_period]]
+        longs = ma_arr[:, col_idx[long_period]]
 
-        golden_col = f'golden_cross_{short_period}_{long_period}'
-        dead_col = f'dead_cross_{short_period}_{long_period}'
+        # 현재: 단기 vs 장기, 이전: shift(1) 비교 (첫 행은 False)
+        prev_below = np.zeros(shorts.size, dtype=bool)
+        prev_above = np.zeros(shorts.size, dtype=bool)
+        prev_below[1:] = shorts[:-1] <= longs[:-1]
+        prev_above[1:] = shorts[:-1] >= longs[:-1]
 
-        df[golden_col] = detect_golden_cross(df[short_col], df[long_col])
-        df[dead_col] = detect_dead_cross(df[short_col], df[long_col])
+        signals[f'golden_cross_{short_period}_{long_period}'] = (shorts > longs) & prev_below
+        signals[f'dead_cross_{short_period}_{long_period}'] = (shorts < longs) & prev_above
 
-    return df
+    return df.assign(**signals)
 
 
 def calculate_ma_divergence(price: Union[pd.Series, float],
@@ -296,7 +401,7 @@ def get_ma_support_resistance(df: pd.DataFrame, periods: List[int] = None,
 
     col_lower = {c.lower(): c for c in df.columns}
     close_col = col_lower.get('close', 'Close')
-    current_price = df[close_col].iloc[-1]
+    current_price = df[close_col].iat[-1]
 
     result = {'support': [], 'resistance': []}
 
@@ -305,7 +410,7 @@ def get_ma_support_resistance(df: pd.DataFrame, periods: List[int] = None,
         if ma_col not in df.columns:
             continue
 
-        ma_value = df[ma_col].iloc[-1]
+        ma_value = df[ma_col].iat[-1]
         diff_ratio = (current_price - ma_value) / ma_value
 
         if abs(diff_ratio) <= threshold:
@@ -340,16 +445,17 @@ def check_ma_alignment(df: pd.DataFrame, periods: List[int] = None,
     if periods is None:
         periods = [5, 20, 60]
 
-    values = []
-    for period in periods:
-        ma_col = f'ma{period}'
-        if ma_col not in df.columns:
-            return False
-        values.append(df[ma_col].iloc[-1])
+    ma_cols = [f'ma{period}' for period in periods]
+    if any(col not in df.columns for col in ma_cols):
+        return False
+
+    # 마지막 행만 컬럼별로 읽음 (전체 블록 복사 없이)
+    values = np.array([df[col].iat[-1] for col in ma_cols], dtype=np.float64)
+    diffs = np.diff(values)
 
     if ascending:
         # 정배열: 단기 > 장기 순
-        return all(values[i] > values[i + 1] for i in range(len(values) - 1))
+        return bool(np.all(diffs < 0))
     else:
         # 역배열: 단기 < 장기 순
-        return all(values[i] < values[i + 1] for i in range(len(values) - 1))
+        return bool(np.all(diffs > 0))
@@ -5,7 +5,7 @@ PDF 기준: 지지선, 저항선, 박스권, 추세선
 
 import pandas as pd
 import numpy as np
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Tuple
 from pathlib import Path
 import sys
 
@@ -14,15 +14,32 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 from config import SupportResistance
 
 
+# 마지막으로 조회한 (columns 객체, 가격 컬럼 매핑)
+_price_cols_cache: Tuple[Optional[pd.Index], Optional[Dict[str, str]]] = (None, None)
+
+
 def get_price_columns(df: pd.DataFrame) -> Dict[str, str]:
-    """DataFrame에서 가격 컬럼명 찾기"""
+    """
+    DataFrame에서 가격 컬럼명 찾기
+
+    매핑은 컬럼 구성에만 의존하므로 마지막 columns 객체와 결과를 보관하고,
+    같은 columns로 다시 호출되면 저장된 매핑을 그대로 반환한다.
+    (columns 객체 참조를 유지하므로 id 재사용으로 잘못 적중하지 않음)
+    """
+    global _price_cols_cache
+    columns, cols = _price_cols_cache
+    if columns is df.columns:
+        return cols
+
     col_lower = {c.lower(): c for c in df.columns}
-    return {
+    cols = {
         'open': col_lower.get('open', 'Open'),
         'high': col_lower.get('high', 'High'),
         'low': col_lower.get('low', 'Low'),
         'close': col_lower.get('close', 'Close'),
     }
+    _price_cols_cache = (df.columns, cols)
+    return cols
 
 
 # =========================================================
@@ -40,11 +57,11 @@ def calculate_pivot_points(df: pd.DataFrame) -> Dict[str, float]:
         피봇 포인트 딕셔너리
     """
     cols = get_price_columns(df)
-    last = df.iloc[-1]
 
-    high = last[cols['high']]
-    low = last[cols['low']]
-    close = last[cols['close']]
+    # 행 Series 생성 없이 마지막 값만 정수 위치로 조회
+    high = df[cols['high']].iat[-1]
+    low = df[cols['low']].iat[-1]
+    close = df[cols['close']].iat[-1]
 
     # 피봇 포인트
     pivot = (high + low + close) / 3
@@ -142,6 +159,9 @@ def find_support_levels(df: pd.DataFrame, lookback: int = None,
     Returns:
         지지선 가격 리스트 (높은 순)
     """
+    if num_levels <= 0:
+        return []
+
     if lookback is None:
         lookback = SupportResistance.BOX_LOOKBACK_DAYS
 
@@ -175,6 +195,9 @@ def find_resistance_levels(df: pd.DataFrame, lookback: int = None,
     Returns:
         저항선 가격 리스트 (낮은 순)
     """
+    if num_levels <= 0:
+        return []
+
     if lookback is None:
         lookback = SupportResistance.BOX_LOOKBACK_DAYS
 
@@ -207,19 +230,11 @@ def cluster_price_levels(prices: List[float], tolerance: float = 0.02) -> List[f
     if not prices:
         return []
 
-    prices = sorted(prices)
-    clusters = []
-    current_cluster = [prices[0]]
-
-    for price in prices[1:]:
-        if price <= current_cluster[-1] * (1 + tolerance):
-            current_cluster.append(price)
-        else:
-            clusters.append(np.mean(current_cluster))
-            current_cluster = [price]
+    arr = np.sort(np.asarray(prices, dtype=np.float64))
 
-    clusters.append(np.mean(current_cluster))
-    return clusters
+    # 직전 가격 대비 허용 오차를 넘는 지점에서 클러스터 분리
+    breaks = np.flatnonzero(arr[1:] > arr[:-1] * (1 + tolerance)) + 1
+    return [float(group.mean()) for group in np.split(arr, breaks)]
 
 
 # =========================================================
@@ -456,20 +471,32 @@ def get_52week_low(df: pd.DataFrame) -> float:
     return df[cols['low']].tail(lookback).min()
 
 
-def is_near_52week_high(df: pd.DataFrame, threshold: float = 0.05) -> bool:
+def _get_52week_extrema(df: pd.DataFrame) -> Tuple[float, float]:
+    """52주 최고가/최저가를 한 번에 계산 (NumPy 슬라이스)"""
+    cols = get_price_columns(df)
+    lookback = min(250, len(df))
+    high_52w = np.nanmax(df[cols['high']].to_numpy(dtype=np.float64)[-lookback:])
+    low_52w = np.nanmin(df[cols['low']].to_numpy(dtype=np.float64)[-lookback:])
+    return high_52w, low_52w
+
+
+def is_near_52week_high(df: pd.DataFrame, threshold: float = 0.05,
+                        high_52w: float = None) -> bool:
     """
     52주 신고가 근접 여부 확인
 
     Args:
         df: OHLCV DataFrame
         threshold: 근접 판단 임계값 (기본값: 5%)
+        high_52w: 미리 계산된 52주 최고가 (없으면 계산)
 
     Returns:
         근접 여부
     """
     cols = get_price_columns(df)
-    current_price = df[cols['close']].iloc[-1]
-    high_52w = get_52week_high(df)
+    current_price = df[cols['close']].iat[-1]
+    if high_52w is None:
+        high_52w = get_52week_high(df)
 
     return current_price >= high_52w * (1 - threshold)
 
@@ -477,7 +504,7 @@ def is_near_52week_high(df: pd.DataFrame, threshold: float = 0.05) -> bool:
 def is_52week_high_breakout(df: pd.DataFrame) -> bool:
     """52주 신고가 돌파 여부 확인"""
     cols = get_price_columns(df)
-    current_high = df[cols['high']].iloc[-1]
+    current_high = df[cols['high']].iat[-1]
 
     # 오늘 제외한 52주 최고가
     lookback = min(250, len(df) - 1)
@@ -502,7 +529,7 @@ def analyze_support_resistance(df: pd.DataFrame, lookback: int = None) -> Dict:
         분석 결과 딕셔너리
     """
     cols = get_price_columns(df)
-    current_price = df[cols['close']].iloc[-1]
+    current_price = df[cols['close']].iat[-1]
 
     # 지지/저항 레벨
     supports = find_support_levels(df, lookback)
@@ -514,9 +541,8 @@ def analyze_support_resistance(df: pd.DataFrame, lookback: int = None) -> Dict:
     # 박스권
     box = find_box_range(df, lookback)
 
-    # 52주 고/저
-    high_52w = get_52week_high(df)
-    low_52w = get_52week_low(df)
+    # 52주 고/저 (한 번만 계산해 근접 판단에 재사용)
+    high_52w, low_52w = _get_52week_extrema(df)
 
     return {
         'current_price': current_price,
@@ -528,5 +554,5 @@ def analyze_support_resistance(df: pd.DataFrame, lookback: int = None) -> Dict:
         'box_range': box,
         'high_52w': high_52w,
         'low_52w': low_52w,
-        'near_52w_high': is_near_52week_high(df),
+        'near_52w_high': is_near_52week_high(df, high_52w=high_52w),
     }
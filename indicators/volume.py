@@ -5,18 +5,41 @@ PDF 기준: 거래량 급등, 매집 구간, 기준봉 판단
 
 import pandas as pd
 import numpy as np
+from typing import Optional, Tuple
 from pathlib import Path
 import sys
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 from config import VolumeThreshold
+from indicators.moving_average import rolling_mean
+from indicators._numba_kernels import (
+    KERNELS_AVAILABLE, obv_kernel, shifted_mean_kernel, accumulation_stats_kernel,
+    volume_ratio_kernel, pct_change_kernel,
+)
+from indicators._views import get_clean_view
+
+
+# 마지막으로 조회한 (columns 객체, 거래량 컬럼명)
+_volume_col_cache: Tuple[Optional[pd.Index], Optional[str]] = (None, None)
 
 
 def get_volume_column(df: pd.DataFrame) -> str:
-    """DataFrame에서 거래량 컬럼명 찾기"""
+    """
+    DataFrame에서 거래량 컬럼명 찾기
+
+    마지막 columns 객체와 결과를 보관해 같은 columns로 다시 호출되면 재사용
+    (get_price_columns와 같은 방식)
+    """
+    global _volume_col_cache
+    columns, vol_col = _volume_col_cache
+    if columns is df.columns:
+        return vol_col
+
     col_lower = {c.lower(): c for c in df.columns}
-    return col_lower.get('volume', 'Volume')
+    vol_col = col_lower.get('volume', 'Volume')
+    _volume_col_cache = (df.columns, vol_col)
+    return vol_col
 
 
 def calculate_volume_ma(df: pd.DataFrame, period: int = 20) -> pd.Series:
@@ -31,7 +54,7 @@ def calculate_volume_ma(df: pd.DataFrame, period: int = 20) -> pd.Series:
         거래량 MA Series
     """
     vol_col = get_volume_column(df)
-    return df[vol_col].rolling(window=period, min_periods=1).mean()
+    return rolling_mean(df[vol_col], period)
 
 
 def calculate_volume_ratio(df: pd.DataFrame, period: int = 20) -> pd.Series:
@@ -46,6 +69,13 @@ def calculate_volume_ratio(df: pd.DataFrame, period: int = 20) -> pd.Series:
         거래량 비율 Series (배수)
     """
     vol_col = get_volume_column(df)
+
+    vol_arr = get_clean_view(df, 'vol') if KERNELS_AVAILABLE else None
+    if vol_arr is not None and vol_arr.dtype == np.int64:
+        # 정수 이동합 기반 비율 계산 (나눗셈 1회)
+        ratio = volume_ratio_kernel(vol_arr, period)
+        return pd.Series(ratio, index=df.index, name=vol_col)
+
     vol_ma = calculate_volume_ma(df, period)
     return df[vol_col] / vol_ma
 
@@ -62,6 +92,11 @@ def calculate_volume_change(df: pd.DataFrame, periods: int = 1) -> pd.Series:
         거래량 변화율 Series
     """
     vol_col = get_volume_column(df)
+
+    vol_arr = get_clean_view(df, 'vol') if KERNELS_AVAILABLE and periods > 0 else None
+    if vol_arr is not None:
+        return pd.Series(pct_change_kernel(vol_arr, periods), index=df.index, name=vol_col)
+
     return df[vol_col].pct_change(periods=periods)
 
 
@@ -128,18 +163,31 @@ def is_accumulation_phase(df: pd.DataFrame, lookback: int = 10,
     if len(df) < lookback:
         return False
 
-    recent = df.tail(lookback)
     col_lower = {c.lower(): c for c in df.columns}
     close_col = col_lower.get('close', 'Close')
     vol_col = get_volume_column(df)
 
+    close = get_clean_view(df, 'close')
+    volume = get_clean_view(df, 'vol')
+
+    if KERNELS_AVAILABLE and lookback > 0 and close is not None and volume is not None:
+        # 5개 통계를 한 번의 순회로 계산
+        close_min, close_max, close_mean, vol_mean, vol_std = accumulation_stats_kernel(
+            close[-lookback:], volume[-lookback:].astype(np.float64)
+        )
+    else:
+        recent = df.tail(lookback)
+        close_min, close_max = recent[close_col].min(), recent[close_col].max()
+        close_mean = recent[close_col].mean()
+        vol_mean, vol_std = recent[vol_col].mean(), recent[vol_col].std()
+
     # 가격 횡보 확인 (변동 범위가 작음)
-    price_range = (recent[close_col].max() - recent[close_col].min()) / recent[close_col].mean()
+    price_range = (close_max - close_min) / close_mean
     is_price_stable = price_range <= price_variance
 
     # 거래량 안정/감소 확인
-    vol_std = recent[vol_col].std() / recent[vol_col].mean()
-    is_volume_stable = vol_std <= volume_variance
+    vol_cv = vol_std / vol_mean
+    is_volume_stable = vol_cv <= volume_variance
 
     return is_price_stable and is_volume_stable
 
@@ -161,11 +209,18 @@ def detect_breakout_volume(df: pd.DataFrame, lookback: int = 10,
         threshold = VolumeThreshold.BREAKOUT_RATIO
 
     vol_col = get_volume_column(df)
+    volume = df[vol_col]
+
+    vol_arr = get_clean_view(df, 'vol')
+    if KERNELS_AVAILABLE and vol_arr is not None:
+        # 직전 lookback 기간 평균 거래량 (현재 제외)
+        prev_mean = shifted_mean_kernel(vol_arr, lookback)
+        return pd.Series(vol_arr >= prev_mean * threshold, index=df.index, name=volume.name)
 
     # lookback 기간 평균 거래량
-    rolling_mean = df[vol_col].rolling(window=lookback, min_periods=1).mean().shift(1)
+    prev_mean = volume.rolling(window=lookback, min_periods=1).mean().shift(1)
 
-    return df[vol_col] >= (rolling_mean * threshold)
+    return volume >= (prev_mean * threshold)
 
 
 def detect_climax_volume(df: pd.DataFrame, percentile: float = 95,
@@ -182,18 +237,14 @@ def detect_climax_volume(df: pd.DataFrame, percentile: float = 95,
         클라이맥스 거래량 여부 Boolean Series
     """
     vol_col = get_volume_column(df)
+    volume = df[vol_col]
 
-    def check_climax(window):
-        if len(window) < lookback:
-            return False
-        threshold = np.percentile(window[:-1], percentile)
-        return window.iloc[-1] >= threshold
-
-    result = df[vol_col].rolling(window=lookback, min_periods=lookback).apply(
-        lambda x: check_climax(x), raw=False
-    )
+    # 직전 (lookback - 1)일 거래량의 퍼센타일 (np.percentile과 동일한 선형 보간)
+    threshold = volume.shift(1).rolling(
+        window=lookback - 1, min_periods=lookback - 1
+    ).quantile(percentile / 100.0, interpolation='linear')
 
-    return result.fillna(False).astype(bool)
+    return (volume >= threshold).fillna(False).astype(bool)
 
 
 def calculate_obv(df: pd.DataFrame) -> pd.Series:
@@ -210,6 +261,11 @@ def calculate_obv(df: pd.DataFrame) -> pd.Series:
     close_col = col_lower.get('close', 'Close')
     vol_col = get_volume_column(df)
 
+    close_arr = get_clean_view(df, 'close')
+    vol_arr = get_clean_view(df, 'vol')
+    if KERNELS_AVAILABLE and close_arr is not None and vol_arr is not None:
+        return pd.Series(obv_kernel(close_arr, vol_arr), index=df.index)
+
     close = df[close_col]
     volume = df[vol_col]
 
@@ -259,15 +315,20 @@ def get_volume_profile(df: pd.DataFrame, bins: int = 20) -> pd.DataFrame:
     close_col = col_lower.get('close', 'Close')
     vol_col = get_volume_column(df)
 
-    # 가격 구간 생성
-    price_bins = pd.cut(df[close_col], bins=bins)
+    prices = df[close_col].to_numpy(dtype=np.float64)
+    volumes = df[vol_col].to_numpy(dtype=np.float64)
+
+    # 가격 결측 행 제외, 거래량 결측은 0으로 합산
+    valid = ~np.isnan(prices)
+    volumes = np.nan_to_num(volumes[valid])
 
-    # 구간별 거래량 합계
-    profile = df.groupby(price_bins)[vol_col].sum()
-    profile = profile.reset_index()
-    profile.columns = ['price_range', 'volume']
+    # 구간별 거래량 합계 (가중 히스토그램 단일 패스)
+    hist, edges = np.histogram(prices[valid], bins=bins, weights=volumes)
 
-    return profile
+    return pd.DataFrame({
+        'price_range': pd.IntervalIndex.from_breaks(edges, closed='left'),
+        'volume': hist,
+    })
 
 
 def analyze_volume_trend(df: pd.DataFrame, short_period: int = 5,
@@ -308,21 +369,18 @@ def calculate_volume_indicators(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         거래량 지표가 추가된 DataFrame
     """
-    df = df.copy()
-    vol_col = get_volume_column(df)
-
-    # 거래량 이동평균
-    df['volume_ma5'] = calculate_volume_ma(df, 5)
-    df['volume_ma20'] = calculate_volume_ma(df, 20)
-
-    # 거래량 비율
-    df['volume_ratio'] = calculate_volume_ratio(df, 20)
-
-    # 거래량 급등/감소
-    df['volume_spike'] = detect_volume_spike(df)
-    df['volume_decline'] = detect_volume_decline(df)
-
-    # OBV
-    df['obv'] = calculate_obv(df)
-
-    return df
+    volume_ratio = calculate_volume_ratio(df, 20)
+
+    # 원본 복사 + 컬럼 추가를 한 번에 처리
+    return df.assign(
+        # 거래량 이동평균
+        volume_ma5=calculate_volume_ma(df, 5),
+        volume_ma20=calculate_volume_ma(df, 20),
+        # 거래량 비율
+        volume_ratio=volume_ratio,
+        # 거래량 급등/감소 (기본 20일 비율 재사용)
+        volume_spike=volume_ratio >= VolumeThreshold.SPIKE_RATIO,
+        volume_decline=volume_ratio <= VolumeThreshold.DECLINE_RATIO,
+        # OBV
+        obv=calculate_obv(df),
+    )
@@ -12,30 +12,37 @@ PDF '주식공부.pdf' 기반 매매 전략 구현
 
 import argparse
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import List, Optional, Tuple
+
+import numpy as np
 
 # 프로젝트 루트 경로 추가
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 
 from config import (
     PROJECT_NAME,
+    DATA_COLLECTION,
 )
-from data import get_db, get_collector
+from data import get_db, get_collector, load_or_compute
 from strategies import (
     get_strategy,
 )
 from screener import (
     StockScreener,
+    UniverseFrame,
 )
 from backtest import (
     Backtester,
     MultiStrategyBacktester,
     BacktestConfig,
+    precompute_indicators,
 )
 from notification import (
-    notify_screening,
+    notify_screening_async,
     notify_backtest,
     notify_error,
 )
@@ -46,6 +53,7 @@ from utils import (
     get_today,
     date_to_str,
     measure_time,
+    normalize_ohlcv,
 )
 
 
@@ -73,6 +81,19 @@ def collect_data(markets: List[str] = None, days: int = 365):
     total_stocks = 0
     success_count = 0
 
+    def _fetch_one(code, name):
+        """일봉 데이터 조회 (작업 스레드에서 실행)"""
+        try:
+            df = collector.fetch_daily_ohlcv(
+                code,
+                start_date=date_to_str(start_date),
+                end_date=date_to_str(end_date)
+            )
+        except Exception as e:
+            log_error(f"[{code}] 데이터 수집 실패: {e}")
+            df = None
+        return code, name, df
+
     for market in markets:
         log_info(f"\n[{market}] 종목 목록 수집 중...")
 
@@ -88,26 +109,30 @@ def collect_data(markets: List[str] = None, days: int = 365):
 
         log_info(f"[{market}] {len(stocks)}개 종목 발견")
 
-        # 종목별 데이터 수집
-        for _, row in stocks.iterrows():
-            code = row.get('Code') or row.get('code')
-            name = row.get('Name') or row.get('name')
-
-            if not code:
-                continue
-
-            total_stocks += 1
-
-            try:
-                # 일봉 데이터 수집
-                df = collector.fetch_daily_ohlcv(
-                    code,
-                    start_date=date_to_str(start_date),
-                    end_date=date_to_str(end_date)
-                )
-
-                if df is not None and not df.empty:
-                    # DB에 저장
+        # 종목 목록 정리 (행 단위 순회 대신 컬럼 배열을 한 번에 추출)
+        code_col = 'Code' if 'Code' in stocks.columns else 'code'
+        name_col = 'Name' if 'Name' in stocks.columns else 'name'
+        all_codes = stocks[code_col].to_numpy()
+        all_names = stocks[name_col].to_numpy()
+
+        codes, names = [], []
+        for code, name in zip(all_codes, all_names):
+            if isinstance(code, str) and code:
+                codes.append(code)
+                names.append(name)
+
+        total_stocks += len(codes)
+
+        # 네트워크 대기 시간이 대부분이므로 병렬 조회, DB 저장은 메인 스레드에서만 수행
+        # 시장 단위로 한 트랜잭션에 묶어 종목마다 커밋하지 않음
+        with ThreadPoolExecutor(max_workers=DATA_COLLECTION['max_workers']) as executor, \
+                db.transaction():
+            for code, name, df in executor.map(_fetch_one, codes, names):
+                if df is None or df.empty:
+                    continue
+
+                try:
+                    # DB에 저장 (실패한 종목만 되돌림)
                     db.insert_stock(code, name, market)
                     db.insert_daily_ohlcv_df(code, df)
                     success_count += 1
@@ -115,8 +140,8 @@ def collect_data(markets: List[str] = None, days: int = 365):
                     if success_count % 100 == 0:
                         log_info(f"진행: {success_count}/{total_stocks}")
 
-            except Exception as e:
-                log_error(f"[{code}] 데이터 수집 실패: {e}")
+                except Exception as e:
+                    log_error(f"[{code}] 데이터 저장 실패: {e}")
 
     log_info("")
     log_info("=" * 60)
@@ -124,6 +149,43 @@ def collect_data(markets: List[str] = None, days: int = 365):
     log_info("=" * 60)
 
 
+@lru_cache(maxsize=8)
+def _get_screener(strategy_names: Optional[Tuple[str, ...]],
+                  preset: str) -> StockScreener:
+    """
+    스크리너 생성 (같은 전략/프리셋 조합은 프로세스 내에서 재사용)
+
+    Args:
+        strategy_names: 전략 이름 튜플 (None이면 전체)
+        preset: 필터 프리셋
+
+    Returns:
+        설정된 StockScreener (screen_stocks 호출 시 결과 초기화)
+    """
+    screener = StockScreener(strategies=list(strategy_names) if strategy_names else None)
+    screener.set_filter_preset(preset)
+    return screener
+
+
+@lru_cache(maxsize=8)
+def _get_backtester(strategy_name: str,
+                    initial_capital: float) -> Optional[Backtester]:
+    """단일 전략 백테스터 생성 (run 호출 시 상태 초기화되므로 재사용 가능)"""
+    strategy = get_strategy(strategy_name)
+    if not strategy:
+        return None
+    return Backtester(strategy, BacktestConfig(initial_capital=initial_capital))
+
+
+@lru_cache(maxsize=8)
+def _get_multi_backtester(strategy_names: Tuple[str, ...],
+                          initial_capital: float) -> MultiStrategyBacktester:
+    """다중 전략 백테스터 생성 (재사용)"""
+    return MultiStrategyBacktester(
+        list(strategy_names), BacktestConfig(initial_capital=initial_capital)
+    )
+
+
 @measure_time
 def run_screen(strategy_names: List[str] = None, preset: str = 'default',
                notify: bool = True):
@@ -140,7 +202,6 @@ def run_screen(strategy_names: List[str] = None, preset: str = 'default',
     log_info("=" * 60)
 
     db = get_db()
-    collector = get_collector()
 
     # 종목 목록 조회
     stocks = db.get_all_active_stocks()
@@ -150,28 +211,22 @@ def run_screen(strategy_names: List[str] = None, preset: str = 'default',
 
     log_info(f"총 {len(stocks)}개 종목 대상")
 
-    # 종목별 데이터 로드
-    stock_data = {}
-    for stock in stocks:
-        code = stock['code']
-        name = stock['name']
-
-        df = db.get_daily_ohlcv(code, limit=252)  # 최근 1년
+    # 전 종목 데이터 일괄 로드 (최근 1년)
+    name_map = {stock['code']: stock['name'] for stock in stocks}
+    ohlcv = db.get_daily_ohlcv_bulk(list(name_map), limit_days=365)
 
-        if df is not None and len(df) >= 20:
-            stock_data[code] = {
-                'df': df,
-                'name': name,
-            }
+    # 20일 이상 데이터가 있는 종목을 패널로 바로 적재
+    # 종목별 DataFrame(캐시 지표 MA, 거래량 비율, 52주 고저가 병합)은 사전 필터 통과 종목만 생성
+    universe = UniverseFrame.from_ohlcv(ohlcv, name_map, min_rows=20,
+                                        transform=load_or_compute)
 
-    log_info(f"유효 데이터: {len(stock_data)}개 종목")
+    log_info(f"유효 데이터: {len(universe)}개 종목")
 
     # 스크리너 생성
-    screener = StockScreener(strategies=strategy_names)
-    screener.set_filter_preset(preset)
+    screener = _get_screener(tuple(strategy_names) if strategy_names else None, preset)
 
     # 스크리닝 실행
-    results = screener.screen_stocks(stock_data)
+    results = screener.screen_stocks(universe)
 
     # 결과 출력
     print("\n" + screener.generate_report())
@@ -181,9 +236,9 @@ def run_screen(strategy_names: List[str] = None, preset: str = 'default',
         if result.signal:
             db.save_signal(result.signal)
 
-    # 텔레그램 알림
+    # 텔레그램 알림 (전송은 백그라운드에서 진행, 종료 시 완료 대기)
     if notify and results:
-        notify_screening(results)
+        notify_screening_async(results)
 
     log_info(f"\n스크리닝 완료: {len(results)}개 종목 발견")
 
@@ -219,27 +274,30 @@ def run_backtesting(strategy_name: str = None, days: int = 365,
     end_date = get_today()
     start_date = end_date - timedelta(days=days)
 
-    stock_data = {}
-    for stock in stocks[:100]:  # 상위 100개만 (속도)
-        code = stock['code']
-        df = db.get_daily_ohlcv(code, limit=days + 60)
+    # 상위 100개만 (속도), 지표 계산용 60거래일(약 90일) 여유 포함 일괄 로드
+    codes = [stock['code'] for stock in stocks[:100]]
+    ohlcv = db.get_daily_ohlcv_bulk(codes, limit_days=days + 90, end_date=end_date)
+
+    sizes = ohlcv.groupby('code', sort=False).size()
+    eligible = ohlcv[ohlcv['code'].isin(sizes.index[sizes >= 60])]
 
-        if df is not None and len(df) >= 60:
-            stock_data[code] = df
+    stock_data = {
+        code: df.drop(columns='code')
+        for code, df in eligible.groupby('code', sort=False)
+    }
 
     log_info(f"백테스트 대상: {len(stock_data)}개 종목")
 
-    # 백테스트 설정
-    config = BacktestConfig(initial_capital=initial_capital)
+    # 전략이 읽는 ma60을 전 종목 패널로 한 번에 계산 (전략별 일별 재계산 방지)
+    stock_data = precompute_indicators(stock_data)
 
     if strategy_name:
         # 단일 전략 백테스트
-        strategy = get_strategy(strategy_name)
-        if not strategy:
+        bt = _get_backtester(strategy_name, initial_capital)
+        if not bt:
             log_error(f"전략을 찾을 수 없음: {strategy_name}")
             return
 
-        bt = Backtester(strategy, config)
         metrics = bt.run(stock_data, start_date, end_date)
 
         print("\n" + bt.generate_report())
@@ -249,8 +307,8 @@ def run_backtesting(strategy_name: str = None, days: int = 365,
 
     else:
         # 다중 전략 백테스트
-        strategies = ['limit_up', 'breakout', 'minute15', 'minute30']
-        multi_bt = MultiStrategyBacktester(strategies, config)
+        strategies = ('limit_up', 'breakout', 'minute15', 'minute30')
+        multi_bt = _get_multi_backtester(strategies, initial_capital)
 
         results = multi_bt.run(stock_data, start_date, end_date)
 
@@ -274,7 +332,6 @@ def analyze_stock(code: str, strategies: List[str] = None):
     log_info("=" * 60)
 
     db = get_db()
-    collector = get_collector()
 
     # 종목 정보
     stock = db.get_stock(code)
@@ -290,12 +347,15 @@ def analyze_stock(code: str, strategies: List[str] = None):
     if df is None or df.empty:
         # DB에 없으면 실시간 수집
         log_info("데이터 실시간 수집 중...")
-        df = collector.fetch_daily_ohlcv(code)
+        df = get_collector().fetch_daily_ohlcv(code)
 
         if df is None or df.empty:
             log_error(f"종목 데이터를 가져올 수 없습니다: {code}")
             return
 
+        # DB 조회 결과와 동일하게 소문자 컬럼명으로 통일
+        normalize_ohlcv(df)
+
     log_info(f"데이터: {len(df)}일")
 
     # 전략 적용
@@ -326,20 +386,14 @@ def analyze_stock(code: str, strategies: List[str] = None):
     print("\n[기술적 지표]")
     print("-" * 40)
 
-    from indicators import (
-        calculate_all_ma,
-        get_ma_status,
-        get_ma_values,
-        calculate_volume_ratio,
-    )
+    from indicators import get_ma_status
 
-    # 이동평균
-    df_ma = calculate_all_ma(df)
-    ma_values = get_ma_values(df_ma, [5, 20, 60])
+    # 마지막 값만 필요하므로 최근 구간 평균만 계산
+    close_arr = df['close'].to_numpy(dtype=np.float64)[-60:]
+    current_price = close_arr[-1]
 
-    col_lower = {c.lower(): c for c in df.columns}
-    close_col = col_lower.get('close', 'Close')
-    current_price = df[close_col].iloc[-1]
+    # 이동평균
+    ma_values = {n: float(np.nanmean(close_arr[-n:])) for n in (5, 20, 60)}
 
     ma_status = get_ma_status(current_price, ma_values)
     print(f"이동평균 상태: {ma_status}")
@@ -348,9 +402,10 @@ def analyze_stock(code: str, strategies: List[str] = None):
         diff = (current_price - value) / value * 100
         print(f"  MA{period}: {value:,.0f}원 (이격도: {diff:+.1f}%)")
 
-    # 거래량
-    vol_ratio = calculate_volume_ratio(df)
-    print(f"\n거래량 비율: {vol_ratio.iloc[-1]:.2f}x (20일 평균 대비)")
+    # 거래량 (현재 거래량 / 20일 평균)
+    vol_arr = df['volume'].to_numpy(dtype=np.float64)[-20:]
+    vol_ratio = vol_arr[-1] / np.nanmean(vol_arr)
+    print(f"\n거래량 비율: {vol_ratio:.2f}x (20일 평균 대비)")
 
 
 def main():
@@ -10,9 +10,11 @@ from .telegram_bot import (
     notify_signal,
     notify_signals,
     notify_screening,
+    notify_screening_async,
     notify_backtest,
     notify_error,
     notify_message,
+    wait_pending_notifications,
 )
 
 __all__ = [
@@ -22,7 +24,9 @@ __all__ = [
     'notify_signal',
     'notify_signals',
     'notify_screening',
+    'notify_screening_async',
     'notify_backtest',
     'notify_error',
     'notify_message',
+    'wait_pending_notifications',
 ]
@@ -4,9 +4,14 @@
 """
 
 import asyncio
+import atexit
+import threading
 import aiohttp
+from concurrent.futures import Future, wait
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from itertools import chain, groupby
+from operator import attrgetter
+from typing import List, Dict, Any, Optional, Set
 from dataclasses import dataclass
 from pathlib import Path
 import sys
@@ -39,6 +44,33 @@ class TelegramNotifier:
 
     BASE_URL = "https://api.telegram.org/bot{token}/{method}"
 
+    # 텔레그램 메시지 최대 길이
+    MAX_MESSAGE_LENGTH = 4096
+
+    # HTTP 연결 설정 (묶음 전송 시 DNS 조회/TLS 핸드셰이크 재사용)
+    HTTP_POOL_LIMIT = 5
+    HTTP_DNS_CACHE_TTL = 300
+    HTTP_KEEPALIVE_TIMEOUT = 60
+    HTTP_TIMEOUT = 10
+
+    # 묶음 전송 시 신호 구분선
+    SIGNAL_SEPARATOR = "\n──────────\n"
+
+    # 신호 메시지 템플릿 (매수/매도 헤더만 다름)
+    _SIGNAL_BODY = "\n".join([
+        "",
+        "📌 <b>종목:</b> [{code}] {name}",
+        "📊 <b>전략:</b> {strategy}",
+        "💰 <b>진입가:</b> {price:,.0f}원",
+        "🛑 <b>손절가:</b> {stop_loss:,.0f}원 ({stop_pct:.1f}%)",
+        "🎯 <b>목표가:</b> {take_profit:,.0f}원 ({take_pct:.1f}%)",
+        "📝 <b>사유:</b> {reason}",
+        "⏰ <b>시간:</b> {time}",
+        "💪 <b>강도:</b> {strength:.2f}",
+    ])
+    _SIGNAL_TEMPLATE_BUY = "🔵 <b>매수 신호</b>\n" + _SIGNAL_BODY
+    _SIGNAL_TEMPLATE_SELL = "🔴 <b>매도 신호</b>\n" + _SIGNAL_BODY
+
     def __init__(self, config: TelegramConfig = None):
         """
         Args:
@@ -61,9 +93,18 @@ class TelegramNotifier:
         return bool(self.config.bot_token and self.config.chat_id)
 
     async def _get_session(self) -> aiohttp.ClientSession:
-        """HTTP 세션 반환"""
+        """HTTP 세션 반환 (연결 풀 유지, 이벤트 루프가 살아있는 동안 재사용)"""
         if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession()
+            connector = aiohttp.TCPConnector(
+                limit=self.HTTP_POOL_LIMIT,
+                ttl_dns_cache=self.HTTP_DNS_CACHE_TTL,
+                keepalive_timeout=self.HTTP_KEEPALIVE_TIMEOUT,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.HTTP_TIMEOUT),
+                headers={'Accept-Encoding': 'gzip'},
+            )
         return self._session
 
     async def close(self):
@@ -130,10 +171,31 @@ class TelegramNotifier:
 
     def send_message_sync(self, text: str, **kwargs) -> bool:
         """동기 메시지 전송"""
-        return asyncio.run(self.send_message(text, **kwargs))
+        return _run_sync(self.send_message(text, **kwargs))
 
     # ============ 신호 알림 ============
 
+    @classmethod
+    def _format_signal(cls, signal: Signal) -> str:
+        """매매 신호 메시지 본문 생성"""
+        is_buy = signal.signal_type.value == 'BUY'
+        template = cls._SIGNAL_TEMPLATE_BUY if is_buy else cls._SIGNAL_TEMPLATE_SELL
+        price = signal.price
+
+        return template.format(
+            code=signal.code,
+            name=signal.name,
+            strategy=signal.strategy,
+            price=price,
+            stop_loss=signal.stop_loss,
+            stop_pct=(signal.stop_loss - price) / price * 100,
+            take_profit=signal.take_profit,
+            take_pct=(signal.take_profit - price) / price * 100,
+            reason=signal.reason,
+            time=signal.datetime.strftime('%Y-%m-%d %H:%M'),
+            strength=signal.strength,
+        )
+
     async def send_signal(self, signal: Signal) -> bool:
         """
         매매 신호 전송
@@ -141,22 +203,7 @@ class TelegramNotifier:
         Args:
             signal: Signal 객체
         """
-        emoji = "🔵" if signal.signal_type.value == 'BUY' else "🔴"
-        signal_type = "매수" if signal.signal_type.value == 'BUY' else "매도"
-
-        message = f"""
-{emoji} <b>{signal_type} 신호</b>
-
-📌 <b>종목:</b> [{signal.code}] {signal.name}
-📊 <b>전략:</b> {signal.strategy}
-💰 <b>진입가:</b> {signal.price:,.0f}원
-🛑 <b>손절가:</b> {signal.stop_loss:,.0f}원 ({(signal.stop_loss - signal.price) / signal.price * 100:.1f}%)
-🎯 <b>목표가:</b> {signal.take_profit:,.0f}원 ({(signal.take_profit - signal.price) / signal.price * 100:.1f}%)
-📝 <b>사유:</b> {signal.reason}
-⏰ <b>시간:</b> {signal.datetime.strftime('%Y-%m-%d %H:%M')}
-💪 <b>강도:</b> {signal.strength:.2f}
-"""
-        return await self.send_message(message.strip())
+        return await self.send_message(self._format_signal(signal))
 
     async def send_signals(self, signals: List[Signal]) -> int:
         """
@@ -172,6 +219,38 @@ class TelegramNotifier:
                 await asyncio.sleep(0.5)  # 속도 제한
         return success_count
 
+    async def send_signals_batched(self, signals: List[Signal],
+                                   max_per_message: int = 20) -> int:
+        """
+        여러 신호를 묶어서 전송 (메시지 길이 제한 내에서 최대 max_per_message개씩)
+
+        Args:
+            signals: Signal 리스트
+            max_per_message: 메시지 하나에 담을 최대 신호 수
+
+        Returns:
+            성공 전송된 신호 수
+        """
+        # 신호 수/메시지 길이 제한에 맞춰 묶음 구성
+        chunks: List[List[str]] = []
+        length = 0
+        for signal in signals:
+            block = self._format_signal(signal)
+            if (not chunks or len(chunks[-1]) >= max_per_message
+                    or length + len(self.SIGNAL_SEPARATOR) + len(block) > self.MAX_MESSAGE_LENGTH):
+                chunks.append([])
+                length = -len(self.SIGNAL_SEPARATOR)
+            chunks[-1].append(block)
+            length += len(self.SIGNAL_SEPARATOR) + len(block)
+
+        success_count = 0
+        for i, chunk in enumerate(chunks):
+            if i > 0:
+                await asyncio.sleep(0.5)  # 속도 제한
+            if await self.send_message(self.SIGNAL_SEPARATOR.join(chunk)):
+                success_count += len(chunk)
+        return success_count
+
     # ============ 스크리닝 알림 ============
 
     async def send_screening_result(self, result: ScreeningResult) -> bool:
@@ -193,36 +272,33 @@ class TelegramNotifier:
         if not results:
             return await self.send_message("📊 스크리닝 결과: 조건 충족 종목 없음")
 
-        # 전략별 분류
-        by_strategy = {}
-        for r in results:
-            if r.strategy not in by_strategy:
-                by_strategy[r.strategy] = []
-            by_strategy[r.strategy].append(r)
-
-        message_lines = [
+        header = (
             "📊 <b>스크리닝 결과</b>",
             f"⏰ {datetime.now().strftime('%Y-%m-%d %H:%M')}",
             f"총 {len(results)}개 종목 발견",
             "",
-        ]
+        )
+        message = "\n".join(chain(header, self._screening_lines(results, max_items)))
+
+        return await self.send_message(message)
 
-        for strategy, items in by_strategy.items():
-            message_lines.append(f"<b>▶ {strategy}</b>")
+    @staticmethod
+    def _screening_lines(results: List[ScreeningResult], max_items: int):
+        """전략별 스크리닝 결과 줄 생성 (전략명 순, 전략 내 순서는 유지)"""
+        by_strategy = attrgetter('strategy')
+
+        for strategy, group in groupby(sorted(results, key=by_strategy), key=by_strategy):
+            items = list(group)
+            yield f"<b>▶ {strategy}</b>"
 
             for r in items[:max_items]:
                 if r.signal:
-                    price = r.signal.price
-                    message_lines.append(
-                        f"  • [{r.code}] {r.name}: {price:,.0f}원"
-                    )
+                    yield f"  • [{r.code}] {r.name}: {r.signal.price:,.0f}원"
 
             if len(items) > max_items:
-                message_lines.append(f"  ... 외 {len(items) - max_items}개")
+                yield f"  ... 외 {len(items) - max_items}개"
 
-            message_lines.append("")
-
-        return await self.send_message("\n".join(message_lines))
+            yield ""
 
     # ============ 백테스트 알림 ============
 
@@ -300,6 +376,65 @@ class TelegramNotifier:
 # 싱글톤 인스턴스
 _notifier: Optional[TelegramNotifier] = None
 
+# 백그라운드 이벤트 루프 (호출마다 새 루프/세션을 만들지 않고 연결 재사용)
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
+# 완료되지 않은 비동기 알림 (종료 시 대기)
+_pending: Set[Future] = set()
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """알림 전용 이벤트 루프 반환 (최초 호출 시 데몬 스레드에서 시작)"""
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_loop.run_forever, name='telegram-loop', daemon=True
+            ).start()
+            atexit.register(_shutdown_loop)
+    return _loop
+
+
+def _run_sync(coro):
+    """코루틴을 알림 루프에서 실행하고 결과 대기"""
+    return asyncio.run_coroutine_threadsafe(coro, _get_loop()).result()
+
+
+def _submit(coro) -> Future:
+    """코루틴을 알림 루프에 예약하고 바로 반환 (fire-and-forget)"""
+    future = asyncio.run_coroutine_threadsafe(coro, _get_loop())
+    _pending.add(future)
+    future.add_done_callback(_pending.discard)
+    return future
+
+
+def wait_pending_notifications(timeout: float = 5) -> None:
+    """
+    예약된 비동기 알림 전송 완료 대기
+
+    Args:
+        timeout: 최대 대기 시간 (초)
+    """
+    if _pending:
+        wait(list(_pending), timeout=timeout)
+
+
+def _shutdown_loop() -> None:
+    """종료 시 남은 알림 전송 대기, HTTP 세션 정리 후 루프 정지"""
+    if _loop is None or not _loop.is_running():
+        return
+
+    wait_pending_notifications()
+
+    if _notifier is not None:
+        try:
+            asyncio.run_coroutine_threadsafe(_notifier.close(), _loop).result(timeout=5)
+        except Exception:
+            pass
+    _loop.call_soon_threadsafe(_loop.stop)
+
 
 def get_notifier() -> TelegramNotifier:
     """텔레그램 알림 인스턴스 반환"""
@@ -309,39 +444,74 @@ def get_notifier() -> TelegramNotifier:
     return _notifier
 
 
+def _enabled() -> bool:
+    """알림 전송 가능 여부 (비활성/미설정이면 이벤트 루프를 거치지 않음)"""
+    notifier = get_notifier()
+    return notifier.config.enabled and notifier.is_configured
+
+
 # 편의 함수들
 def notify_signal(signal: Signal) -> bool:
     """신호 알림 (동기)"""
+    if not _enabled():
+        return False
+
     notifier = get_notifier()
-    return asyncio.run(notifier.send_signal(signal))
+    return _run_sync(notifier.send_signal(signal))
 
 
 def notify_signals(signals: List[Signal]) -> int:
     """여러 신호 알림 (동기)"""
+    if not _enabled():
+        return 0
+
     notifier = get_notifier()
-    return asyncio.run(notifier.send_signals(signals))
+    return _run_sync(notifier.send_signals_batched(signals))
 
 
 def notify_screening(results: List[ScreeningResult]) -> bool:
     """스크리닝 결과 알림 (동기)"""
+    if not _enabled():
+        return False
+
     notifier = get_notifier()
-    return asyncio.run(notifier.send_screening_summary(results))
+    return _run_sync(notifier.send_screening_summary(results))
+
+
+def notify_screening_async(results: List[ScreeningResult]) -> Future:
+    """스크리닝 결과 알림 (비동기, 전송 완료를 기다리지 않음)"""
+    if not _enabled():
+        future = Future()
+        future.set_result(False)
+        return future
+
+    notifier = get_notifier()
+    return _submit(notifier.send_screening_summary(results))
 
 
 def notify_backtest(metrics: PerformanceMetrics,
                     strategy_name: str = "") -> bool:
     """백테스트 결과 알림 (동기)"""
+    if not _enabled():
+        return False
+
     notifier = get_notifier()
-    return asyncio.run(notifier.send_backtest_result(metrics, strategy_name))
+    return _run_sync(notifier.send_backtest_result(metrics, strategy_name))
 
 
 def notify_error(error_message: str) -> bool:
     """오류 알림 (동기)"""
+    if not _enabled():
+        return False
+
     notifier = get_notifier()
-    return asyncio.run(notifier.send_error_alert(error_message))
+    return _run_sync(notifier.send_error_alert(error_message))
 
 
 def notify_message(text: str) -> bool:
     """일반 메시지 알림 (동기)"""
+    if not _enabled():
+        return False
+
     notifier = get_notifier()
     return notifier.send_message_sync(text)
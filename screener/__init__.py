@@ -20,6 +20,15 @@ from .filters import (
     filter_near_52week_low,
     filter_long_candle,
     filter_bullish_candle,
+    build_panels,
+    panel_lookback,
+    compile_filters,
+    apply_vectorized_filters,
+)
+
+from .universe import (
+    DEFAULT_UNIVERSE_DAYS,
+    UniverseFrame,
 )
 
 from .screener import (
@@ -48,6 +57,13 @@ __all__ = [
     'filter_near_52week_low',
     'filter_long_candle',
     'filter_bullish_candle',
+    'build_panels',
+    'panel_lookback',
+    'compile_filters',
+    'apply_vectorized_filters',
+    # Universe
+    'DEFAULT_UNIVERSE_DAYS',
+    'UniverseFrame',
     # Screener
     'ScreeningResult',
     'StockScreener',
@@ -0,0 +1,219 @@
+"""
+스크리닝 필터 통합 커널 모듈
+여러 필터를 전 종목 패널에 대해 한 번의 병렬 루프로 평가
+
+종목(행)별로 prange 병렬 처리하며 각 필터는 vec_filter_*와 같은 판정을 한다.
+numba가 없으면 호출 측(compile_filters)이 NumPy 벡터화 필터를 사용한다.
+"""
+
+import numpy as np
+
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from indicators._numba_kernels import NUMBA_AVAILABLE, njit, prange
+
+# 필터 연산 코드 (params 행: 연산별 인자)
+OP_MIN_VOLUME = 0       # [min_volume, days]
+OP_PRICE_RANGE = 1      # [min_price, max_price]
+OP_PRICE_ABOVE_MA = 2   # [period]
+OP_VOLUME_SPIKE = 3     # [spike_ratio, lookback]
+OP_MA_ALIGNMENT = 4     # [ascending, 기간 수, 기간1, 기간2, ...]
+OP_BOX_RANGE = 5        # [lookback, variance]
+OP_VOLUME_INCREASE = 6  # [increase_days]
+
+
+@njit(cache=True)
+def _slice_start(width, index):
+    """파이썬 슬라이스 시작 인덱스 정규화 (values[index:])"""
+    if index < 0:
+        index += width
+    return min(max(index, 0), width)
+
+
+@njit(cache=True)
+def _nanmean_row(values, i, start, end):
+    """행 구간 결측 제외 평균 (값이 없으면 NaN)"""
+    total = 0.0
+    count = 0
+    for j in range(start, end):
+        v = values[i, j]
+        if not np.isnan(v):
+            total += v
+            count += 1
+    return total / count if count > 0 else np.nan
+
+
+@njit(cache=True)
+def _last_ma_row(close, lengths, i, period):
+    """행 마지막 이동평균 (기간 미달/결측 포함 시 NaN)"""
+    width = close.shape[1]
+    if period <= 0 or period > width or lengths[i] < period:
+        return np.nan
+    total = 0.0
+    for j in range(width - period, width):
+        total += close[i, j]
+    return total / period
+
+
+@njit(cache=True)
+def _box_width_row(high, low, i, start, end):
+    """행 구간 (최고 고가 - 최저 저가) / 최저 저가를 한 번의 순회로 계산 (결측 제외)"""
+    hi = np.nan
+    lo = np.nan
+    for j in range(start, end):
+        h = high[i, j]
+        lw = low[i, j]
+        if not np.isnan(h) and (np.isnan(hi) or h > hi):
+            hi = h
+        if not np.isnan(lw) and (np.isnan(lo) or lw < lo):
+            lo = lw
+    if lo == 0:
+        return np.nan
+    return (hi - lo) / lo
+
+
+@njit(cache=True, parallel=True, nogil=True)
+def screen_kernel(close, volume, high, low, lengths, ops, params):
+    """
+    필터 프로그램을 전 종목에 적용
+
+    Args:
+        close: 종가 패널 (종목 수, 기간), 우측 정렬/앞부분 NaN
+        volume: 거래량 패널 (같은 형태)
+        high: 고가 패널 (같은 형태)
+        low: 저가 패널 (같은 형태)
+        lengths: 종목별 실제 행 수
+        ops: 필터 연산 코드 배열
+        params: 필터별 인자 (필터 수, 인자 폭)
+
+    Returns:
+        (종목 수, 필터 수) 통과 여부 배열
+    """
+    n, width = close.shape
+    n_ops = ops.size
+    out = np.zeros((n, n_ops), dtype=np.bool_)
+
+    for i in prange(n):
+        last_close = close[i, width - 1]
+        for k in range(n_ops):
+            op = ops[k]
+            p = params[k]
+
+            if op == OP_MIN_VOLUME:
+                start = _slice_start(width, -int(p[1]))
+                out[i, k] = _nanmean_row(volume, i, start, width) >= p[0]
+
+            elif op == OP_PRICE_RANGE:
+                out[i, k] = p[0] <= last_close <= p[1]
+
+            elif op == OP_PRICE_ABOVE_MA:
+                out[i, k] = last_close > _last_ma_row(close, lengths, i, int(p[0]))
+
+            elif op == OP_VOLUME_SPIKE:
+                start = _slice_start(width, -int(p[1]))
+                avg_vol = _nanmean_row(volume, i, start, width - 1)
+                out[i, k] = avg_vol != 0 and volume[i, width - 1] / avg_vol >= p[0]
+
+            elif op == OP_MA_ALIGNMENT:
+                ascending = p[0] != 0
+                count = int(p[1])
+                passed = True
+                prev = np.nan
+                for m in range(count):
+                    # 단일 종목 필터와 같이 반올림한 MA로 비교 (rint = 짝수 반올림)
+                    ma = np.rint(_last_ma_row(close, lengths, i, int(p[2 + m])))
+                    if np.isnan(ma):
+                        passed = False
+                        break
+                    if m > 0 and not (prev > ma if ascending else prev < ma):
+                        passed = False
+                        break
+                    prev = ma
+                out[i, k] = passed
+
+            elif op == OP_BOX_RANGE:
+                lookback = int(p[0])
+                start = _slice_start(width, -lookback)
+                out[i, k] = (lengths[i] >= lookback
+                             and _box_width_row(high, low, i, start, width) <= p[1])
+
+            elif op == OP_VOLUME_INCREASE:
+                # 마지막 increase_days일 연속 증가 (뒤에서부터 첫 감소/보합에서 중단)
+                days = int(p[0])
+                passed = lengths[i] >= days + 1
+                j = width - 1
+                while passed and j > width - 1 - days:
+                    passed = volume[i, j] > volume[i, j - 1]
+                    j -= 1
+                out[i, k] = passed
+
+    return out
+
+
+def compile_program(ops: list, params: list) -> tuple:
+    """
+    필터 프로그램을 커널 입력 배열로 변환 (같은 필터 구성이면 재사용 가능)
+
+    Args:
+        ops: 필터 연산 코드 리스트
+        params: 필터별 인자 리스트
+
+    Returns:
+        (연산 코드 배열, 인자 배열)
+    """
+    width = max(len(p) for p in params)
+    packed = np.zeros((len(params), width), dtype=np.float64)
+    for k, p in enumerate(params):
+        packed[k, :len(p)] = p
+    return np.asarray(ops, dtype=np.int64), packed
+
+
+def run_program(program: tuple, panels: dict) -> np.ndarray:
+    """
+    compile_program() 결과로 통합 커널 실행
+
+    Args:
+        program: (연산 코드 배열, 인자 배열)
+        panels: build_panels() 결과
+
+    Returns:
+        (종목 수, 필터 수) 통과 여부 배열
+    """
+    ops, packed = program
+    # 패널(Fortran order)을 복사 없이 전달 (행 우선 변환 비용이 커널 실행보다 큼)
+    return screen_kernel(panels['close'], panels['volume'], panels['high'], panels['low'],
+                         panels['length'], ops, packed)
+
+
+def fused_filter_mask(ops: list, params: list, panels: dict) -> np.ndarray:
+    """
+    통합 커널 실행
+
+    Args:
+        ops: 필터 연산 코드 리스트
+        params: 필터별 인자 리스트
+        panels: build_panels() 결과
+
+    Returns:
+        (종목 수, 필터 수) 통과 여부 배열
+    """
+    return run_program(compile_program(ops, params), panels)
+
+
+__all__ = [
+    'NUMBA_AVAILABLE',
+    'OP_MIN_VOLUME',
+    'OP_PRICE_RANGE',
+    'OP_PRICE_ABOVE_MA',
+    'OP_VOLUME_SPIKE',
+    'OP_MA_ALIGNMENT',
+    'OP_BOX_RANGE',
+    'OP_VOLUME_INCREASE',
+    'screen_kernel',
+    'compile_program',
+    'run_program',
+    'fused_filter_mask',
+]
@@ -3,6 +3,8 @@
 PDF 기준: 거래량, 시가총액, 이동평균 등 기본 필터
 """
 
+import warnings
+import numpy as np
 import pandas as pd
 from typing import List, Dict, Any, Optional, Callable
 from dataclasses import dataclass, field
@@ -11,6 +13,23 @@ import sys
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
+from indicators._views import get_views
+from screener._filter_kernel import (
+    NUMBA_AVAILABLE,
+    OP_MIN_VOLUME,
+    OP_PRICE_RANGE,
+    OP_PRICE_ABOVE_MA,
+    OP_VOLUME_SPIKE,
+    OP_MA_ALIGNMENT,
+    OP_BOX_RANGE,
+    OP_VOLUME_INCREASE,
+    compile_program,
+    run_program,
+)
+
+# 52주 거래일 수
+WEEKS_52_DAYS = 252
+
 
 @dataclass
 class FilterResult:
@@ -32,45 +51,128 @@ class StockFilter:
     filter_func: Callable
     params: Dict[str, Any] = field(default_factory=dict)
 
-    def apply(self, df: pd.DataFrame, code: str = "", name: str = "") -> FilterResult:
-        """필터 적용"""
+    def apply_fast(self, df: pd.DataFrame,
+                   arrs: Optional[Dict[str, np.ndarray]] = None) -> tuple:
+        """
+        필터 적용 (FilterResult 생성 없이 원시 결과만 반환)
+
+        대부분의 종목은 첫 필터에서 탈락해 결과를 쓰지 않으므로,
+        스크리닝 루프에서는 이 튜플만 모으고 필요할 때 to_result()로 변환한다.
+
+        Args:
+            df: OHLCV DataFrame
+            arrs: 미리 추출한 OHLCV 배열 (기본 제공 필터에만 전달)
+
+        Returns:
+            (통과 여부, 값, 기준값, 오류 메시지 또는 None)
+        """
         try:
-            passed, value, threshold = self.filter_func(df, **self.params)
-            return FilterResult(
-                code=code,
-                name=name,
-                passed=passed,
-                filter_name=self.name,
-                value=value,
-                threshold=threshold,
-                reason=f"{self.name}: {value} vs {threshold}"
-            )
+            if arrs is not None and self.filter_func in VECTORIZED_FILTERS:
+                passed, value, threshold = self.filter_func(df, arrs=arrs, **self.params)
+            else:
+                passed, value, threshold = self.filter_func(df, **self.params)
+            return passed, value, threshold, None
         except Exception as e:
+            return False, None, None, str(e)
+
+    def to_result(self, raw: tuple, code: str = "", name: str = "") -> FilterResult:
+        """apply_fast() 결과를 FilterResult로 변환"""
+        passed, value, threshold, error = raw
+        if error is not None:
             return FilterResult(
                 code=code,
                 name=name,
                 passed=False,
                 filter_name=self.name,
-                reason=f"Error: {str(e)}"
+                reason=f"Error: {error}"
             )
+        return FilterResult(
+            code=code,
+            name=name,
+            passed=passed,
+            filter_name=self.name,
+            value=value,
+            threshold=threshold,
+            reason=f"{self.name}: {value} vs {threshold}"
+        )
 
+    def apply(self, df: pd.DataFrame, code: str = "", name: str = "",
+              arrs: Optional[Dict[str, np.ndarray]] = None) -> FilterResult:
+        """
+        필터 적용
 
-def _get_columns(df: pd.DataFrame) -> Dict[str, str]:
-    """컬럼명 매핑"""
-    col_lower = {c.lower(): c for c in df.columns}
-    return {
-        'open': col_lower.get('open', 'Open'),
-        'high': col_lower.get('high', 'High'),
-        'low': col_lower.get('low', 'Low'),
-        'close': col_lower.get('close', 'Close'),
-        'volume': col_lower.get('volume', 'Volume'),
-    }
+        Args:
+            df: OHLCV DataFrame
+            code: 종목 코드
+            name: 종목명
+            arrs: 미리 추출한 OHLCV 배열 (기본 제공 필터에만 전달)
+        """
+        return self.to_result(self.apply_fast(df, arrs), code, name)
+
+
+def _get_arrays(df: pd.DataFrame,
+                arrs: Optional[Dict[str, np.ndarray]] = None) -> Dict[str, np.ndarray]:
+    """
+    OHLCV 원시 배열 ({'open', 'high', 'low', 'close', 'vol'}, 대소문자 무관)
+
+    DataFrame별로 한 번만 변환해 캐시하므로 여러 필터가 같은 배열을 재사용한다.
+    호출 측(StockFilter.apply)에서 미리 조회한 arrs가 있으면 그대로 사용한다.
+    """
+    return arrs if arrs is not None else get_views(df)
+
+
+def _mean(values: np.ndarray) -> float:
+    """결측 제외 평균 (pandas Series.mean()과 동일, 값이 없으면 NaN)"""
+    if values.dtype.kind == 'f':
+        values = values[~np.isnan(values)]
+    return values.mean() if len(values) else np.nan
+
+
+def _last_mas(df: pd.DataFrame, periods: List[int],
+              arrs: Optional[Dict[str, np.ndarray]] = None) -> List[float]:
+    """
+    기간별 마지막 이동평균 값 (지표 캐시 컬럼이 있으면 재사용)
+
+    rolling(window=period).mean()의 마지막 값과 같다. 여러 기간은 가장 긴 기간 구간의
+    누적합 한 번으로 계산한다 (MA_p = (cs[-1] - cs[-1-p]) / p).
+
+    Args:
+        df: OHLCV DataFrame
+        periods: 이동평균 기간 리스트
+        arrs: 미리 추출한 OHLCV 배열 (없으면 df에서 조회)
+
+    Returns:
+        기간별 이동평균 값 (데이터가 period보다 짧거나 구간에 결측이 있으면 NaN)
+    """
+    close = _get_arrays(df, arrs)['close']
+    n = len(close)
+
+    cumsum = None
+    if len(periods) > 1:
+        tail = close[-max(periods):]
+        # 구간 내 결측이 있으면 누적합이 뒤 기간까지 오염되므로 기간별 평균으로 계산
+        if not np.isnan(tail).any():
+            cumsum = np.concatenate(([0.0], np.cumsum(tail)))
+
+    ma_values = []
+    for period in periods:
+        ma_col = f'ma{period}'
+        if n < period:
+            ma_values.append(np.nan)
+        elif ma_col in df.columns:
+            ma_values.append(df[ma_col].iat[-1])
+        elif cumsum is not None:
+            ma_values.append((cumsum[-1] - cumsum[-1 - period]) / period)
+        else:
+            ma_values.append(close[-period:].mean())
+    return ma_values
 
 
 # ============ 거래량 필터 ============
 
 def filter_min_volume(df: pd.DataFrame, min_volume: int = 100000,
-                      days: int = 5) -> tuple:
+                      days: int = 5,
+                      arrs: Optional[Dict[str, np.ndarray]] = None) -> tuple:
     """
     최소 거래량 필터
 
@@ -78,17 +180,19 @@ def filter_min_volume(df: pd.DataFrame, min_volume: int = 100000,
         df: OHLCV DataFrame
         min_volume: 최소 거래량
         days: 평균 계산 기간
+        arrs: 미리 추출한 OHLCV 배열 (없으면 df에서 조회)
 
     Returns:
         (통과 여부, 평균 거래량, 기준)
     """
-    cols = _get_columns(df)
-    avg_volume = df[cols['volume']].iloc[-days:].mean()
+    volume = _get_arrays(df, arrs)['vol']
+    avg_volume = _mean(volume[-days:])
     return avg_volume >= min_volume, int(avg_volume), min_volume
 
 
 def filter_volume_spike(df: pd.DataFrame, spike_ratio: float = 2.0,
-                        lookback: int = 20) -> tuple:
+                        lookback: int = 20,
+                        arrs: Optional[Dict[str, np.ndarray]] = None) -> tuple:
     """
     거래량 급증 필터
 
@@ -96,13 +200,14 @@ def filter_volume_spike(df: pd.DataFrame, spike_ratio: float = 2.0,
         df: OHLCV DataFrame
         spike_ratio: 거래량 배수 기준
         lookback: 평균 계산 기간
+        arrs: 미리 추출한 OHLCV 배열 (없으면 df에서 조회)
 
     Returns:
         (통과 여부, 거래량 비율, 기준)
     """
-    cols = _get_columns(df)
-    current_vol = df[cols['volume']].iloc[-1]
-    avg_vol = df[cols['volume']].iloc[-lookback:-1].mean()
+    volume = _get_arrays(df, arrs)['vol']
+    current_vol = volume[-1]
+    avg_vol = _mean(volume[-lookback:-1])
 
     if avg_vol == 0:
         return False, 0, spike_ratio
@@ -111,30 +216,27 @@ def filter_volume_spike(df: pd.DataFrame, spike_ratio: float = 2.0,
     return ratio >= spike_ratio, round(ratio, 2), spike_ratio
 
 
-def filter_volume_increase(df: pd.DataFrame, increase_days: int = 3) -> tuple:
+def filter_volume_increase(df: pd.DataFrame, increase_days: int = 3,
+                           arrs: Optional[Dict[str, np.ndarray]] = None) -> tuple:
     """
     거래량 증가 추세 필터
 
     Args:
         df: OHLCV DataFrame
         increase_days: 연속 증가 일수
+        arrs: 미리 추출한 OHLCV 배열 (없으면 df에서 조회)
 
     Returns:
         (통과 여부, 연속 증가 일수, 기준)
     """
-    cols = _get_columns(df)
-    volumes = df[cols['volume']].iloc[-increase_days - 1:].values
+    volumes = _get_arrays(df, arrs)['vol'][-increase_days - 1:]
 
     if len(volumes) < increase_days + 1:
         return False, 0, increase_days
 
-    # 연속 증가 확인
-    consecutive = 0
-    for i in range(1, len(volumes)):
-        if volumes[i] > volumes[i - 1]:
-            consecutive += 1
-        else:
-            consecutive = 0
+    # 연속 증가 확인 (마지막 감소/보합 이후의 증가 일수)
+    increased = np.diff(volumes) > 0
+    consecutive = increase_days if increased.all() else int(np.argmin(increased[::-1]))
 
     return consecutive >= increase_days, consecutive, increase_days
 
@@ -142,7 +244,8 @@ def filter_volume_increase(df: pd.DataFrame, increase_days: int = 3) -> tuple:
 # ============ 가격 필터 ============
 
 def filter_price_range(df: pd.DataFrame, min_price: int = 1000,
-                       max_price: int = 500000) -> tuple:
+                       max_price: int = 500000,
+                       arrs: Optional[Dict[str, np.ndarray]] = None) -> tuple:
     """
     가격 범위 필터
 
@@ -150,40 +253,41 @@ def filter_price_range(df: pd.DataFrame, min_price: int = 1000,
         df: OHLCV DataFrame
         min_price: 최소 가격
         max_price: 최대 가격
+        arrs: 미리 추출한 OHLCV 배열 (없으면 df에서 조회)
 
     Returns:
         (통과 여부, 현재가, 범위)
     """
-    cols = _get_columns(df)
-    current_price = df[cols['close']].iloc[-1]
+    current_price = _get_arrays(df, arrs)['close'][-1]
     passed = min_price <= current_price <= max_price
     return passed, int(current_price), f"{min_price}~{max_price}"
 
 
-def filter_price_above_ma(df: pd.DataFrame, period: int = 20) -> tuple:
+def filter_price_above_ma(df: pd.DataFrame, period: int = 20,
+                          arrs: Optional[Dict[str, np.ndarray]] = None) -> tuple:
     """
     이동평균선 위 필터
 
     Args:
         df: OHLCV DataFrame
         period: 이동평균 기간
+        arrs: 미리 추출한 OHLCV 배열 (없으면 df에서 조회)
 
     Returns:
         (통과 여부, 현재가, MA)
     """
-    cols = _get_columns(df)
-    ma = df[cols['close']].rolling(window=period).mean()
+    ma_value = _last_mas(df, [period], arrs)[0]
 
-    if pd.isna(ma.iloc[-1]):
+    if pd.isna(ma_value):
         return False, 0, 0
 
-    current_price = df[cols['close']].iloc[-1]
-    ma_value = ma.iloc[-1]
+    current_price = _get_arrays(df, arrs)['close'][-1]
     return current_price > ma_value, round(current_price, 0), round(ma_value, 0)
 
 
 def filter_price_change(df: pd.DataFrame, min_change: float = -0.05,
-                        max_change: float = 0.05) -> tuple:
+                        max_change: float = 0.05,
+                        arrs: Optional[Dict[str, np.ndarray]] = None) -> tuple:
     """
     가격 변동률 필터
 
@@ -191,17 +295,17 @@ def filter_price_change(df: pd.DataFrame, min_change: float = -0.05,
         df: OHLCV DataFrame
         min_change: 최소 변동률
         max_change: 최대 변동률
+        arrs: 미리 추출한 OHLCV 배열 (없으면 df에서 조회)
 
     Returns:
         (통과 여부, 변동률, 범위)
     """
-    cols = _get_columns(df)
-
     if len(df) < 2:
         return False, 0, f"{min_change}~{max_change}"
 
-    current_close = df[cols['close']].iloc[-1]
-    prev_close = df[cols['close']].iloc[-2]
+    close = _get_arrays(df, arrs)['close']
+    current_close = close[-1]
+    prev_close = close[-2]
 
     change_rate = (current_close - prev_close) / prev_close
     passed = min_change <= change_rate <= max_change
@@ -209,30 +313,29 @@ def filter_price_change(df: pd.DataFrame, min_change: float = -0.05,
     return passed, round(change_rate * 100, 2), f"{min_change * 100}%~{max_change * 100}%"
 
 
-def filter_positive_change(df: pd.DataFrame, days: int = 1) -> tuple:
+def filter_positive_change(df: pd.DataFrame, days: int = 1,
+                           arrs: Optional[Dict[str, np.ndarray]] = None) -> tuple:
     """
     양봉(상승) 필터
 
     Args:
         df: OHLCV DataFrame
         days: 연속 양봉 일수
+        arrs: 미리 추출한 OHLCV 배열 (없으면 df에서 조회)
 
     Returns:
         (통과 여부, 연속 양봉 수, 기준)
     """
-    cols = _get_columns(df)
-
     if len(df) < days:
         return False, 0, days
 
-    consecutive = 0
-    for i in range(-days, 0):
-        close = df[cols['close']].iloc[i]
-        open_price = df[cols['open']].iloc[i]
-        if close > open_price:
-            consecutive += 1
-        else:
-            break
+    if days <= 0:
+        return True, 0, days
+
+    # 기간 첫날부터 이어진 양봉 수 (첫 음봉/보합에서 중단)
+    arrs = _get_arrays(df, arrs)
+    bullish = arrs['close'][-days:] > arrs['open'][-days:]
+    consecutive = days if bullish.all() else int(np.argmin(bullish))
 
     return consecutive >= days, consecutive, days
 
@@ -240,7 +343,8 @@ def filter_positive_change(df: pd.DataFrame, days: int = 1) -> tuple:
 # ============ 이동평균 정배열 필터 ============
 
 def filter_ma_alignment(df: pd.DataFrame, periods: List[int] = None,
-                        ascending: bool = True) -> tuple:
+                        ascending: bool = True,
+                        arrs: Optional[Dict[str, np.ndarray]] = None) -> tuple:
     """
     이동평균선 정배열/역배열 필터
 
@@ -248,6 +352,7 @@ def filter_ma_alignment(df: pd.DataFrame, periods: List[int] = None,
         df: OHLCV DataFrame
         periods: 이동평균 기간 리스트
         ascending: True=정배열, False=역배열
+        arrs: 미리 추출한 OHLCV 배열 (없으면 df에서 조회)
 
     Returns:
         (통과 여부, MA 값들, 상태)
@@ -255,14 +360,12 @@ def filter_ma_alignment(df: pd.DataFrame, periods: List[int] = None,
     if periods is None:
         periods = [5, 20, 60]
 
-    cols = _get_columns(df)
     ma_values = []
 
-    for period in periods:
-        ma = df[cols['close']].rolling(window=period).mean()
-        if pd.isna(ma.iloc[-1]):
+    for ma_value in _last_mas(df, periods, arrs):
+        if pd.isna(ma_value):
             return False, [], "정배열" if ascending else "역배열"
-        ma_values.append(round(ma.iloc[-1], 0))
+        ma_values.append(round(ma_value, 0))
 
     if ascending:
         # 정배열: 단기 > 장기
@@ -279,7 +382,8 @@ def filter_ma_alignment(df: pd.DataFrame, periods: List[int] = None,
 # ============ 박스권 필터 ============
 
 def filter_box_range(df: pd.DataFrame, lookback: int = 10,
-                     variance: float = 0.05) -> tuple:
+                     variance: float = 0.05,
+                     arrs: Optional[Dict[str, np.ndarray]] = None) -> tuple:
     """
     박스권 횡보 필터
 
@@ -287,18 +391,18 @@ def filter_box_range(df: pd.DataFrame, lookback: int = 10,
         df: OHLCV DataFrame
         lookback: 확인 기간
         variance: 허용 변동폭
+        arrs: 미리 추출한 OHLCV 배열 (없으면 df에서 조회)
 
     Returns:
         (통과 여부, 변동폭, 기준)
     """
-    cols = _get_columns(df)
-
     if len(df) < lookback:
         return False, 0, variance
 
-    recent = df.iloc[-lookback:]
-    high = recent[cols['high']].max()
-    low = recent[cols['low']].min()
+    # fmax/fmin은 결측을 건너뜀 (pandas max/min과 동일, 전부 결측이면 NaN)
+    arrs = _get_arrays(df, arrs)
+    high = np.fmax.reduce(arrs['high'][-lookback:])
+    low = np.fmin.reduce(arrs['low'][-lookback:])
 
     if low == 0:
         return False, 0, variance
@@ -309,22 +413,28 @@ def filter_box_range(df: pd.DataFrame, lookback: int = 10,
     return passed, round(actual_variance * 100, 2), f"{variance * 100}%"
 
 
-def filter_near_52week_high(df: pd.DataFrame, threshold: float = 0.05) -> tuple:
+def filter_near_52week_high(df: pd.DataFrame, threshold: float = 0.05,
+                            arrs: Optional[Dict[str, np.ndarray]] = None) -> tuple:
     """
     52주 신고가 근접 필터
 
     Args:
         df: OHLCV DataFrame (최소 252일)
         threshold: 신고가 대비 임계값
+        arrs: 미리 추출한 OHLCV 배열 (없으면 df에서 조회)
 
     Returns:
         (통과 여부, 현재가/신고가 비율, 기준)
     """
-    cols = _get_columns(df)
-    lookback = min(252, len(df))
+    arrs = _get_arrays(df, arrs)
 
-    high_52w = df[cols['high']].iloc[-lookback:].max()
-    current_price = df[cols['close']].iloc[-1]
+    if 'high_52w' in df.columns:
+        # 지표 캐시에서 미리 계산된 값 사용
+        high_52w = df['high_52w'].iat[-1]
+    else:
+        # 최근 252일 구간만 한 번 순회 (fmax는 결측을 건너뛰고 복사/경고 없음)
+        high_52w = np.fmax.reduce(arrs['high'][-WEEKS_52_DAYS:])
+    current_price = arrs['close'][-1]
 
     if high_52w == 0:
         return False, 0, threshold
@@ -335,22 +445,26 @@ def filter_near_52week_high(df: pd.DataFrame, threshold: float = 0.05) -> tuple:
     return passed, round(ratio * 100, 2), f"{(1 - threshold) * 100}%"
 
 
-def filter_near_52week_low(df: pd.DataFrame, threshold: float = 0.10) -> tuple:
+def filter_near_52week_low(df: pd.DataFrame, threshold: float = 0.10,
+                           arrs: Optional[Dict[str, np.ndarray]] = None) -> tuple:
     """
     52주 신저가 근접 필터
 
     Args:
         df: OHLCV DataFrame
         threshold: 신저가 대비 임계값
+        arrs: 미리 추출한 OHLCV 배열 (없으면 df에서 조회)
 
     Returns:
         (통과 여부, 현재가/신저가 비율, 기준)
     """
-    cols = _get_columns(df)
-    lookback = min(252, len(df))
+    arrs = _get_arrays(df, arrs)
 
-    low_52w = df[cols['low']].iloc[-lookback:].min()
-    current_price = df[cols['close']].iloc[-1]
+    if 'low_52w' in df.columns:
+        low_52w = df['low_52w'].iat[-1]
+    else:
+        low_52w = np.fmin.reduce(arrs['low'][-WEEKS_52_DAYS:])
+    current_price = arrs['close'][-1]
 
     if low_52w == 0:
         return False, 0, threshold
@@ -363,21 +477,22 @@ def filter_near_52week_low(df: pd.DataFrame, threshold: float = 0.10) -> tuple:
 
 # ============ 캔들 패턴 필터 ============
 
-def filter_long_candle(df: pd.DataFrame, threshold: float = 0.05) -> tuple:
+def filter_long_candle(df: pd.DataFrame, threshold: float = 0.05,
+                       arrs: Optional[Dict[str, np.ndarray]] = None) -> tuple:
     """
     장대양봉/장대음봉 필터
 
     Args:
         df: OHLCV DataFrame
         threshold: 몸통 크기 임계값
+        arrs: 미리 추출한 OHLCV 배열 (없으면 df에서 조회)
 
     Returns:
         (통과 여부, 몸통 크기, 기준)
     """
-    cols = _get_columns(df)
-
-    open_price = df[cols['open']].iloc[-1]
-    close_price = df[cols['close']].iloc[-1]
+    arrs = _get_arrays(df, arrs)
+    open_price = arrs['open'][-1]
+    close_price = arrs['close'][-1]
 
     if open_price == 0:
         return False, 0, threshold
@@ -388,16 +503,20 @@ def filter_long_candle(df: pd.DataFrame, threshold: float = 0.05) -> tuple:
     return passed, round(body_ratio * 100, 2), f"{threshold * 100}%"
 
 
-def filter_bullish_candle(df: pd.DataFrame) -> tuple:
+def filter_bullish_candle(df: pd.DataFrame, arrs: Optional[Dict[str, np.ndarray]] = None) -> tuple:
     """
     양봉 필터
 
+    Args:
+        df: OHLCV DataFrame
+        arrs: 미리 추출한 OHLCV 배열 (없으면 df에서 조회)
+
     Returns:
         (통과 여부, 종가-시가, "양봉")
     """
-    cols = _get_columns(df)
-    open_price = df[cols['open']].iloc[-1]
-    close_price = df[cols['close']].iloc[-1]
+    arrs = _get_arrays(df, arrs)
+    open_price = arrs['open'][-1]
+    close_price = arrs['close'][-1]
 
     passed = close_price > open_price
     diff = close_price - open_price
@@ -405,34 +524,350 @@ def filter_bullish_candle(df: pd.DataFrame) -> tuple:
     return passed, int(diff), "양봉"
 
 
+# ============ 벡터화 필터 (전 종목 패널) ============
+#
+# panels: build_panels()가 만든 {'open', 'high', 'low', 'close', 'volume': (종목 수, 기간) 배열,
+#                                 'length': 종목별 실제 행 수}
+# 각 종목의 마지막 봉이 마지막 열에 오도록 우측 정렬, 데이터가 없는 앞부분은 NaN.
+# 반환값은 종목별 통과 여부(bool 배열)로 단일 종목 필터와 같은 판정을 한다.
+
+PANEL_FIELDS = ('open', 'high', 'low', 'close', 'volume')
+
+
+def build_panels(frames: List[pd.DataFrame], lookback: int,
+                 price_dtype=np.float64) -> Dict[str, np.ndarray]:
+    """
+    종목별 OHLCV 마지막 lookback 행을 (종목 수, lookback) 패널로 적재
+
+    가격 패널은 price_dtype(float32 가능)으로 저장하고, 거래량은 결측(NaN)으로
+    빈 구간을 표시해야 하므로 float64를 유지한다. 집계/비율 계산은 float64로 수행한다.
+
+    Args:
+        frames: OHLCV DataFrame 리스트
+        lookback: 패널 기간 (필요한 최대 조회 기간)
+        price_dtype: 시가/고가/저가/종가 패널 자료형
+
+    Returns:
+        필드별 2차원 배열(Fortran order, 최근 구간 열 슬라이스가 연속 메모리)과 'length'
+    """
+    n = len(frames)
+    lookback = max(int(lookback), 1)
+    panels = {
+        f: np.full((n, lookback), np.nan, order='F',
+                   dtype=np.float64 if f == 'volume' else price_dtype)
+        for f in PANEL_FIELDS
+    }
+    lengths = np.zeros(n, dtype=np.int64)
+
+    for i, df in enumerate(frames):
+        arrs = _get_arrays(df)
+        lengths[i] = len(df)
+        k = min(len(df), lookback)
+        if k == 0:
+            continue
+        for f in PANEL_FIELDS:
+            arr = arrs.get('vol' if f == 'volume' else f)
+            if arr is not None:
+                panels[f][i, lookback - k:] = arr[-k:]
+
+    panels['length'] = lengths
+    return panels
+
+
+def _nan_reduce(func, values: np.ndarray) -> np.ndarray:
+    """결측 무시 행 단위 집계 (전부 결측이면 NaN, 경고 없음)"""
+    with np.errstate(all='ignore'), warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        return func(values, axis=1)
+
+
+def _panel_last(panels: Dict[str, np.ndarray], field: str, pos: int = -1) -> np.ndarray:
+    """종목별 pos 위치 값 (float64, 가격 패널이 float32여도 비율 계산은 float64로)"""
+    return panels[field][:, pos].astype(np.float64, copy=False)
+
+
+def _panel_last_ma(panels: Dict[str, np.ndarray], period: int) -> np.ndarray:
+    """종목별 마지막 이동평균 (_last_mas와 동일: 기간 미달/결측 포함 시 NaN)"""
+    tail = panels['close'][:, -period:]
+    if tail.shape[1] == period:
+        ma = tail.mean(axis=1, dtype=np.float64)
+    else:
+        ma = np.full(len(tail), np.nan)
+    ma[panels['length'] < period] = np.nan
+    return ma
+
+
+def vec_filter_min_volume(panels: Dict[str, np.ndarray], min_volume: int = 100000,
+                          days: int = 5) -> np.ndarray:
+    """최소 거래량 필터 (벡터화)"""
+    avg_volume = _nan_reduce(np.nanmean, panels['volume'][:, -days:])
+    return avg_volume >= min_volume
+
+
+def vec_filter_volume_spike(panels: Dict[str, np.ndarray], spike_ratio: float = 2.0,
+                            lookback: int = 20) -> np.ndarray:
+    """거래량 급증 필터 (벡터화)"""
+    volume = panels['volume']
+    avg_vol = _nan_reduce(np.nanmean, volume[:, -lookback:-1])
+    with np.errstate(all='ignore'):
+        ratio = volume[:, -1] / avg_vol
+    return (avg_vol != 0) & (ratio >= spike_ratio)
+
+
+def vec_filter_volume_increase(panels: Dict[str, np.ndarray],
+                               increase_days: int = 3) -> np.ndarray:
+    """거래량 증가 추세 필터 (벡터화)"""
+    volumes = panels['volume'][:, -increase_days - 1:]
+    increasing = np.all(np.diff(volumes, axis=1) > 0, axis=1)
+    return increasing & (panels['length'] >= increase_days + 1)
+
+
+def vec_filter_price_range(panels: Dict[str, np.ndarray], min_price: int = 1000,
+                           max_price: int = 500000) -> np.ndarray:
+    """가격 범위 필터 (벡터화)"""
+    current_price = _panel_last(panels, 'close')
+    return (min_price <= current_price) & (current_price <= max_price)
+
+
+def vec_filter_price_above_ma(panels: Dict[str, np.ndarray],
+                              period: int = 20) -> np.ndarray:
+    """이동평균선 위 필터 (벡터화)"""
+    return _panel_last(panels, 'close') > _panel_last_ma(panels, period)
+
+
+def vec_filter_price_change(panels: Dict[str, np.ndarray], min_change: float = -0.05,
+                            max_change: float = 0.05) -> np.ndarray:
+    """가격 변동률 필터 (벡터화)"""
+    close = panels['close']
+    if close.shape[1] < 2:
+        return np.zeros(len(close), dtype=bool)
+
+    prev_close = _panel_last(panels, 'close', -2)
+    with np.errstate(all='ignore'):
+        change_rate = (_panel_last(panels, 'close') - prev_close) / prev_close
+    return ((min_change <= change_rate) & (change_rate <= max_change)
+            & (panels['length'] >= 2))
+
+
+def vec_filter_positive_change(panels: Dict[str, np.ndarray], days: int = 1) -> np.ndarray:
+    """양봉(상승) 필터 (벡터화)"""
+    n = len(panels['length'])
+    if days <= 0:
+        return np.ones(n, dtype=bool)
+
+    bullish = np.all(panels['close'][:, -days:] > panels['open'][:, -days:], axis=1)
+    return bullish & (panels['length'] >= days)
+
+
+def vec_filter_ma_alignment(panels: Dict[str, np.ndarray], periods: List[int] = None,
+                            ascending: bool = True) -> np.ndarray:
+    """이동평균선 정배열/역배열 필터 (벡터화)"""
+    if periods is None:
+        periods = [5, 20, 60]
+
+    # 단일 종목 필터와 같이 반올림한 MA로 비교 (결측 비교는 False)
+    ma_values = [np.round(_panel_last_ma(panels, p), 0) for p in periods]
+    passed = np.ones(len(panels['length']), dtype=bool)
+    for p in ma_values:
+        passed &= ~np.isnan(p)
+    for short, long in zip(ma_values, ma_values[1:]):
+        passed &= (short > long) if ascending else (short < long)
+    return passed
+
+
+def vec_filter_box_range(panels: Dict[str, np.ndarray], lookback: int = 10,
+                         variance: float = 0.05) -> np.ndarray:
+    """박스권 횡보 필터 (벡터화)"""
+    high = np.fmax.reduce(panels['high'][:, -lookback:], axis=1).astype(np.float64)
+    low = np.fmin.reduce(panels['low'][:, -lookback:], axis=1).astype(np.float64)
+    with np.errstate(all='ignore'):
+        actual_variance = (high - low) / low
+    return (low != 0) & (actual_variance <= variance) & (panels['length'] >= lookback)
+
+
+def vec_filter_near_52week_high(panels: Dict[str, np.ndarray],
+                                threshold: float = 0.05) -> np.ndarray:
+    """52주 신고가 근접 필터 (벡터화)"""
+    high_52w = np.fmax.reduce(panels['high'][:, -WEEKS_52_DAYS:], axis=1).astype(np.float64)
+    with np.errstate(all='ignore'):
+        ratio = _panel_last(panels, 'close') / high_52w
+    return (high_52w != 0) & (ratio >= (1 - threshold))
+
+
+def vec_filter_near_52week_low(panels: Dict[str, np.ndarray],
+                               threshold: float = 0.10) -> np.ndarray:
+    """52주 신저가 근접 필터 (벡터화)"""
+    low_52w = np.fmin.reduce(panels['low'][:, -WEEKS_52_DAYS:], axis=1).astype(np.float64)
+    with np.errstate(all='ignore'):
+        ratio = _panel_last(panels, 'close') / low_52w
+    return (low_52w != 0) & (ratio <= (1 + threshold))
+
+
+def vec_filter_long_candle(panels: Dict[str, np.ndarray],
+                           threshold: float = 0.05) -> np.ndarray:
+    """장대양봉/장대음봉 필터 (벡터화)"""
+    open_price = _panel_last(panels, 'open')
+    with np.errstate(all='ignore'):
+        body_ratio = np.abs(_panel_last(panels, 'close') - open_price) / open_price
+    return (open_price != 0) & (body_ratio >= threshold)
+
+
+def vec_filter_bullish_candle(panels: Dict[str, np.ndarray]) -> np.ndarray:
+    """양봉 필터 (벡터화)"""
+    return panels['close'][:, -1] > panels['open'][:, -1]
+
+
+# 단일 종목 필터 → (벡터화 필터, 필요한 패널 기간)
+VECTORIZED_FILTERS: Dict[Callable, tuple] = {
+    filter_min_volume: (vec_filter_min_volume, lambda days=5, **_: days),
+    filter_volume_spike: (vec_filter_volume_spike, lambda lookback=20, **_: lookback),
+    filter_volume_increase: (vec_filter_volume_increase,
+                             lambda increase_days=3, **_: increase_days + 1),
+    filter_price_range: (vec_filter_price_range, lambda **_: 1),
+    filter_price_above_ma: (vec_filter_price_above_ma, lambda period=20, **_: period),
+    filter_price_change: (vec_filter_price_change, lambda **_: 2),
+    filter_positive_change: (vec_filter_positive_change, lambda days=1, **_: days),
+    filter_ma_alignment: (vec_filter_ma_alignment,
+                          lambda periods=None, **_: max(periods or [5, 20, 60])),
+    filter_box_range: (vec_filter_box_range, lambda lookback=10, **_: lookback),
+    filter_near_52week_high: (vec_filter_near_52week_high, lambda **_: WEEKS_52_DAYS),
+    filter_near_52week_low: (vec_filter_near_52week_low, lambda **_: WEEKS_52_DAYS),
+    filter_long_candle: (vec_filter_long_candle, lambda **_: 1),
+    filter_bullish_candle: (vec_filter_bullish_candle, lambda **_: 1),
+}
+
+
+def panel_lookback(filters: List[StockFilter]) -> int:
+    """벡터화 가능한 필터들이 필요로 하는 최대 패널 기간"""
+    windows = [VECTORIZED_FILTERS[f.filter_func][1](**f.params)
+               for f in filters if f.filter_func in VECTORIZED_FILTERS]
+    return max(windows, default=1)
+
+
+# 통합 커널로 한 번에 평가하는 필터 → (연산 코드, 인자 변환)
+KERNEL_FILTERS: Dict[Callable, tuple] = {
+    filter_min_volume: (OP_MIN_VOLUME,
+                        lambda min_volume=100000, days=5: [min_volume, days]),
+    filter_price_range: (OP_PRICE_RANGE,
+                         lambda min_price=1000, max_price=500000: [min_price, max_price]),
+    filter_price_above_ma: (OP_PRICE_ABOVE_MA, lambda period=20: [period]),
+    filter_volume_spike: (OP_VOLUME_SPIKE,
+                          lambda spike_ratio=2.0, lookback=20: [spike_ratio, lookback]),
+    filter_ma_alignment: (OP_MA_ALIGNMENT,
+                          lambda periods=None, ascending=True: [
+                              float(ascending), len(periods or [5, 20, 60]),
+                              *(periods or [5, 20, 60])]),
+    filter_volume_increase: (OP_VOLUME_INCREASE, lambda increase_days=3: [increase_days]),
+    filter_box_range: (OP_BOX_RANGE,
+                       lambda lookback=10, variance=0.05: [lookback, variance]),
+}
+
+
+def compile_filters(filters: List[StockFilter]) -> Callable[[Dict[str, np.ndarray]], np.ndarray]:
+    """
+    필터 리스트를 전 종목 사전 필터 함수로 변환
+
+    필터 분류(통합 커널/벡터화/미지원)와 커널 인자 배열 구성을 한 번만 수행하고,
+    반환된 함수는 패널만 받아 바로 평가한다. numba가 있으면 KERNEL_FILTERS에 속한
+    필터는 통합 병렬 커널 한 번으로, 나머지는 벡터화 필터로 평가한다.
+    벡터화 버전이 없는 필터는 통과로 간주하므로, 결과는 단일 종목 필터로
+    다시 확인할 후보를 고르는 사전 필터로 사용한다.
+
+    Args:
+        filters: 필터 리스트
+
+    Returns:
+        panels → 종목별 통과 여부 bool 배열 함수
+    """
+    fused = [f for f in filters if f.filter_func in KERNEL_FILTERS] if NUMBA_AVAILABLE else []
+    program = None
+    if fused:
+        ops, params = [], []
+        for f in fused:
+            op, to_params = KERNEL_FILTERS[f.filter_func]
+            ops.append(op)
+            params.append(to_params(**f.params))
+        program = compile_program(ops, params)
+
+    vectorized = [(VECTORIZED_FILTERS[f.filter_func][0], f.params)
+                  for f in filters
+                  if f.filter_func in VECTORIZED_FILTERS and f not in fused]
+
+    def prefilter(panels: Dict[str, np.ndarray]) -> np.ndarray:
+        masks = []
+        if program is not None:
+            masks.extend(run_program(program, panels).T)
+        masks.extend(func(panels, **params) for func, params in vectorized)
+        if not masks:
+            return np.ones(len(panels['length']), dtype=bool)
+        return np.logical_and.reduce(masks)
+
+    return prefilter
+
+
+def apply_vectorized_filters(filters: List[StockFilter],
+                             panels: Dict[str, np.ndarray]) -> np.ndarray:
+    """
+    전 종목에 필터를 한 번에 적용 (compile_filters() 후 즉시 실행)
+
+    Args:
+        filters: 필터 리스트
+        panels: build_panels() 결과
+
+    Returns:
+        종목별 통과 여부 bool 배열
+    """
+    return compile_filters(filters)(panels)
+
+
 # ============ 필터 팩토리 ============
 
 class FilterFactory:
     """필터 생성 팩토리"""
 
+    # 필터 이름 → (함수, 설명, 상대 비용, 예상 통과율)
+    # 비용은 종목당 참조하는 봉 수 기준 대략값, 통과율은 일봉 전 종목 기준 경험값
     AVAILABLE_FILTERS = {
-        'min_volume': (filter_min_volume, "최소 거래량 필터"),
-        'volume_spike': (filter_volume_spike, "거래량 급증 필터"),
-        'volume_increase': (filter_volume_increase, "거래량 증가 추세 필터"),
-        'price_range': (filter_price_range, "가격 범위 필터"),
-        'price_above_ma': (filter_price_above_ma, "이동평균 위 필터"),
-        'price_change': (filter_price_change, "가격 변동률 필터"),
-        'positive_change': (filter_positive_change, "양봉 필터"),
-        'ma_alignment': (filter_ma_alignment, "이동평균 정배열 필터"),
-        'box_range': (filter_box_range, "박스권 필터"),
-        'near_52week_high': (filter_near_52week_high, "52주 신고가 근접 필터"),
-        'near_52week_low': (filter_near_52week_low, "52주 신저가 근접 필터"),
-        'long_candle': (filter_long_candle, "장대 캔들 필터"),
-        'bullish_candle': (filter_bullish_candle, "양봉 필터"),
+        'min_volume': (filter_min_volume, "최소 거래량 필터", 5, 0.5),
+        'volume_spike': (filter_volume_spike, "거래량 급증 필터", 20, 0.1),
+        'volume_increase': (filter_volume_increase, "거래량 증가 추세 필터", 4, 0.2),
+        'price_range': (filter_price_range, "가격 범위 필터", 1, 0.7),
+        'price_above_ma': (filter_price_above_ma, "이동평균 위 필터", 20, 0.5),
+        'price_change': (filter_price_change, "가격 변동률 필터", 2, 0.6),
+        'positive_change': (filter_positive_change, "양봉 필터", 2, 0.5),
+        'ma_alignment': (filter_ma_alignment, "이동평균 정배열 필터", 60, 0.3),
+        'box_range': (filter_box_range, "박스권 필터", 20, 0.2),
+        'near_52week_high': (filter_near_52week_high, "52주 신고가 근접 필터", 252, 0.1),
+        'near_52week_low': (filter_near_52week_low, "52주 신저가 근접 필터", 252, 0.1),
+        'long_candle': (filter_long_candle, "장대 캔들 필터", 1, 0.2),
+        'bullish_candle': (filter_bullish_candle, "양봉 필터", 1, 0.5),
     }
 
+    @classmethod
+    def expected_cost(cls, f: StockFilter) -> float:
+        """
+        탈락 1건당 예상 비용 (비용 / 탈락률, 낮을수록 먼저 실행)
+
+        등록되지 않은 사용자 필터는 비용을 알 수 없으므로 가장 뒤로 보낸다.
+        """
+        entry = cls.AVAILABLE_FILTERS.get(f.name)
+        if entry is None or entry[0] is not f.filter_func:
+            return float('inf')
+        _, _, cost, pass_rate = entry
+        return cost / max(1 - pass_rate, 1e-6)
+
+    @classmethod
+    def order_by_cost(cls, filters: List[StockFilter]) -> List[StockFilter]:
+        """조기 탈락 효과가 큰 필터가 먼저 오도록 정렬 (같은 비용은 기존 순서 유지)"""
+        return sorted(filters, key=cls.expected_cost)
+
     @classmethod
     def create(cls, filter_name: str, **params) -> Optional[StockFilter]:
         """필터 생성"""
         if filter_name not in cls.AVAILABLE_FILTERS:
             return None
 
-        filter_func, description = cls.AVAILABLE_FILTERS[filter_name]
+        filter_func, description, _, _ = cls.AVAILABLE_FILTERS[filter_name]
         return StockFilter(
             name=filter_name,
             description=description,
@@ -491,9 +926,30 @@ class FilterFactory:
             if f:
                 filters.append(f)
 
-        return filters
+        # 모든 필터를 통과해야 하므로 순서는 결과에 영향 없음, 저비용/고탈락 필터부터 실행
+        return cls.order_by_cost(filters)
+
+    # 프리셋 이름 → compile_filters() 결과
+    _compiled_presets: Dict[str, Callable] = {}
+
+    @classmethod
+    def compile_preset(cls, preset_name: str) -> Callable[[Dict[str, np.ndarray]], np.ndarray]:
+        """
+        프리셋 사전 필터 함수 (프리셋별로 한 번만 구성해 재사용)
+
+        Args:
+            preset_name: 프리셋 이름 (create_preset과 동일)
+
+        Returns:
+            panels → 종목별 통과 여부 bool 배열 함수
+        """
+        prefilter = cls._compiled_presets.get(preset_name)
+        if prefilter is None:
+            prefilter = compile_filters(cls.create_preset(preset_name))
+            cls._compiled_presets[preset_name] = prefilter
+        return prefilter
 
     @classmethod
     def list_filters(cls) -> Dict[str, str]:
         """사용 가능한 필터 목록"""
-        return {name: desc for name, (_, desc) in cls.AVAILABLE_FILTERS.items()}
+        return {name: entry[1] for name, entry in cls.AVAILABLE_FILTERS.items()}
@@ -3,19 +3,30 @@
 PDF 기준: 전략별 매수 조건 충족 종목 탐색
 """
 
+import numpy as np
 import pandas as pd
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Union
 from dataclasses import dataclass, field
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+import multiprocessing
 from pathlib import Path
 import sys
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-from screener.filters import StockFilter, FilterResult, FilterFactory
+from screener.filters import (
+    StockFilter,
+    FilterResult,
+    FilterFactory,
+    _get_arrays,
+    compile_filters,
+    panel_lookback,
+)
+from screener.universe import UniverseFrame
 from strategies import (
     BaseStrategy,
+    IndicatorCache,
     Signal,
     get_strategy,
     Minute15Strategy,
@@ -56,6 +67,12 @@ class StockScreener:
         self.filters = filters or FilterFactory.create_preset('default')
         self.results: List[ScreeningResult] = []
 
+        # 프리셋 사전 필터 (set_filter_preset 이후 필터 구성이 바뀌지 않았을 때만 사용)
+        # 컴파일된 함수는 지역 함수라 pickle되지 않으므로 프리셋 이름만 보관하고
+        # FilterFactory의 모듈 수준 캐시에서 조회한다 (프로세스 풀 전달 가능)
+        self._preset_filters: Optional[List[StockFilter]] = None
+        self._preset_name: Optional[str] = None
+
     def _load_strategies(self, strategy_names: List[str] = None) -> List[BaseStrategy]:
         """전략 로드"""
         if strategy_names is None:
@@ -81,11 +98,14 @@ class StockScreener:
         f = FilterFactory.create(filter_name, **params)
         if f:
             self.filters.append(f)
+            self.filters = FilterFactory.order_by_cost(self.filters)
         return self
 
     def set_filter_preset(self, preset_name: str) -> 'StockScreener':
         """필터 프리셋 설정"""
         self.filters = FilterFactory.create_preset(preset_name)
+        self._preset_filters = list(self.filters)
+        self._preset_name = preset_name
         return self
 
     def clear_filters(self) -> 'StockScreener':
@@ -99,18 +119,49 @@ class StockScreener:
         필터 적용
 
         Returns:
-            (통과 여부, 필터 결과 리스트)
+            (통과 여부, [(필터, apply_fast() 결과), ...])
+            FilterResult는 신호가 나온 종목에 한해 _build_filter_results()로 생성
         """
-        results = []
+        raw_results = []
+
+        # OHLCV 배열은 한 번만 조회해 모든 필터에 전달
+        arrs = _get_arrays(df)
 
         for f in self.filters:
-            result = f.apply(df, code, name)
-            results.append(result)
+            raw = f.apply_fast(df, arrs)
+            raw_results.append((f, raw))
+
+            if not raw[0]:
+                return False, raw_results
 
-            if not result.passed:
-                return False, results
+        return True, raw_results
 
-        return True, results
+    @staticmethod
+    def _build_filter_results(raw_results: List[tuple], code: str,
+                              name: str) -> List[FilterResult]:
+        """_apply_filters() 원시 결과를 FilterResult 리스트로 변환"""
+        return [f.to_result(raw, code, name) for f, raw in raw_results]
+
+    def _prefilter(self, universe: UniverseFrame) -> List[tuple]:
+        """
+        전 종목 패널에 벡터화 필터를 한 번에 적용해 후보 선별
+
+        Args:
+            universe: 전 종목 유니버스
+
+        Returns:
+            필터 통과 후보 [(code, df, name), ...]
+        """
+        if not len(universe) or not self.filters:
+            return universe.items()
+
+        if self.filters == self._preset_filters:
+            prefilter = FilterFactory.compile_preset(self._preset_name)
+        else:
+            prefilter = compile_filters(self.filters)
+
+        panels = universe.panels_for(panel_lookback(self.filters))
+        return universe.items(prefilter(panels))
 
     def screen_stock(self, df: pd.DataFrame, code: str = "",
                      name: str = "") -> List[ScreeningResult]:
@@ -128,17 +179,23 @@ class StockScreener:
         results = []
 
         # 1. 필터 적용
-        passed, filter_results = self._apply_filters(df, code, name)
+        passed, raw_results = self._apply_filters(df, code, name)
 
         if not passed:
             return results
 
-        # 2. 각 전략 적용
+        filter_results = None
+
+        # 2. 각 전략 적용 (이동평균 등 지표는 전략 간 공유 캐시로 한 번만 계산)
+        cache = IndicatorCache.from_df(df)
         for strategy in self.strategies:
             try:
-                signal = strategy.generate_signal(df, code, name)
+                signal = strategy.generate_signal(df, code, name, cache=cache)
 
                 if signal:
+                    if filter_results is None:
+                        filter_results = self._build_filter_results(raw_results, code, name)
+
                     result = ScreeningResult(
                         code=code,
                         name=name,
@@ -162,15 +219,41 @@ class StockScreener:
 
         return results
 
+    def _screen_chunk(self, chunk: List[tuple]) -> List[ScreeningResult]:
+        """
+        후보 묶음 스크리닝 (작업 단위, 워커 스레드/프로세스에서 실행)
+
+        Args:
+            chunk: [(code, df, name), ...]
+
+        Returns:
+            스크리닝 결과 리스트
+        """
+        results = []
+        for code, df, name in chunk:
+            try:
+                results.extend(self.screen_stock(df, code, name))
+            except Exception as e:
+                log_error(f"스크리닝 오류 [{code}]: {e}")
+        return results
+
     @measure_time
-    def screen_stocks(self, stock_data: Dict[str, Dict[str, Any]],
-                      max_workers: int = 4) -> List[ScreeningResult]:
+    def screen_stocks(self, stock_data: Union[Dict[str, Dict[str, Any]], UniverseFrame],
+                      max_workers: int = 4, chunk_size: int = 200,
+                      use_processes: bool = False) -> List[ScreeningResult]:
         """
         복수 종목 스크리닝 (병렬 처리)
 
+        사전 필터 통과 종목을 chunk_size개씩 묶어 작업 하나로 제출한다.
+        전략 평가는 pandas 연산이 많아 스레드로는 GIL에 묶이므로,
+        후보가 많을 때는 use_processes=True로 프로세스 병렬 처리를 사용할 수 있다.
+        (프로세스 풀은 spawn 방식이므로 실행 스크립트에 if __name__ == '__main__': 보호 필요)
+
         Args:
-            stock_data: {code: {'df': DataFrame, 'name': str}} 형태
+            stock_data: {code: {'df': DataFrame, 'name': str}} 형태 또는 UniverseFrame
             max_workers: 병렬 처리 워커 수
+            chunk_size: 작업 하나에 담을 종목 수
+            use_processes: 프로세스 풀 사용 여부 (기본: 스레드 풀)
 
         Returns:
             스크리닝 결과 리스트
@@ -183,22 +266,37 @@ class StockScreener:
 
         log_info(f"스크리닝 시작: {total}개 종목, {len(self.strategies)}개 전략")
 
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = {}
+        if isinstance(stock_data, UniverseFrame):
+            universe = stock_data
+        else:
+            universe = UniverseFrame.from_stock_data(stock_data, panel_lookback(self.filters))
+
+        candidates = self._prefilter(universe)
+        remaining = len(candidates)
+        log_info(f"사전 필터 통과: {remaining}/{total}개 종목")
 
-            for code, data in stock_data.items():
-                df = data.get('df')
-                name = data.get('name', code)
+        chunk_size = max(1, chunk_size)
+        chunks = [candidates[i:i + chunk_size] for i in range(0, remaining, chunk_size)]
 
-                if df is None or df.empty:
-                    continue
+        # 진행 로그는 약 10% 단위로만 출력 (완료마다 나눗셈 대신 임계값 비교)
+        log_step = max(1, remaining // 10)
+        next_log = log_step
+
+        if use_processes:
+            # 사전 필터의 numba 병렬 커널이 스레드 풀(TBB 등)을 띄운 뒤 fork하면
+            # 자식 프로세스가 멈출 수 있으므로 spawn으로 새 인터프리터를 시작
+            executor = ProcessPoolExecutor(max_workers=max_workers,
+                                           mp_context=multiprocessing.get_context('spawn'))
+        else:
+            executor = ThreadPoolExecutor(max_workers=max_workers)
 
-                future = executor.submit(self.screen_stock, df, code, name)
-                futures[future] = code
+        with executor:
+            # 사전 필터 통과 종목만 종목별 필터 재확인 + 전략 적용
+            futures = {executor.submit(self._screen_chunk, chunk): chunk for chunk in chunks}
 
             for future in as_completed(futures):
-                code = futures[future]
-                processed += 1
+                chunk = futures[future]
+                processed += len(chunk)
 
                 try:
                     results = future.result()
@@ -206,15 +304,18 @@ class StockScreener:
                         self.results.extend(results)
                         passed += len(results)
 
-                    # 진행률 로깅 (10% 단위)
-                    if processed % max(1, total // 10) == 0:
-                        log_info(f"진행: {processed}/{total} ({processed / total * 100:.1f}%)")
+                    if processed >= next_log:
+                        log_info(f"진행: {processed}/{remaining} ({processed / remaining * 100:.1f}%)")
+                        while next_log <= processed:
+                            next_log += log_step
 
                 except Exception as e:
-                    log_error(f"스크리닝 오류 [{code}]: {e}")
+                    log_error(f"스크리닝 오류 [{chunk[0][0]}~{chunk[-1][0]}]: {e}")
 
-        # 결과 정렬 (score 기준 내림차순)
-        self.results.sort(key=lambda x: x.score, reverse=True)
+        # 결과 정렬 (score 기준 내림차순, 동점은 기존 순서 유지)
+        scores = np.fromiter((r.score for r in self.results), dtype=np.float64,
+                             count=len(self.results))
+        self.results = [self.results[i] for i in np.argsort(-scores, kind='stable')]
 
         log_screening(
             strategy="ALL",
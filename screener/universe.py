@@ -0,0 +1,198 @@
+"""
+전 종목 유니버스 모듈
+종목별 DataFrame 묶음을 필드별 (종목 수, 기간) 패널로 보관 (SoA 구조)
+
+사전 필터는 패널 열 연산으로 전 종목을 한 번에 평가하고,
+통과 종목만 원본 DataFrame으로 전략을 적용한다.
+일괄 조회 결과(from_ohlcv)로 만들면 종목별 DataFrame은 통과 종목에 한해 생성한다.
+"""
+
+from dataclasses import dataclass
+from typing import List, Dict, Any, Callable, Optional
+
+import numpy as np
+import pandas as pd
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from screener.filters import PANEL_FIELDS, build_panels
+
+# 기본 패널 기간 (52주 거래일 + 여유)
+DEFAULT_UNIVERSE_DAYS = 260
+
+
+@dataclass
+class UniverseFrame:
+    """
+    전 종목 OHLCV 패널
+
+    panels의 필드별 배열은 (종목 수, n_days) Fortran order이며,
+    데이터가 짧은 종목은 앞부분이 NaN으로 채워진다 (최근 값이 마지막 열).
+    가격 패널은 기본 float32로 저장해 메모리 대역폭을 절반으로 줄인다
+    (원 단위 호가는 1,600만원 미만까지 float32로 정확히 표현됨).
+    """
+    codes: List[str]
+    names: List[str]
+    frames: List[Optional[pd.DataFrame]]
+    panels: Dict[str, np.ndarray]
+    frame_loader: Optional[Callable[[int], pd.DataFrame]] = None  # frames[i]가 None일 때 생성
+
+    @classmethod
+    def from_stock_data(cls, stock_data: Dict[str, Dict[str, Any]],
+                        n_days: int = DEFAULT_UNIVERSE_DAYS,
+                        price_dtype=np.float32) -> 'UniverseFrame':
+        """
+        스크리닝 입력 딕셔너리로 유니버스 생성
+
+        Args:
+            stock_data: {code: {'df': DataFrame, 'name': str}} 형태
+            n_days: 패널 기간 (종목별 최근 n_days행만 적재)
+            price_dtype: 가격 패널 자료형 (정확한 값이 필요하면 np.float64)
+
+        Returns:
+            UniverseFrame (데이터가 없는 종목 제외)
+        """
+        codes, names, frames = [], [], []
+        for code, data in stock_data.items():
+            df = data.get('df')
+            if df is None or df.empty:
+                continue
+            codes.append(code)
+            names.append(data.get('name', code))
+            frames.append(df)
+
+        return cls(codes, names, frames, build_panels(frames, n_days, price_dtype))
+
+    @classmethod
+    def from_ohlcv(cls, ohlcv: pd.DataFrame, names: Dict[str, str] = None,
+                   n_days: int = DEFAULT_UNIVERSE_DAYS, min_rows: int = 1,
+                   price_dtype=np.float32,
+                   transform: Optional[Callable[[str, pd.DataFrame], pd.DataFrame]] = None
+                   ) -> 'UniverseFrame':
+        """
+        여러 종목 일봉 일괄 조회 결과로 유니버스 생성 (종목별 DataFrame 생성 없음)
+
+        컬럼 배열을 종목/열 위치로 한 번에 흩뿌려 패널을 채우고,
+        종목별 DataFrame은 frame()으로 요청될 때만 잘라서 만든다.
+
+        Args:
+            ohlcv: code 컬럼을 포함한 일봉 DataFrame (종목별 행이 연속, 날짜순 정렬,
+                   DatabaseManager.get_daily_ohlcv_bulk() 결과)
+            names: {종목코드: 종목명} (없으면 코드 사용)
+            n_days: 패널 기간
+            min_rows: 최소 행 수 (미달 종목 제외)
+            price_dtype: 가격 패널 자료형
+            transform: 종목 DataFrame 생성 시 적용할 함수 (code, df) → df
+                       (예: 캐시 지표 병합 load_or_compute)
+
+        Returns:
+            UniverseFrame
+        """
+        names = names or {}
+        n_days = max(int(n_days), 1)
+        if ohlcv.empty:
+            return cls([], [], [], build_panels([], n_days, price_dtype))
+
+        code_values = ohlcv['code'].to_numpy()
+        total = len(code_values)
+        starts = np.flatnonzero(np.r_[True, code_values[1:] != code_values[:-1]])
+        ends = np.r_[starts[1:], total]
+        keep = (ends - starts) >= min_rows
+        rows = np.flatnonzero(np.repeat(keep, ends - starts))
+        starts, ends = starts[keep], ends[keep]
+        lengths = (ends - starts).astype(np.int64)
+        n = len(starts)
+
+        # 행별 (종목 번호, 패널 열 위치): 최근 n_days행만 우측 정렬
+        row_stock = np.repeat(np.arange(n), lengths)
+        row_col = n_days - np.repeat(ends, lengths) + rows
+        valid = row_col >= 0
+        row_stock, row_col, rows = row_stock[valid], row_col[valid], rows[valid]
+
+        col_lower = {c.lower(): c for c in ohlcv.columns if isinstance(c, str)}
+        panels = {}
+        for f in PANEL_FIELDS:
+            dtype = np.float64 if f == 'volume' else price_dtype
+            panel = np.full((n, n_days), np.nan, dtype=dtype, order='F')
+            if f in col_lower:
+                panel[row_stock, row_col] = ohlcv[col_lower[f]].to_numpy(dtype=np.float64)[rows]
+            panels[f] = panel
+        panels['length'] = lengths
+
+        codes = [str(c) for c in code_values[starts]]
+        data = ohlcv.drop(columns='code')
+
+        def load(i: int) -> pd.DataFrame:
+            df = data.iloc[starts[i]:ends[i]]
+            return transform(codes[i], df) if transform else df
+
+        return cls(codes, [names.get(c, c) for c in codes], [None] * n, panels, load)
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    @property
+    def n_days(self) -> int:
+        """패널 기간"""
+        return self.panels['close'].shape[1]
+
+    @property
+    def close(self) -> np.ndarray:
+        """종가 패널"""
+        return self.panels['close']
+
+    @property
+    def volume(self) -> np.ndarray:
+        """거래량 패널"""
+        return self.panels['volume']
+
+    @property
+    def lengths(self) -> np.ndarray:
+        """종목별 실제 행 수"""
+        return self.panels['length']
+
+    def frame(self, i: int) -> pd.DataFrame:
+        """i번째 종목 DataFrame (처음 요청 시 생성)"""
+        df = self.frames[i]
+        if df is None:
+            df = self.frame_loader(i)
+            self.frames[i] = df
+        return df
+
+    def panels_for(self, lookback: int) -> Dict[str, np.ndarray]:
+        """
+        lookback 기간 이상을 담은 패널 반환
+
+        보관 중인 패널이 짧으면 원본 DataFrame으로 다시 적재한다.
+
+        Args:
+            lookback: 필요한 최대 조회 기간
+
+        Returns:
+            build_panels() 형식의 패널 딕셔너리
+        """
+        if self.n_days >= lookback:
+            return self.panels
+        frames = [self.frame(i) for i in range(len(self))]
+        return build_panels(frames, lookback, self.close.dtype)
+
+    def items(self, mask: np.ndarray = None) -> List[tuple]:
+        """
+        종목 목록
+
+        Args:
+            mask: 선택할 종목 불리언 배열 (None이면 전체)
+
+        Returns:
+            [(code, df, name), ...]
+        """
+        indices = range(len(self)) if mask is None else np.flatnonzero(mask)
+        return [(self.codes[i], self.frame(i), self.names[i]) for i in indices]
+
+
+__all__ = [
+    'DEFAULT_UNIVERSE_DAYS',
+    'UniverseFrame',
+]
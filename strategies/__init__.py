@@ -5,6 +5,7 @@ PDF 기반 매매 전략 구현
 
 from .base_strategy import (
     Signal,
+    IndicatorCache,
     BaseStrategy,
     register_strategy,
     get_strategy,
@@ -20,6 +21,7 @@ from .breakout_strategy import BreakoutStrategy
 __all__ = [
     # Base
     'Signal',
+    'IndicatorCache',
     'BaseStrategy',
     'register_strategy',
     'get_strategy',
@@ -0,0 +1,57 @@
+"""
+전략 커널 AOT 컴파일 스크립트
+
+전략 모듈의 JIT 커널을 시그니처 고정 확장 모듈로 미리 컴파일해
+실매매 프로세스 재시작 시 첫 신호 계산의 JIT 컴파일 지연을 제거한다.
+
+사용법:
+    python -m strategies._compile
+
+생성된 strategies/_strategy_kernels_aot.*.so 파일이 있으면
+각 전략 모듈이 자동으로 우선 사용한다 (플랫폼별로 빌드 필요).
+"""
+
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from numba.pycc import CC
+
+from strategies.breakout_strategy import _buy_conditions_njit
+
+AOT_MODULE_NAME = '_strategy_kernels_aot'
+
+# 기준봉 돌파 매수 조건: (기준봉 위치, 상승률, 거래량 비율, 조정, 돌파, 정배열, 거래량 증가)
+_BREAKOUT_RESULT = 'Tuple((i8, f8, f8, b1, b1, b1, b1))'
+
+# (내보낼 이름, 시그니처, 원본 커널)
+EXPORTS = [
+    ('breakout_buy_f8',
+     _BREAKOUT_RESULT + '(f8[:], f8[:], f8[:], f8[:], f8[:], i8, f8, f8, f8)',
+     _buy_conditions_njit),
+    ('breakout_buy_i8',
+     _BREAKOUT_RESULT + '(f8[:], f8[:], f8[:], f8[:], i8[:], i8, f8, f8, f8)',
+     _buy_conditions_njit),
+]
+
+
+def build(output_dir: Path = None) -> None:
+    """
+    AOT 확장 모듈 빌드
+
+    Args:
+        output_dir: 출력 디렉토리 (기본값: strategies/)
+    """
+    cc = CC(AOT_MODULE_NAME)
+    cc.output_dir = str(output_dir or Path(__file__).resolve().parent)
+    cc.verbose = True
+
+    for name, signature, kernel in EXPORTS:
+        cc.export(name, signature)(kernel.py_func)
+
+    cc.compile()
+
+
+if __name__ == '__main__':
+    build()
@@ -4,21 +4,26 @@
 """
 
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, Dict, Any, List
+from functools import cached_property
+from types import MappingProxyType
+from typing import Optional, Dict, Any, List, Tuple
+import numpy as np
 import pandas as pd
-from pathlib import Path
-import sys
-
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 from config import SignalType, TRADING
+from indicators import calculate_sma
+from indicators._views import get_views
+
+# 자주 비교/생성하는 신호 유형 (Enum 클래스 속성 조회 생략)
+_BUY = SignalType.BUY
 
 
-@dataclass
+@dataclass(slots=True)
 class Signal:
-    """매매 신호 데이터 클래스"""
+    """매매 신호 데이터 클래스 (__slots__ 사용, 인스턴스 __dict__ 없음)"""
     code: str                           # 종목 코드
     name: str                           # 종목명
     datetime: datetime                  # 신호 발생 시간
@@ -76,9 +81,96 @@ class Signal:
         return (self.take_profit - self.price) / self.price * 100
 
 
+def _nanmean(values: np.ndarray) -> float:
+    """결측 제외 평균 (pandas Series.mean()과 동일, 값이 없으면 NaN)"""
+    if values.dtype.kind == 'f':
+        values = values[~np.isnan(values)]
+    return float(values.mean()) if values.size else np.nan
+
+
+class IndicatorCache:
+    """
+    종목별 지표 캐시
+
+    한 종목을 여러 전략으로 평가할 때 이동평균/거래량 평균/52주 고저가를
+    처음 요청할 때만 계산하고 이후 전략은 저장된 값을 재사용한다.
+    """
+
+    WEEKS_52 = 252  # 52주 거래일 수
+
+    def __init__(self, arrs: Dict[str, np.ndarray]):
+        """
+        Args:
+            arrs: OHLCV 배열 딕셔너리 (get_views() 결과)
+        """
+        self.arrs = arrs
+        self._ma: Dict[int, float] = {}
+        self._vol_mean: Dict[int, float] = {}
+
+    @classmethod
+    def from_df(cls, df: pd.DataFrame) -> 'IndicatorCache':
+        """DataFrame의 OHLCV 뷰로 캐시 생성"""
+        return cls(get_views(df))
+
+    def ma(self, period: int) -> float:
+        """
+        종가 이동평균 마지막 값
+
+        calculate_sma(df, period).iloc[-1]과 같은 값 (결측 제외 평균)
+
+        Args:
+            period: 이동평균 기간
+
+        Returns:
+            이동평균 값 (종가가 없으면 NaN)
+        """
+        value = self._ma.get(period)
+        if value is None:
+            close = self.arrs.get('close')
+            value = _nanmean(close[-period:]) if close is not None else np.nan
+            self._ma[period] = value
+        return value
+
+    def vol_mean(self, days: int) -> float:
+        """
+        당일을 제외한 직전 days봉 평균 거래량
+
+        Args:
+            days: 평균 기간
+
+        Returns:
+            평균 거래량 (거래량이 없으면 NaN)
+        """
+        value = self._vol_mean.get(days)
+        if value is None:
+            volume = self.arrs.get('vol')
+            value = _nanmean(volume[-days - 1:-1]) if volume is not None else np.nan
+            self._vol_mean[days] = value
+        return value
+
+    @cached_property
+    def high_52w(self) -> float:
+        """52주 최고가 (결측 제외)"""
+        high = self.arrs.get('high')
+        if high is None or high.size == 0:
+            return np.nan
+        return float(np.fmax.reduce(high[-self.WEEKS_52:]))
+
+    @cached_property
+    def low_52w(self) -> float:
+        """52주 최저가 (결측 제외)"""
+        low = self.arrs.get('low')
+        if low is None or low.size == 0:
+            return np.nan
+        return float(np.fmin.reduce(low[-self.WEEKS_52:]))
+
+
 class BaseStrategy(ABC):
     """매매 전략 추상 베이스 클래스"""
 
+    # 백테스트 봉 주기 (None: 일봉 그대로, 'W-FRI': 주봉으로 변환 후 평가)
+    resample_freq: Optional[str] = None
+
     def __init__(self, name: str, params: Dict[str, Any] = None):
         """
         Args:
@@ -92,9 +184,58 @@ class BaseStrategy(ABC):
         self.default_stop_loss_pct = TRADING['default_stop_loss']
         self.default_take_profit_pct = TRADING['default_take_profit']
 
+        # 컬럼명 매핑 캐시 (columns 객체, 매핑)
+        self._col_cache: Tuple[Optional[pd.Index], Optional[Dict[str, str]]] = (None, None)
+
+    def _get_columns(self, df: pd.DataFrame) -> Dict[str, str]:
+        """
+        컬럼명 매핑
+
+        매핑은 컬럼 구성에만 의존하므로 마지막 columns 객체와 결과를 보관하고,
+        같은 columns로 다시 호출되면 저장된 매핑을 그대로 반환한다.
+        (columns 객체 참조를 유지하므로 id 재사용으로 잘못 적중하지 않음)
+        """
+        columns, mapping = self._col_cache
+        if columns is df.columns:
+            return mapping
+
+        col_lower = {c.lower(): c for c in df.columns}
+        mapping = {
+            'open': col_lower.get('open', 'Open'),
+            'high': col_lower.get('high', 'High'),
+            'low': col_lower.get('low', 'Low'),
+            'close': col_lower.get('close', 'Close'),
+            'volume': col_lower.get('volume', 'Volume'),
+        }
+        self._col_cache = (df.columns, mapping)
+        return mapping
+
+    @staticmethod
+    def _ma_array(df: pd.DataFrame, period: int) -> np.ndarray:
+        """
+        종가 이동평균 배열
+
+        df에 ma{period} 컬럼이 있으면 그 값을 쓰고, 없으면 종가로 계산한다.
+        봉 값이 제자리 수정될 수 있으므로 호출 간 캐시하지 않으며,
+        호출 측은 신호 생성 한 번에 한 번만 계산해 전달한다.
+
+        Args:
+            df: OHLCV DataFrame
+            period: 이동평균 기간
+
+        Returns:
+            float64 이동평균 배열
+        """
+        ma_col = f'ma{period}'
+        if ma_col in df.columns:
+            return df[ma_col].to_numpy(dtype=np.float64)
+        return calculate_sma(df, period).to_numpy(dtype=np.float64)
+
     @abstractmethod
     def generate_signal(self, df: pd.DataFrame, code: str = "",
-                        name: str = "") -> Optional[Signal]:
+                        name: str = "",
+                        cache: Optional[IndicatorCache] = None,
+                        as_of: Optional[datetime] = None) -> Optional[Signal]:
         """
         매매 신호 생성 (구현 필수)
 
@@ -102,12 +243,39 @@ class BaseStrategy(ABC):
             df: OHLCV DataFrame (이동평균 등 지표 포함)
             code: 종목 코드
             name: 종목명
+            cache: 종목 지표 캐시 (여러 전략이 공유, 없으면 df로 생성)
+            as_of: 신호 시각 (없으면 DatetimeIndex의 마지막 봉 시각, 그 외에는 현재 시각)
 
         Returns:
             Signal 객체 또는 None (신호 없음)
         """
         pass
 
+    @staticmethod
+    def _signal_time(df: pd.DataFrame, as_of: Optional[datetime] = None) -> datetime:
+        """
+        신호 시각 결정
+
+        백테스트처럼 과거 봉으로 신호를 만들 때는 봉 시각이 맞는 값이므로
+        호출 측이 넘긴 as_of, 없으면 DatetimeIndex의 마지막 봉 시각을 쓰고
+        둘 다 없을 때만 현재 시각을 조회한다.
+
+        Args:
+            df: OHLCV DataFrame
+            as_of: 호출 측이 지정한 신호 시각
+
+        Returns:
+            신호 시각
+        """
+        if as_of is not None:
+            return as_of
+        index = df.index
+        if isinstance(index, pd.DatetimeIndex) and len(index):
+            last = index[-1]
+            if last is not pd.NaT:
+                return last
+        return datetime.now()
+
     def check_buy_conditions(self, df: pd.DataFrame) -> bool:
         """
         매수 조건 확인 (서브클래스에서 구현)
@@ -144,9 +312,7 @@ class BaseStrategy(ABC):
         Returns:
             진입 가격 (기본값: 현재 종가)
         """
-        col_lower = {c.lower(): c for c in df.columns}
-        close_col = col_lower.get('close', 'Close')
-        return float(df[close_col].iloc[-1])
+        return float(get_views(df)['close'][-1])
 
     def calculate_stop_loss(self, df: pd.DataFrame,
                             entry_price: float) -> float:
@@ -186,21 +352,14 @@ class BaseStrategy(ABC):
         Returns:
             유효 여부
         """
-        if signal is None:
-            return False
-
-        # 가격 유효성
-        if signal.price <= 0:
-            return False
-
-        # 손절가 유효성 (매수 신호의 경우)
-        if signal.signal_type == SignalType.BUY:
-            if signal.stop_loss and signal.stop_loss >= signal.price:
-                return False
-            if signal.take_profit and signal.take_profit <= signal.price:
-                return False
-
-        return True
+        # 가격 유효성 + 손절가/익절가 유효성 (매수 신호의 경우, 미설정(None/0)은 통과)
+        return (
+            signal is not None
+            and not signal.price <= 0
+            and (signal.signal_type != _BUY
+                 or (not (signal.stop_loss and signal.stop_loss >= signal.price)
+                     and not (signal.take_profit and signal.take_profit <= signal.price)))
+        )
 
     def get_position_size(self, capital: float, risk_percent: float = 0.02,
                           entry_price: float = None,
@@ -234,8 +393,8 @@ class BaseStrategy(ABC):
             # 단순 최대 투자금 기반
             return int(max_investment / entry_price)
 
-    # 조건명 한글 매핑
-    CONDITION_NAMES_KR = {
+    # 조건명 한글 매핑 (읽기 전용)
+    CONDITION_NAMES_KR = MappingProxyType({
         # 상한가 전략 (limit_up)
         'recent_limit_up': '최근 상한가 기록',
         'price_support': '상한가 종가 지지',
@@ -260,7 +419,7 @@ class BaseStrategy(ABC):
         'price_above_ma60': '현재가 60선 위',
         'ma60_support': '60선 지지 확인',
         'bullish_candle': '양봉 마감',
-    }
+    })
 
     def get_signal_reason(self, conditions: Dict[str, bool]) -> str:
         """
@@ -272,13 +431,9 @@ class BaseStrategy(ABC):
         Returns:
             한글 사유 문자열
         """
-        met_conditions = []
-        for k, v in conditions.items():
-            if v:
-                # 한글 이름이 있으면 사용, 없으면 원본 사용
-                kr_name = self.CONDITION_NAMES_KR.get(k, k)
-                met_conditions.append(kr_name)
-        return ", ".join(met_conditions)
+        # 한글 이름이 있으면 사용, 없으면 원본 사용
+        names = self.CONDITION_NAMES_KR
+        return ", ".join(names.get(k, k) for k, v in conditions.items() if v)
 
     def get_params(self) -> Dict[str, Any]:
         """전략 파라미터 반환"""
@@ -297,10 +452,13 @@ class StrategyManager:
 
     def __init__(self):
         self.strategies: Dict[str, BaseStrategy] = {}
+        # 종목마다 순회하는 전략 목록 (등록 시에만 갱신, 순회는 튜플로)
+        self._strategy_tuple: tuple = ()
 
     def register(self, strategy: BaseStrategy) -> None:
         """전략 등록"""
         self.strategies[strategy.name] = strategy
+        self._strategy_tuple = tuple(self.strategies.values())
 
     def get(self, name: str) -> Optional[BaseStrategy]:
         """전략 조회"""
@@ -308,7 +466,7 @@ class StrategyManager:
 
     def get_all(self) -> List[BaseStrategy]:
         """모든 전략 조회"""
-        return list(self.strategies.values())
+        return list(self._strategy_tuple)
 
     def generate_all_signals(self, df: pd.DataFrame, code: str = "",
                              name: str = "") -> List[Signal]:
@@ -324,15 +482,66 @@ class StrategyManager:
             생성된 신호 리스트
         """
         signals = []
-        for strategy in self.strategies.values():
+        # 모든 전략이 같은 지표 캐시를 공유
+        cache = IndicatorCache.from_df(df)
+        for strategy in self._strategy_tuple:
             try:
-                signal = strategy.generate_signal(df, code, name)
+                signal = strategy.generate_signal(df, code, name, cache=cache)
                 if signal and strategy.validate_signal(signal):
                     signals.append(signal)
             except Exception as e:
                 print(f"Error in strategy {strategy.name}: {e}")
         return signals
 
+    def _signals_for_chunk(self, chunk: List[tuple]) -> List[tuple]:
+        """
+        종목 묶음 신호 생성 (작업 단위, 워커 스레드/프로세스에서 실행)
+
+        Args:
+            chunk: [(code, df, name), ...]
+
+        Returns:
+            [(code, 신호 리스트), ...]
+        """
+        return [(code, self.generate_all_signals(df, code, name))
+                for code, df, name in chunk]
+
+    def generate_all_signals_batch(self, data: Dict[str, pd.DataFrame],
+                                   names: Optional[Dict[str, str]] = None,
+                                   max_workers: int = 4, chunk_size: int = 200,
+                                   use_processes: bool = False) -> Dict[str, List[Signal]]:
+        """
+        여러 종목에 대해 모든 전략으로 신호 생성
+
+        종목을 chunk_size개씩 묶어 작업 하나로 제출한다 (작업 제출 비용 분산).
+        전략 평가에 pandas 연산이 남아 있어 스레드로는 GIL에 묶이므로,
+        종목이 많을 때는 use_processes=True로 프로세스 병렬 처리를 사용할 수 있다.
+
+        Args:
+            data: {종목 코드: OHLCV DataFrame}
+            names: {종목 코드: 종목명} (없으면 빈 문자열)
+            max_workers: 병렬 처리 워커 수 (1 이하면 현재 스레드에서 순차 처리)
+            chunk_size: 작업 하나에 담을 종목 수
+            use_processes: 프로세스 풀 사용 여부 (기본: 스레드 풀)
+
+        Returns:
+            {종목 코드: 신호 리스트} (data와 같은 종목 순서)
+        """
+        names = names or {}
+        items = [(code, df, names.get(code, "")) for code, df in data.items()]
+        chunk_size = max(1, chunk_size)
+        chunks = [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+
+        if max_workers <= 1 or len(chunks) <= 1:
+            pairs = [pair for chunk in chunks for pair in self._signals_for_chunk(chunk)]
+        else:
+            executor_cls = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+            with executor_cls(max_workers=max_workers) as executor:
+                results = executor.map(self._signals_for_chunk, chunks)
+                pairs = [pair for chunk_pairs in results for pair in chunk_pairs]
+
+        return dict(pairs)
+
 
 # 전역 전략 관리자
 strategy_manager = StrategyManager()
@@ -353,5 +562,5 @@ def get_all_strategies() -> List[BaseStrategy]:
     return strategy_manager.get_all()
 
 
-# 전략 레지스트리 (하위 호환성)
+# 전략 레지스트리 (하위 호환성, 조회용 - 등록은 register_strategy() 사용)
 STRATEGY_REGISTRY = strategy_manager.strategies
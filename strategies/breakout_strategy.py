@@ -3,19 +3,185 @@
 PDF 기준: 거래량 터진 기준봉 → 눌림 후 돌파 매수
 """
 
+import numpy as np
 import pandas as pd
 from datetime import datetime
 from typing import Optional, Dict, Any, Tuple
-from pathlib import Path
-import sys
-
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 from config import SignalType, BreakoutStrategyParams
-from strategies.base_strategy import BaseStrategy, Signal, register_strategy
-from indicators import (
-    calculate_sma,
+from .base_strategy import (
+    BaseStrategy, IndicatorCache, Signal, register_strategy, _nanmean,
 )
+from indicators._numba_kernels import njit
+from indicators._views import get_clean_view, get_views
+
+try:
+    from bottleneck import move_mean
+except ImportError:  # pragma: no cover - bottleneck 미설치 환경
+    move_mean = None
+
+# 자주 비교/생성하는 신호 유형 (Enum 클래스 속성 조회 생략)
+_BUY = SignalType.BUY
+
+
+def _tail_sma(values: np.ndarray, window: int, n: int,
+              min_periods: int = 1) -> np.ndarray:
+    """
+    마지막 n개 위치의 단순이동평균 (누적합 기반)
+
+    rolling(window, min_periods).mean()의 마지막 n개 값과 동일하며
+    필요한 꼬리 구간(n + window - 1개)만 읽는다. 결측은 제외하고 평균낸다.
+    bottleneck이 설치되어 있으면 move_mean(C 구현)을 사용한다.
+
+    Args:
+        values: 가격/거래량 배열
+        window: 이동평균 기간
+        n: 계산할 마지막 위치 수
+        min_periods: 평균을 내기 위한 최소 유효값 수 (미만이면 NaN)
+
+    Returns:
+        길이 min(n, len(values))의 float64 배열
+    """
+    start = max(values.size - n, 0)
+    head = max(start - window + 1, 0)
+    if move_mean is not None:
+        tail = values[head:]
+        if tail.size < min_periods:
+            return np.full(tail.size - (start - head), np.nan)
+        # 배열보다 긴 기간은 허용되지 않음 (전체 길이 기간과 결과 동일)
+        window = min(window, tail.size)
+        return move_mean(tail, window, min_count=min_periods)[start - head:]
+
+    tail = values[head:].astype(np.float64)
+    valid = ~np.isnan(tail)
+
+    csum = np.zeros(tail.size + 1)
+    np.cumsum(np.where(valid, tail, 0.0), out=csum[1:])
+    count = np.zeros(tail.size + 1, dtype=np.int64)
+    np.cumsum(valid, out=count[1:])
+
+    upper = np.arange(start - head + 1, tail.size + 1)
+    lower = np.maximum(upper - window, 0)
+    n_valid = count[upper] - count[lower]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        sma = (csum[upper] - csum[lower]) / n_valid
+    return np.where(n_valid >= min_periods, sma, np.nan)
+
+
+@njit(cache=True)
+def _buy_conditions_njit(open_, high, low, close, volume, lookback,
+                         candle_thr, spike_ratio, breakout_thr):
+    """
+    기준봉 돌파 매수 조건 수치 계산
+
+    Args:
+        open_, high, low, close: float64 가격 배열 (결측 없음)
+        volume: 거래량 배열 (float64 또는 int64)
+        lookback: 기준봉 탐색 기간
+        candle_thr: 기준봉 상승률 기준
+        spike_ratio: 기준봉 거래량 배수 (20일 평균 대비)
+        breakout_thr: 기준봉 고가 돌파 여유율
+
+    Returns:
+        (기준봉 위치(-1: 없음), 기준봉 상승률, 기준봉 거래량 비율,
+         조정, 돌파, 정배열, 거래량 증가)
+    """
+    n = close.size
+    start = max(n - lookback, 0)
+    end = n - 2
+
+    # 1. 기준봉: 20일 거래량 합을 한 칸씩 갱신하며 앞에서부터 탐색
+    ref_idx = -1
+    change_rate = 0.0
+    vol_ratio = 0.0
+    if start < end:
+        vsum = 0.0
+        for j in range(max(start - 20, 0), start):
+            vsum += volume[j]
+        for j in range(start, end):
+            vsum += volume[j]
+            if j >= 20:
+                vsum -= volume[j - 20]
+            count = min(j + 1, 20)
+            vma = vsum / count if count >= 5 else np.nan
+
+            o = open_[j]
+            c = close[j]
+            if o != 0.0:
+                chg = (c - o) / o
+            else:
+                chg = np.inf if c > o else -np.inf
+            ratio = volume[j] / vma if vma > 0 else 0.0
+
+            if chg >= candle_thr and ratio >= spike_ratio:
+                ref_idx = j
+                change_rate = chg
+                vol_ratio = ratio
+                break
+
+    if ref_idx < 0:
+        return ref_idx, change_rate, vol_ratio, False, False, False, False
+
+    ref_high = high[ref_idx]
+    ref_low = low[ref_idx]
+
+    # 2. 조정: 기준봉 이후 거래량 감소 + 기준봉 범위 내 가격
+    consolidation = False
+    after = n - ref_idx - 1
+    if after >= 2:
+        vsum = 0.0
+        in_range = True
+        for j in range(ref_idx + 1, n):
+            vsum += volume[j]
+            if high[j] > ref_high * 1.02 or low[j] < ref_low * 0.98:
+                in_range = False
+        consolidation = vsum / after < volume[ref_idx] * 0.7 and in_range
+
+    # 3. 돌파: 현재 종가 > 기준봉 고가 + 여유율
+    breakout = close[n - 1] > ref_high * (1 + breakout_thr)
+
+    # 4. 정배열: 5일 > 20일 > 60일 (데이터 부족시 통과)
+    ma_alignment = True
+    if n >= 60:
+        s5 = 0.0
+        s20 = 0.0
+        s60 = 0.0
+        for k in range(1, 61):
+            c = close[n - k]
+            s60 += c
+            if k <= 20:
+                s20 += c
+            if k <= 5:
+                s5 += c
+        ma_alignment = s5 / 5 > s20 / 20 and s20 / 20 > s60 / 60
+
+    # 5. 거래량 증가: 오늘 거래량 > 직전 5일 평균 * 1.5
+    volume_increase = False
+    if n >= 6:
+        vsum = 0.0
+        for j in range(n - 6, n - 1):
+            vsum += volume[j]
+        volume_increase = volume[n - 1] > vsum / 5 * 1.5
+
+    return (ref_idx, change_rate, vol_ratio,
+            consolidation, breakout, ma_alignment, volume_increase)
+
+
+# AOT 컴파일 모듈 (python -m strategies._compile)
+try:
+    from . import _strategy_kernels_aot as _aot
+except ImportError:
+    _aot = None
+
+if _aot is not None:
+    def _buy_conditions_kernel(open_, high, low, close, volume, lookback,
+                               candle_thr, spike_ratio, breakout_thr):
+        """AOT 매수 조건 커널 (거래량 dtype별 시그니처 선택)"""
+        kernel = _aot.breakout_buy_i8 if volume.dtype == np.int64 else _aot.breakout_buy_f8
+        return kernel(open_, high, low, close, volume, int(lookback),
+                      float(candle_thr), float(spike_ratio), float(breakout_thr))
+else:
+    _buy_conditions_kernel = _buy_conditions_njit
 
 
 class BreakoutStrategy(BaseStrategy):
@@ -42,83 +208,87 @@ class BreakoutStrategy(BaseStrategy):
     - 거래량 급증 후 음봉 출현
     """
 
+    # 기본 파라미터 딕셔너리 (첫 인스턴스 생성 시 한 번만 구성, 파라미터 탐색용)
+    _DEFAULT_PARAMS: Optional[Dict[str, Any]] = None
+
+    @classmethod
+    def _default_params(cls) -> Dict[str, Any]:
+        """BreakoutStrategyParams 기본값을 전략 파라미터 딕셔너리로 변환 (캐시)"""
+        if cls._DEFAULT_PARAMS is None:
+            default_params = BreakoutStrategyParams()
+            cls._DEFAULT_PARAMS = {
+                'reference_candle_threshold': default_params.reference_candle_threshold,
+                'volume_spike_ratio': default_params.volume_spike_ratio,
+                'lookback_days': default_params.lookback_days,
+                'consolidation_days_min': default_params.consolidation_days[0],
+                'consolidation_days_max': default_params.consolidation_days[1],
+                'breakout_threshold': default_params.breakout_threshold,
+            }
+        return cls._DEFAULT_PARAMS
+
     def __init__(self, params: Dict[str, Any] = None):
-        default_params = BreakoutStrategyParams()
-        strategy_params = {
-            'reference_candle_threshold': default_params.reference_candle_threshold,
-            'volume_spike_ratio': default_params.volume_spike_ratio,
-            'lookback_days': default_params.lookback_days,
-            'consolidation_days_min': default_params.consolidation_days[0],
-            'consolidation_days_max': default_params.consolidation_days[1],
-            'breakout_threshold': default_params.breakout_threshold,
-        }
+        # 인스턴스별 파라미터는 복사본 (set_params가 기본값을 바꾸지 않도록)
+        strategy_params = self._default_params().copy()
         if params:
             strategy_params.update(params)
 
         super().__init__(name='breakout', params=strategy_params)
 
-    def _get_columns(self, df: pd.DataFrame) -> Dict[str, str]:
-        """컬럼명 매핑"""
-        col_lower = {c.lower(): c for c in df.columns}
-        return {
-            'open': col_lower.get('open', 'Open'),
-            'high': col_lower.get('high', 'High'),
-            'low': col_lower.get('low', 'Low'),
-            'close': col_lower.get('close', 'Close'),
-            'volume': col_lower.get('volume', 'Volume'),
-        }
-
-    def _find_reference_candle(self, df: pd.DataFrame) -> Optional[Tuple[int, Dict]]:
+    def _find_reference_candle(self, arrs: Dict[str, np.ndarray]) -> Optional[Tuple[int, Dict]]:
         """
         기준봉 찾기 (거래량 급증 + 큰 상승)
 
+        Args:
+            arrs: OHLCV 배열 딕셔너리 (get_views() 결과)
+
         Returns:
             (인덱스 위치, 기준봉 정보) 또는 None
         """
-        cols = self._get_columns(df)
         lookback = self.params['lookback_days']
         candle_threshold = self.params['reference_candle_threshold']
         volume_ratio = self.params['volume_spike_ratio']
 
-        # 거래량 이동평균 계산 (20일)
-        volume_ma = df[cols['volume']].rolling(window=20, min_periods=5).mean()
-
-        # 최근 lookback일 내에서 기준봉 찾기
-        for i in range(-lookback, -2):  # 최근 2일은 제외 (조정 기간 필요)
-            try:
-                idx = len(df) + i
-                open_price = df[cols['open']].iloc[i]
-                close_price = df[cols['close']].iloc[i]
-                high_price = df[cols['high']].iloc[i]
-                low_price = df[cols['low']].iloc[i]
-                volume = df[cols['volume']].iloc[i]
-
-                # 상승률 계산
-                change_rate = (close_price - open_price) / open_price
-
-                # 거래량 비율 계산
-                vol_ma = volume_ma.iloc[i]
-                vol_ratio = volume / vol_ma if vol_ma > 0 else 0
-
-                # 기준봉 조건: 상승률 5% 이상 + 거래량 3배 이상
-                if change_rate >= candle_threshold and vol_ratio >= volume_ratio:
-                    return (idx, {
-                        'index': idx,
-                        'open': open_price,
-                        'high': high_price,
-                        'low': low_price,
-                        'close': close_price,
-                        'volume': volume,
-                        'change_rate': change_rate,
-                        'volume_ratio': vol_ratio,
-                        'body': close_price - open_price,
-                    })
-            except IndexError:
-                continue
-
-        return None
-
-    def _check_consolidation(self, df: pd.DataFrame, ref_candle: Dict) -> bool:
+        # 최근 lookback일 구간 (최근 2일은 제외, 조정 기간 필요)
+        open_ = arrs['open']
+        close = arrs['close']
+        volume = arrs['vol']
+
+        start = max(len(close) - lookback, 0)
+        end = len(close) - 2
+        if start >= end:
+            return None
+
+        # 거래량 이동평균 (20일, 탐색 구간 위치만 계산)
+        vol_ma = _tail_sma(volume[:end], 20, end - start, min_periods=5)
+
+        # 상승률 / 거래량 비율을 구간 전체에 대해 한 번에 계산
+        window = slice(start, end)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            change_rate = (close[window] - open_[window]) / open_[window]
+            vol_ratio = np.where(vol_ma > 0, volume[window] / vol_ma, 0.0)
+
+        # 기준봉 조건: 상승률 5% 이상 + 거래량 3배 이상 (가장 오래된 봉 우선)
+        hits = np.flatnonzero((change_rate >= candle_threshold) & (vol_ratio >= volume_ratio))
+        if hits.size == 0:
+            return None
+
+        k = hits[0]
+        idx = start + int(k)
+        open_price = open_[idx]
+        close_price = close[idx]
+        return (idx, {
+            'index': idx,
+            'open': open_price,
+            'high': arrs['high'][idx],
+            'low': arrs['low'][idx],
+            'close': close_price,
+            'volume': volume[idx],
+            'change_rate': change_rate[k],
+            'volume_ratio': vol_ratio[k],
+            'body': close_price - open_price,
+        })
+
+    def _check_consolidation(self, arrs: Dict[str, np.ndarray], ref_candle: Dict) -> bool:
         """
         기준봉 이후 조정(눌림) 확인
 
@@ -127,76 +297,124 @@ class BreakoutStrategy(BaseStrategy):
         - 가격이 기준봉 고가를 넘지 않음
         - 가격이 기준봉 저가를 이탈하지 않음
         """
-        cols = self._get_columns(df)
         ref_idx = ref_candle['index']
         ref_high = ref_candle['high']
         ref_low = ref_candle['low']
 
-        # 기준봉 이후 데이터
-        after_ref = df.iloc[ref_idx + 1:]
+        # 기준봉 이후 구간 (배열 슬라이스, DataFrame 생성 없음)
+        after_ref = slice(ref_idx + 1, None)
+        volume_after = arrs['vol'][after_ref]
 
-        if len(after_ref) < 2:
+        if len(volume_after) < 2:
             return False
 
         # 거래량 감소 확인 (기준봉 대비 50% 이하)
-        avg_vol_after = after_ref[cols['volume']].mean()
+        avg_vol_after = _nanmean(volume_after)
         vol_decreased = avg_vol_after < ref_candle['volume'] * 0.7
 
         # 가격이 기준봉 범위 내에서 조정
-        highs_after = after_ref[cols['high']]
-        lows_after = after_ref[cols['low']]
-
-        price_in_range = (highs_after <= ref_high * 1.02).all() and \
-                         (lows_after >= ref_low * 0.98).all()
+        price_in_range = bool((arrs['high'][after_ref] <= ref_high * 1.02).all()) and \
+                         bool((arrs['low'][after_ref] >= ref_low * 0.98).all())
 
         return vol_decreased and price_in_range
 
-    def _check_breakout(self, df: pd.DataFrame, ref_candle: Dict) -> bool:
+    def _check_breakout(self, arrs: Dict[str, np.ndarray], ref_candle: Dict) -> bool:
         """
         기준봉 고가 돌파 확인
         """
-        cols = self._get_columns(df)
-        current_close = df[cols['close']].iloc[-1]
+        current_close = arrs['close'][-1]
         ref_high = ref_candle['high']
         threshold = self.params['breakout_threshold']
 
         # 현재 종가가 기준봉 고가 + 1% 이상
         return current_close > ref_high * (1 + threshold)
 
-    def _check_ma_alignment(self, df: pd.DataFrame) -> bool:
+    def _check_ma_alignment(self, arrs: Dict[str, np.ndarray],
+                            cache: Optional[IndicatorCache] = None) -> bool:
         """
         이동평균선 정배열 확인 (5일 > 20일 > 60일)
         """
-        cols = self._get_columns(df)
-
-        if len(df) < 60:
+        if len(arrs['close']) < 60:
             return True  # 데이터 부족시 조건 통과
 
-        ma5 = calculate_sma(df, 5, cols['close'])
-        ma20 = calculate_sma(df, 20, cols['close'])
-        ma60 = calculate_sma(df, 60, cols['close'])
+        cache = cache or IndicatorCache(arrs)
 
-        # 현재 정배열 확인
-        return ma5.iloc[-1] > ma20.iloc[-1] > ma60.iloc[-1]
+        # 현재 정배열 확인 (마지막 이동평균 값만 필요)
+        return cache.ma(5) > cache.ma(20) > cache.ma(60)
 
-    def _check_volume_increase(self, df: pd.DataFrame) -> bool:
+    def _check_volume_increase(self, arrs: Dict[str, np.ndarray],
+                               cache: Optional[IndicatorCache] = None) -> bool:
         """
         돌파 시 거래량 증가 확인
         """
-        cols = self._get_columns(df)
-
-        if len(df) < 6:
+        if len(arrs['vol']) < 6:
             return False
 
+        cache = cache or IndicatorCache(arrs)
+
         # 최근 5일 평균 거래량
-        recent_avg = df[cols['volume']].iloc[-6:-1].mean()
-        current_vol = df[cols['volume']].iloc[-1]
+        recent_avg = cache.vol_mean(5)
+        current_vol = cache.arrs['vol'][-1]
 
         # 오늘 거래량이 최근 평균의 1.5배 이상
         return current_vol > recent_avg * 1.5
 
-    def check_buy_conditions(self, df: pd.DataFrame) -> Dict[str, Any]:
-        """매수 조건 확인"""
+    def check_buy_conditions(self, df: pd.DataFrame,
+                             cache: Optional[IndicatorCache] = None) -> Dict[str, Any]:
+        """
+        매수 조건 확인
+
+        Args:
+            df: OHLCV DataFrame (일봉)
+            cache: 종목 지표 캐시 (있으면 캐시의 OHLCV 배열을 그대로 사용)
+        """
+        arrays = [get_clean_view(df, name) for name in ('open', 'high', 'low', 'close', 'vol')]
+        if any(arr is None for arr in arrays):
+            arrs = cache.arrs if cache is not None else get_views(df)
+            return self._check_buy_conditions_pandas(arrs, cache)
+
+        (ref_idx, change_rate, vol_ratio, consolidation, breakout,
+         ma_alignment, volume_increase) = _buy_conditions_kernel(
+            *arrays,
+            self.params['lookback_days'],
+            self.params['reference_candle_threshold'],
+            self.params['volume_spike_ratio'],
+            self.params['breakout_threshold'],
+        )
+
+        if ref_idx < 0:
+            return {
+                'reference_candle': False,
+                'consolidation': False,
+                'breakout': False,
+                'ma_alignment': False,
+                'volume_increase': False,
+            }
+
+        open_, high, low, close, volume = arrays
+        ref_candle = {
+            'index': ref_idx,
+            'open': open_[ref_idx],
+            'high': high[ref_idx],
+            'low': low[ref_idx],
+            'close': close[ref_idx],
+            'volume': volume[ref_idx],
+            'change_rate': change_rate,
+            'volume_ratio': vol_ratio,
+            'body': close[ref_idx] - open_[ref_idx],
+        }
+        conditions = {
+            'reference_candle': True,
+            'consolidation': consolidation,
+            'breakout': breakout,
+            'ma_alignment': ma_alignment,
+            'volume_increase': volume_increase,
+        }
+        return {**conditions, 'metadata': {'reference_candle': ref_candle}}
+
+    def _check_buy_conditions_pandas(self, arrs: Dict[str, np.ndarray],
+                                     cache: Optional[IndicatorCache] = None) -> Dict[str, Any]:
+        """매수 조건 확인 (결측치가 있는 데이터용 경로, 결측 제외 평균 사용)"""
         conditions = {
             'reference_candle': False,
             'consolidation': False,
@@ -207,7 +425,7 @@ class BreakoutStrategy(BaseStrategy):
         metadata = {}
 
         # 1. 기준봉 찾기
-        result = self._find_reference_candle(df)
+        result = self._find_reference_candle(arrs)
         if not result:
             return conditions
 
@@ -216,21 +434,23 @@ class BreakoutStrategy(BaseStrategy):
         metadata['reference_candle'] = ref_candle
 
         # 2. 조정 기간 확인
-        conditions['consolidation'] = self._check_consolidation(df, ref_candle)
+        conditions['consolidation'] = self._check_consolidation(arrs, ref_candle)
 
         # 3. 돌파 확인
-        conditions['breakout'] = self._check_breakout(df, ref_candle)
+        conditions['breakout'] = self._check_breakout(arrs, ref_candle)
 
         # 4. 이동평균선 정배열 확인
-        conditions['ma_alignment'] = self._check_ma_alignment(df)
+        conditions['ma_alignment'] = self._check_ma_alignment(arrs, cache)
 
         # 5. 돌파 시 거래량 증가 확인
-        conditions['volume_increase'] = self._check_volume_increase(df)
+        conditions['volume_increase'] = self._check_volume_increase(arrs, cache)
 
         return {**conditions, 'metadata': metadata}
 
     def generate_signal(self, df: pd.DataFrame, code: str = "",
-                        name: str = "") -> Optional[Signal]:
+                        name: str = "",
+                        cache: Optional[IndicatorCache] = None,
+                        as_of: Optional[datetime] = None) -> Optional[Signal]:
         """
         매매 신호 생성
 
@@ -238,6 +458,8 @@ class BreakoutStrategy(BaseStrategy):
             df: OHLCV DataFrame (일봉)
             code: 종목 코드
             name: 종목명
+            cache: 종목 지표 캐시 (여러 전략이 공유, 없으면 df로 생성)
+            as_of: 신호 시각 (없으면 DatetimeIndex의 마지막 봉 시각, 그 외에는 현재 시각)
 
         Returns:
             Signal 또는 None
@@ -245,8 +467,17 @@ class BreakoutStrategy(BaseStrategy):
         if len(df) < 20:  # 최소 데이터 필요
             return None
 
+        # 사전 차단 (배열 값 3개만 읽음):
+        # 돌파(종가 > 기준봉 고가 * (1 + 여유율))와 조정(기준봉 이후 고가 <= 기준봉 고가 * 1.02)이
+        # 함께 성립하려면 기준봉 이후인 최근 2봉의 고가가 아래 한도보다 낮아야 한다
+        arrs = cache.arrs if cache is not None else get_views(df)
+        high = arrs['high']
+        high_limit = arrs['close'][-1] * 1.02 / (1 + self.params['breakout_threshold'])
+        if not (high[-1] < high_limit and high[-2] < high_limit):
+            return None
+
         # 매수 조건 확인
-        result = self.check_buy_conditions(df)
+        result = self.check_buy_conditions(df, cache)
         metadata = result.pop('metadata', {})
 
         # 핵심 조건 충족 확인
@@ -259,8 +490,7 @@ class BreakoutStrategy(BaseStrategy):
         if not any(result[c] for c in aux_conditions):
             return None
 
-        cols = self._get_columns(df)
-        entry_price = df[cols['close']].iloc[-1]
+        entry_price = arrs['close'][-1]
 
         # 기준봉 정보
         ref_candle = metadata.get('reference_candle', {})
@@ -280,8 +510,8 @@ class BreakoutStrategy(BaseStrategy):
         return Signal(
             code=code,
             name=name,
-            datetime=datetime.now(),
-            signal_type=SignalType.BUY,
+            datetime=self._signal_time(df, as_of),
+            signal_type=_BUY,
             strategy=self.name,
             price=entry_price,
             stop_loss=stop_loss,
@@ -301,8 +531,7 @@ class BreakoutStrategy(BaseStrategy):
         """
         매도/손절 조건 확인
         """
-        cols = self._get_columns(df)
-        current_price = df[cols['close']].iloc[-1]
+        current_price = get_views(df)['close'][-1]
 
         conditions = {}
 
@@ -321,21 +550,17 @@ class BreakoutStrategy(BaseStrategy):
 
     def _check_volume_spike_reversal(self, df: pd.DataFrame) -> bool:
         """거래량 급증 후 음봉 출현 확인"""
-        cols = self._get_columns(df)
-
         if len(df) < 3:
             return False
 
-        # 전일 거래량 급증 + 오늘 음봉
-        volume_ma = df[cols['volume']].iloc[-20:-1].mean() if len(df) > 20 else \
-                    df[cols['volume']].iloc[:-1].mean()
+        arrs = get_views(df)
+        volume = arrs['vol']
 
-        prev_volume = df[cols['volume']].iloc[-2]
-        vol_spike = prev_volume > volume_ma * 2
+        # 전일 거래량 급증 + 오늘 음봉 (직전 최대 19봉 평균 대비)
+        volume_ma = _nanmean(volume[-20:-1] if len(volume) > 20 else volume[:-1])
+        vol_spike = volume[-2] > volume_ma * 2
 
-        today_open = df[cols['open']].iloc[-1]
-        today_close = df[cols['close']].iloc[-1]
-        is_bearish = today_close < today_open
+        is_bearish = arrs['close'][-1] < arrs['open'][-1]
 
         return vol_spike and is_bearish
 
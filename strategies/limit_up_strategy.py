@@ -6,17 +6,15 @@ PDF 기준: 상한가 후 3~5일 박스권 조정 → 돌파 매수
 import pandas as pd
 import numpy as np
 from datetime import datetime
-from typing import Optional, Dict, Any, Tuple
+from typing import Optional, Dict, Any, List, Tuple
 from pathlib import Path
 import sys
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 from config import SignalType, LimitUpStrategyParams
-from strategies.base_strategy import BaseStrategy, Signal, register_strategy
-from indicators import (
-    find_box_range,
-)
+from strategies.base_strategy import BaseStrategy, IndicatorCache, Signal, register_strategy
+from indicators._views import get_views
 
 
 class LimitUpStrategy(BaseStrategy):
@@ -58,132 +56,165 @@ class LimitUpStrategy(BaseStrategy):
 
         super().__init__(name='limit_up', params=strategy_params)
 
-    def _get_columns(self, df: pd.DataFrame) -> Dict[str, str]:
-        """컬럼명 매핑"""
-        col_lower = {c.lower(): c for c in df.columns}
-        return {
-            'open': col_lower.get('open', 'Open'),
-            'high': col_lower.get('high', 'High'),
-            'low': col_lower.get('low', 'Low'),
-            'close': col_lower.get('close', 'Close'),
-            'volume': col_lower.get('volume', 'Volume'),
-        }
-
-    def _find_limit_up_day(self, df: pd.DataFrame) -> Optional[Tuple[int, float]]:
+    def _find_limit_up_day(self, arrs: Dict[str, np.ndarray]) -> Optional[Tuple[int, float]]:
         """
         최근 상한가 기록 날짜 찾기
 
+        Args:
+            arrs: OHLCV 배열 딕셔너리 (get_views() 결과)
+
         Returns:
             (인덱스 위치, 상한가 종가) 또는 None
         """
-        cols = self._get_columns(df)
         lookback = self.params['lookback_days']
         threshold = self.params['limit_up_threshold']
 
-        # 최근 lookback일 확인
-        for i in range(-lookback, 0):
-            try:
-                open_price = df[cols['open']].iloc[i]
-                close_price = df[cols['close']].iloc[i]
+        close = arrs['close']
+        n = len(close)
+
+        # 최근 lookback일 구간 (데이터 시작 이전은 제외)
+        start = max(n - lookback, 0)
+        if start >= n:
+            return None
+
+        # 상승률 계산 기준: 전일 종가 (첫 봉은 당일 시가)
+        base = np.empty(n - start)
+        base[1:] = close[start:n - 1]
+        base[0] = close[start - 1] if start > 0 else arrs['open'][0]
 
-                # 상승률 계산 (전일 종가 대비)
-                if i > -len(df):
-                    prev_close = df[cols['close']].iloc[i - 1]
-                    change_rate = (close_price - prev_close) / prev_close
-                else:
-                    change_rate = (close_price - open_price) / open_price
+        with np.errstate(divide='ignore', invalid='ignore'):
+            change_rate = (close[start:] - base) / base
 
-                if change_rate >= threshold:
-                    return (len(df) + i, close_price)  # 양수 인덱스와 종가 반환
-            except IndexError:
-                continue
+        # 구간 내 가장 오래된 상한가 (양수 인덱스와 종가 반환)
+        hits = np.flatnonzero(change_rate >= threshold)
+        if hits.size == 0:
+            return None
 
-        return None
+        idx = start + int(hits[0])
+        return (idx, close[idx])
 
-    def _check_recent_limit_up(self, df: pd.DataFrame) -> Tuple[bool, Optional[float]]:
+    def _check_recent_limit_up(self, arrs: Dict[str, np.ndarray]) -> Tuple[bool, Optional[float]]:
         """
         최근 상한가 기록 여부 확인
 
         Returns:
             (상한가 여부, 상한가 종가)
         """
-        result = self._find_limit_up_day(df)
+        result = self._find_limit_up_day(arrs)
         if result:
             return True, result[1]
         return False, None
 
-    def _check_price_support(self, df: pd.DataFrame, limit_up_close: float) -> bool:
+    def _check_price_support(self, arrs: Dict[str, np.ndarray], limit_up_close: float) -> bool:
         """
         상한가 종가 부근 지지 확인 (±3%)
         """
-        cols = self._get_columns(df)
         threshold = self.params['support_threshold']
 
-        # 최근 5일의 종가가 상한가 종가 ±3% 범위 내인지 확인
-        for i in range(-5, 0):
-            try:
-                close = df[cols['close']].iloc[i]
-                diff_ratio = abs(close - limit_up_close) / limit_up_close
-
-                if diff_ratio > threshold:
-                    return False
-            except IndexError:
-                continue
+        # 최근 5일의 종가가 상한가 종가 ±3% 범위 내인지 확인 (결측 종가는 통과)
+        closes = arrs['close'][-5:]
+        diff_ratio = np.abs(closes - limit_up_close) / limit_up_close
 
-        return True
+        return not (diff_ratio > threshold).any()
 
-    def _check_consolidation(self, df: pd.DataFrame) -> Tuple[bool, Optional[Dict]]:
+    def _check_consolidation(self, arrs: Dict[str, np.ndarray]) -> Tuple[bool, Optional[Dict]]:
         """
         박스권 횡보 확인 (3~5일)
 
+        기간별로 find_box_range(lookback=k, variance=0.05)를 호출한 것과 같은 결과를
+        최근 max_days일 고가/저가의 누적 최고/최저 한 번으로 계산한다.
+
         Returns:
             (박스권 여부, 박스권 정보)
         """
         min_days = self.params['consolidation_days_min']
         max_days = self.params['consolidation_days_max']
+        variance = 0.05
+
+        high = arrs['high']
+        low = arrs['low']
+        max_k = min(max_days, len(high))
+        if max_k < min_days:
+            return False, None
+
+        # k번째 원소 = 최근 k+1일 고가 최고/저가 최저 (결측 제외)
+        box_highs = np.fmax.accumulate(high[len(high) - max_k:][::-1])
+        box_lows = np.fmin.accumulate(low[len(low) - max_k:][::-1])
+        mids = (box_highs + box_lows) / 2
+        ratios = (box_highs - box_lows) / mids
+
+        # 짧은 기간부터 변동 범위가 허용치 이내인 첫 박스권
+        hits = np.flatnonzero(~(ratios[min_days - 1:] > variance * 2))
+        if not hits.size:
+            return False, None
+
+        k = min_days - 1 + int(hits[0])
+        box_high = box_highs[k]
+        box_low = box_lows[k]
+        return True, {
+            'high': box_high,
+            'low': box_low,
+            'mid': mids[k],
+            'range': box_high - box_low,
+            'range_ratio': ratios[k],
+        }
 
-        # 다양한 기간으로 박스권 확인
-        for lookback in range(min_days, max_days + 1):
-            box = find_box_range(df, lookback=lookback, variance=0.05)
-            if box:
-                return True, box
-
-        return False, None
-
-    def _check_volume_pattern(self, df: pd.DataFrame) -> bool:
+    def _check_volume_pattern(self, arrs: Dict[str, np.ndarray]) -> bool:
         """
         거래량 패턴 확인 (감소 후 재증가)
         """
-        cols = self._get_columns(df)
-
         # 최근 5일 거래량 추이
-        recent_volumes = df[cols['volume']].iloc[-5:].values
+        r = arrs['vol'][-5:]
 
-        if len(recent_volumes) < 5:
+        if len(r) < 5:
             return False
 
         # 중간에 감소했다가 마지막에 증가하는 패턴
-        mid_avg = np.mean(recent_volumes[1:4])
-        first_vol = recent_volumes[0]
-        last_vol = recent_volumes[-1]
+        # (3개 평균은 np.mean 호출 없이 스칼라 연산, 합산 순서는 np.mean과 동일)
+        mid_avg = (r[1] + r[2] + r[3]) / 3
 
         # 중간이 처음보다 낮고, 마지막이 중간보다 높으면 OK
-        volume_decline = mid_avg < first_vol
-        volume_increase = last_vol > mid_avg
+        return mid_avg < r[0] and r[4] > mid_avg
 
-        return volume_decline and volume_increase
-
-    def _check_box_breakout(self, df: pd.DataFrame, box_high: float) -> bool:
+    def _check_box_breakout(self, arrs: Dict[str, np.ndarray], box_high: float) -> bool:
         """
         박스권 상단 돌파 확인
         """
-        cols = self._get_columns(df)
-        current_close = df[cols['close']].iloc[-1]
+        current_close = arrs['close'][-1]
 
         return current_close > box_high * 1.01  # 1% 여유
 
-    def check_buy_conditions(self, df: pd.DataFrame) -> Dict[str, Any]:
-        """매수 조건 확인"""
+    def check_buy_conditions(self, df: pd.DataFrame,
+                             cache: Optional[IndicatorCache] = None) -> Dict[str, Any]:
+        """
+        매수 조건 확인
+
+        Args:
+            df: OHLCV DataFrame (일봉)
+            cache: 종목 지표 캐시 (있으면 캐시의 OHLCV 배열을 그대로 사용)
+        """
+        arrs = cache.arrs if cache is not None else get_views(df)
+        conditions, metadata = self._evaluate_buy_conditions(arrs)
+
+        if not conditions['recent_limit_up']:
+            return conditions
+
+        return {**conditions, 'metadata': metadata}
+
+    def _evaluate_buy_conditions(
+        self, arrs: Dict[str, np.ndarray], stop_early: bool = False
+    ) -> Optional[Tuple[Dict[str, bool], Dict[str, Any]]]:
+        """
+        매수 조건 평가
+
+        Args:
+            arrs: OHLCV 배열 딕셔너리 (get_views() 결과)
+            stop_early: True면 핵심 조건(상한가/지지/박스권)이 하나라도 실패하는 즉시
+                None 반환 (신호 생성용, 이후 조건 계산 생략)
+
+        Returns:
+            (조건 딕셔너리, 메타데이터) 또는 None (stop_early로 중단된 경우)
+        """
         conditions = {
             'recent_limit_up': False,
             'price_support': False,
@@ -194,35 +225,41 @@ class LimitUpStrategy(BaseStrategy):
         metadata = {}
 
         # 1. 최근 상한가 확인
-        has_limit_up, limit_up_close = self._check_recent_limit_up(df)
+        has_limit_up, limit_up_close = self._check_recent_limit_up(arrs)
         conditions['recent_limit_up'] = has_limit_up
 
         if not has_limit_up:
-            return conditions
+            return None if stop_early else (conditions, metadata)
 
         metadata['limit_up_close'] = limit_up_close
 
-        # 2. 상한가 종가 지지 확인
-        conditions['price_support'] = self._check_price_support(df, limit_up_close)
+        # 2. 상한가 종가 지지 확인 (최근 5일 비교, 박스권 탐색보다 저렴)
+        conditions['price_support'] = self._check_price_support(arrs, limit_up_close)
+        if stop_early and not conditions['price_support']:
+            return None
 
         # 3. 박스권 횡보 확인
-        is_consolidating, box_info = self._check_consolidation(df)
+        is_consolidating, box_info = self._check_consolidation(arrs)
         conditions['consolidation'] = is_consolidating
+        if stop_early and not is_consolidating:
+            return None
 
         if box_info:
             metadata['box'] = box_info
 
         # 4. 거래량 패턴 확인
-        conditions['volume_pattern'] = self._check_volume_pattern(df)
+        conditions['volume_pattern'] = self._check_volume_pattern(arrs)
 
         # 5. 박스권 돌파 확인
         if box_info:
-            conditions['box_breakout'] = self._check_box_breakout(df, box_info['high'])
+            conditions['box_breakout'] = self._check_box_breakout(arrs, box_info['high'])
 
-        return {**conditions, 'metadata': metadata}
+        return conditions, metadata
 
     def generate_signal(self, df: pd.DataFrame, code: str = "",
-                        name: str = "") -> Optional[Signal]:
+                        name: str = "",
+                        cache: Optional[IndicatorCache] = None,
+                        as_of: Optional[datetime] = None) -> Optional[Signal]:
         """
         매매 신호 생성
 
@@ -230,6 +267,8 @@ class LimitUpStrategy(BaseStrategy):
             df: OHLCV DataFrame (일봉)
             code: 종목 코드
             name: 종목명
+            cache: 종목 지표 캐시 (여러 전략이 공유, 없으면 df로 생성)
+            as_of: 신호 시각 (없으면 DatetimeIndex의 마지막 봉 시각, 그 외에는 현재 시각)
 
         Returns:
             Signal 또는 None
@@ -237,21 +276,18 @@ class LimitUpStrategy(BaseStrategy):
         if len(df) < 10:  # 최소 데이터 필요
             return None
 
-        # 매수 조건 확인
-        result = self.check_buy_conditions(df)
-        metadata = result.pop('metadata', {})
-
-        # 핵심 조건 충족 확인
-        core_conditions = ['recent_limit_up', 'price_support', 'consolidation']
-        if not all(result[c] for c in core_conditions):
+        # 매수 조건 확인 (핵심 조건 실패 시 나머지 계산 없이 종료)
+        arrs = cache.arrs if cache is not None else get_views(df)
+        evaluated = self._evaluate_buy_conditions(arrs, stop_early=True)
+        if evaluated is None:
             return None
+        result, metadata = evaluated
 
         # 박스권 돌파 또는 거래량 신호
         if not (result['box_breakout'] or result['volume_pattern']):
             return None
 
-        cols = self._get_columns(df)
-        entry_price = df[cols['close']].iloc[-1]
+        entry_price = arrs['close'][-1]
 
         # 손절가: 상한가 종가 -5% 또는 박스권 하단
         limit_up_close = metadata.get('limit_up_close', entry_price)
@@ -270,7 +306,7 @@ class LimitUpStrategy(BaseStrategy):
         return Signal(
             code=code,
             name=name,
-            datetime=datetime.now(),
+            datetime=self._signal_time(df, as_of),
             signal_type=SignalType.BUY,
             strategy=self.name,
             price=entry_price,
@@ -285,6 +321,66 @@ class LimitUpStrategy(BaseStrategy):
             }
         )
 
+    def generate_signals_batch(self, data: Dict[str, pd.DataFrame],
+                               names: Optional[Dict[str, str]] = None,
+                               as_of: Optional[datetime] = None) -> List[Signal]:
+        """
+        여러 종목 매매 신호 일괄 생성
+
+        종목별 최근 구간 종가를 (종목 수, lookback_days + 1) 행렬로 쌓아
+        상한가 탐색과 상한가 종가 지지 확인을 종목 축으로 한 번에 계산하고,
+        두 조건을 통과한 종목만 generate_signal로 나머지 조건을 평가한다.
+        (결과는 종목별 generate_signal 호출과 동일)
+
+        Args:
+            data: {종목 코드: OHLCV DataFrame (일봉)}
+            names: {종목 코드: 종목명} (없으면 빈 문자열)
+            as_of: 신호 시각 (없으면 종목별 마지막 봉 시각)
+
+        Returns:
+            신호 리스트 (data의 종목 순서)
+        """
+        lookback = self.params['lookback_days']
+        codes = [code for code, df in data.items() if len(df) >= 10]
+        if lookback <= 0 or not codes:
+            return []
+
+        # 행 = 종목, 열 = [기준가, 최근 lookback일 종가] (데이터 부족 구간은 NaN)
+        width = lookback + 1
+        window = np.full((len(codes), width), np.nan)
+        recent = np.empty((len(codes), 5))
+        for row, code in enumerate(codes):
+            arrs = get_views(data[code])
+            close = arrs['close']
+            n = len(close)
+            m = min(lookback, n)
+            window[row, width - m:] = close[n - m:]
+            # 상승률 기준: 전일 종가 (구간이 데이터 시작이면 첫 봉 시가)
+            window[row, width - m - 1] = close[n - m - 1] if n > m else arrs['open'][0]
+            recent[row] = close[-5:]
+
+        # 1. 최근 상한가 (구간 내 가장 오래된 상한가 종가)
+        base = window[:, :-1]
+        closes = window[:, 1:]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            hit = (closes - base) / base >= self.params['limit_up_threshold']
+        has_limit_up = hit.any(axis=1)
+        limit_up_close = closes[np.arange(len(codes)), hit.argmax(axis=1)]
+
+        # 2. 최근 5일 종가가 상한가 종가 ±3% 범위 내 (결측 종가는 통과)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            diff_ratio = np.abs(recent - limit_up_close[:, None]) / limit_up_close[:, None]
+        support = ~(diff_ratio > self.params['support_threshold']).any(axis=1)
+
+        names = names or {}
+        signals = []
+        for row in np.flatnonzero(has_limit_up & support):
+            code = codes[row]
+            signal = self.generate_signal(data[code], code, names.get(code, ""), as_of=as_of)
+            if signal is not None:
+                signals.append(signal)
+        return signals
+
     def check_sell_conditions(self, df: pd.DataFrame,
                               entry_price: float = None,
                               limit_up_close: float = None,
@@ -292,8 +388,8 @@ class LimitUpStrategy(BaseStrategy):
         """
         매도/손절 조건 확인
         """
-        cols = self._get_columns(df)
-        current_price = df[cols['close']].iloc[-1]
+        arrs = get_views(df)
+        current_price = arrs['close'][-1]
 
         conditions = {}
 
@@ -307,23 +403,23 @@ class LimitUpStrategy(BaseStrategy):
             conditions['box_low_break'] = current_price < box_low * 0.99
 
         # 익절: 신고가 후 음봉
-        conditions['new_high_reversal'] = self._check_new_high_reversal(df)
+        conditions['new_high_reversal'] = self._check_new_high_reversal(arrs)
 
         return conditions
 
-    def _check_new_high_reversal(self, df: pd.DataFrame) -> bool:
+    def _check_new_high_reversal(self, arrs: Dict[str, np.ndarray]) -> bool:
         """신고가 후 음봉 확인"""
-        cols = self._get_columns(df)
+        high = arrs['high']
 
-        if len(df) < 2:
+        if len(high) < 2:
             return False
 
-        # 전일이 신고가였고 오늘이 음봉
-        prev_high = df[cols['high']].iloc[-2]
-        max_high = df[cols['high']].iloc[:-2].max() if len(df) > 2 else prev_high
+        # 전일이 신고가였고 오늘이 음봉 (이전 최고가는 결측 제외)
+        prev_high = high[-2]
+        max_high = np.fmax.reduce(high[:-2]) if len(high) > 2 else prev_high
 
         is_prev_new_high = prev_high >= max_high
-        is_today_bearish = df[cols['close']].iloc[-1] < df[cols['open']].iloc[-1]
+        is_today_bearish = arrs['close'][-1] < arrs['open'][-1]
 
         return is_prev_new_high and is_today_bearish
 
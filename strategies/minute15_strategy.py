@@ -3,6 +3,7 @@
 PDF 기준: 15분봉에서 7~10% 장대양봉 + 50% 지지 + 60선 위
 """
 
+import numpy as np
 import pandas as pd
 from datetime import datetime
 from typing import Optional, Dict, Any
@@ -12,11 +13,63 @@ import sys
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 from config import SignalType, Minute15StrategyParams
-from strategies.base_strategy import BaseStrategy, Signal, register_strategy
+from strategies.base_strategy import BaseStrategy, IndicatorCache, Signal, register_strategy
+from indicators._numba_kernels import njit
 from indicators import (
-    calculate_all_ma,
     detect_volume_spike,
 )
+from indicators._views import get_clean_view, get_views
+
+
+@njit(cache=True)
+def _generate_signal_njit(open_, low, close, volume, long_thr, spike_ratio,
+                          has_ma60, ma60):
+    """
+    15분봉 매수 조건 수치 계산 (마지막 캔들 기준)
+
+    Args:
+        open_, low, close: float64 가격 배열 (길이 60 이상)
+        volume: 거래량 배열 (float64 또는 int64)
+        long_thr: 장대양봉 기준 상승률
+        spike_ratio: 거래량 급등 배수 (20봉 평균 대비)
+        has_ma60: df에 ma60 컬럼이 있는지 여부 (없으면 최근 60봉 종가로 계산)
+        ma60: ma60 컬럼의 마지막 값 (has_ma60일 때만 사용)
+
+    Returns:
+        (양봉, 장대양봉, 거래량 급등, 60선 위, 50% 지지,
+         진입가, 캔들 저가, 캔들 50% 레벨, MA60)
+    """
+    n = close.size
+    o = open_[n - 1]
+    c = close[n - 1]
+
+    bullish = c > o
+    # 거래 정지 등으로 시가가 0인 봉은 pandas 경로와 같이 ±inf 상승률로 처리
+    if o != 0.0:
+        change = (c - o) / o
+    else:
+        change = np.inf if c > o else -np.inf
+    long_candle = change >= long_thr
+
+    # 거래량 비율 = 현재 거래량 / 20봉 평균
+    m = min(n, 20)
+    vsum = 0.0
+    for i in range(n - m, n):
+        vsum += volume[i]
+    vol_spike = vsum > 0 and volume[n - 1] / (vsum / m) >= spike_ratio
+
+    if not has_ma60:
+        csum = 0.0
+        for i in range(n - 60, n):
+            csum += close[i]
+        ma60 = csum / 60
+    above_ma60 = c > ma60
+
+    candle_50pct = (o + c) / 2
+    support = long_candle and c >= candle_50pct
+
+    return (bullish, long_candle, vol_spike, above_ma60, support,
+            c, low[n - 1], candle_50pct, ma60)
 
 
 class Minute15Strategy(BaseStrategy):
@@ -54,63 +107,36 @@ class Minute15Strategy(BaseStrategy):
         self._signal_candle_low: Optional[float] = None
         self._signal_candle_50pct: Optional[float] = None
 
-    def _get_columns(self, df: pd.DataFrame) -> Dict[str, str]:
-        """컬럼명 매핑"""
-        col_lower = {c.lower(): c for c in df.columns}
-        return {
-            'open': col_lower.get('open', 'Open'),
-            'high': col_lower.get('high', 'High'),
-            'low': col_lower.get('low', 'Low'),
-            'close': col_lower.get('close', 'Close'),
-            'volume': col_lower.get('volume', 'Volume'),
-        }
-
-    def _check_long_candle(self, df: pd.DataFrame) -> bool:
+    def _check_long_candle(self, arrs: Dict[str, np.ndarray]) -> bool:
         """장대양봉 확인 (7% 이상)"""
-        cols = self._get_columns(df)
-        change = (df[cols['close']].iloc[-1] - df[cols['open']].iloc[-1]) / df[cols['open']].iloc[-1]
+        open_price = arrs['open'][-1]
+        change = (arrs['close'][-1] - open_price) / open_price
         return change >= self.params['long_candle_threshold']
 
-    def _check_bullish(self, df: pd.DataFrame) -> bool:
+    def _check_bullish(self, arrs: Dict[str, np.ndarray]) -> bool:
         """양봉 여부 확인"""
-        cols = self._get_columns(df)
-        return df[cols['close']].iloc[-1] > df[cols['open']].iloc[-1]
+        return arrs['close'][-1] > arrs['open'][-1]
 
     def _check_volume_spike(self, df: pd.DataFrame) -> bool:
         """거래량 급등 확인"""
         spike = detect_volume_spike(df, threshold=self.params['volume_spike_ratio'])
         return spike.iloc[-1]
 
-    def _check_price_support(self, df: pd.DataFrame, candle_50pct: float) -> bool:
+    def _check_price_support(self, arrs: Dict[str, np.ndarray], candle_50pct: float) -> bool:
         """50% 지지 확인 (현재가가 장대양봉 50% 위)"""
-        cols = self._get_columns(df)
-        current_price = df[cols['close']].iloc[-1]
-        return current_price >= candle_50pct
+        return arrs['close'][-1] >= candle_50pct
 
-    def _check_above_ma60(self, df: pd.DataFrame) -> bool:
+    def _check_above_ma60(self, arrs: Dict[str, np.ndarray], ma: np.ndarray) -> bool:
         """60선 위에 있는지 확인"""
-        cols = self._get_columns(df)
+        return arrs['close'][-1] > ma[-1]
 
-        # MA60 계산 (없으면 계산)
-        if 'ma60' not in df.columns:
-            df = calculate_all_ma(df, [60])
-
-        current_price = df[cols['close']].iloc[-1]
-        ma60 = df['ma60'].iloc[-1]
-
-        return current_price > ma60
-
-    def _get_candle_50_percent(self, df: pd.DataFrame) -> float:
+    def _get_candle_50_percent(self, arrs: Dict[str, np.ndarray]) -> float:
         """장대양봉 50% 레벨 계산"""
-        cols = self._get_columns(df)
-        open_price = df[cols['open']].iloc[-1]
-        close_price = df[cols['close']].iloc[-1]
-        return (open_price + close_price) / 2
+        return (arrs['open'][-1] + arrs['close'][-1]) / 2
 
-    def _get_candle_low(self, df: pd.DataFrame) -> float:
+    def _get_candle_low(self, arrs: Dict[str, np.ndarray]) -> float:
         """장대양봉 저가"""
-        cols = self._get_columns(df)
-        return df[cols['low']].iloc[-1]
+        return arrs['low'][-1]
 
     def check_buy_conditions(self, df: pd.DataFrame) -> Dict[str, bool]:
         """
@@ -119,24 +145,31 @@ class Minute15Strategy(BaseStrategy):
         Returns:
             각 조건별 충족 여부 딕셔너리
         """
+        return self._evaluate_buy_conditions(df, get_views(df), self._ma_array(df, 60))
+
+    def _evaluate_buy_conditions(self, df: pd.DataFrame, arrs: Dict[str, np.ndarray],
+                                 ma: np.ndarray) -> Dict[str, bool]:
+        """OHLCV/MA60 배열로 매수 조건 평가"""
         conditions = {
-            'bullish': self._check_bullish(df),
-            'long_candle_7pct': self._check_long_candle(df),
+            'bullish': self._check_bullish(arrs),
+            'long_candle_7pct': self._check_long_candle(arrs),
             'volume_spike_2x': self._check_volume_spike(df),
-            'above_ma60': self._check_above_ma60(df),
+            'above_ma60': self._check_above_ma60(arrs, ma),
         }
 
         # 장대양봉이 확인된 경우에만 50% 지지 체크
         if conditions['long_candle_7pct']:
-            candle_50pct = self._get_candle_50_percent(df)
-            conditions['price_support_50pct'] = self._check_price_support(df, candle_50pct)
+            candle_50pct = self._get_candle_50_percent(arrs)
+            conditions['price_support_50pct'] = self._check_price_support(arrs, candle_50pct)
         else:
             conditions['price_support_50pct'] = False
 
         return conditions
 
     def generate_signal(self, df: pd.DataFrame, code: str = "",
-                        name: str = "") -> Optional[Signal]:
+                        name: str = "",
+                        cache: Optional[IndicatorCache] = None,
+                        as_of: Optional[datetime] = None) -> Optional[Signal]:
         """
         매매 신호 생성
 
@@ -144,6 +177,8 @@ class Minute15Strategy(BaseStrategy):
             df: OHLCV DataFrame (15분봉)
             code: 종목 코드
             name: 종목명
+            cache: 종목 지표 캐시 (인터페이스 호환용, 이 전략은 사용하지 않음)
+            as_of: 신호 시각 (없으면 DatetimeIndex의 마지막 봉 시각, 그 외에는 현재 시각)
 
         Returns:
             Signal 또는 None
@@ -151,51 +186,90 @@ class Minute15Strategy(BaseStrategy):
         if len(df) < 60:  # 최소 데이터 필요
             return None
 
-        # MA 계산
-        if 'ma60' not in df.columns:
-            df = calculate_all_ma(df, [60])
+        arrays = [get_clean_view(df, name) for name in ('open', 'low', 'close', 'vol')]
+        if any(arr is None for arr in arrays):
+            return self._generate_signal_pandas(df, code, name, as_of)
+
+        # 이미 계산된 ma60 컬럼이 있으면 그 값을 사용 (_ma_array와 같은 규칙)
+        has_ma60 = 'ma60' in df.columns
+        (bullish, long_candle, vol_spike, above_ma60, support,
+         entry_price, candle_low, candle_50pct, ma60) = _generate_signal_njit(
+            *arrays, self.params['long_candle_threshold'], self.params['volume_spike_ratio'],
+            has_ma60, float(df['ma60'].iat[-1]) if has_ma60 else np.nan,
+        )
+
+        # 모든 조건 충족 시에만 Signal 생성
+        if not (bullish and long_candle and vol_spike and above_ma60 and support):
+            return None
+
+        conditions = {
+            'bullish': True,
+            'long_candle_7pct': True,
+            'volume_spike_2x': True,
+            'above_ma60': True,
+            'price_support_50pct': True,
+        }
+        return self._build_signal(code, name, conditions, entry_price,
+                                  candle_low, candle_50pct, ma60,
+                                  self._signal_time(df, as_of))
+
+    def _generate_signal_pandas(self, df: pd.DataFrame, code: str, name: str,
+                                as_of: Optional[datetime] = None) -> Optional[Signal]:
+        """매매 신호 생성 (결측치가 있는 데이터용 pandas 경로)"""
+        # OHLCV/MA60 배열은 한 번만 준비해 모든 조건 확인에 사용
+        arrs = get_views(df)
+        ma = self._ma_array(df, 60)
 
         # 매수 조건 확인
-        conditions = self.check_buy_conditions(df)
+        conditions = self._evaluate_buy_conditions(df, arrs, ma)
 
         # 모든 조건 충족 시 매수 신호
-        if all(conditions.values()):
-            cols = self._get_columns(df)
-            entry_price = df[cols['close']].iloc[-1]
-
-            # 손절가: 장대양봉 저가
-            candle_low = self._get_candle_low(df)
-            stop_loss = candle_low * 0.99  # 저가 -1%
-
-            # 익절가: 진입가 대비 목표 수익률 또는 60선 이격 중 높은 값
-            ma60 = df['ma60'].iloc[-1]
-            ma_based_target = ma60 * (1 + self.params['ma_divergence_threshold'])
-            price_based_target = entry_price * 1.05  # 최소 5% 수익 목표
-            take_profit = max(ma_based_target, price_based_target)
-
-            # 신호 강도 계산 (조건 충족 개수 기반)
-            strength = sum(conditions.values()) / len(conditions)
-
-            return Signal(
-                code=code,
-                name=name,
-                datetime=datetime.now(),
-                signal_type=SignalType.BUY,
-                strategy=self.name,
-                price=entry_price,
-                stop_loss=stop_loss,
-                take_profit=take_profit,
-                reason=self.get_signal_reason(conditions),
-                strength=strength,
-                metadata={
-                    'candle_low': candle_low,
-                    'candle_50pct': self._get_candle_50_percent(df),
-                    'ma60': ma60,
-                    'conditions': conditions,
-                }
-            )
-
-        return None
+        if not all(conditions.values()):
+            return None
+
+        return self._build_signal(
+            code, name, conditions,
+            entry_price=arrs['close'][-1],
+            candle_low=self._get_candle_low(arrs),
+            candle_50pct=self._get_candle_50_percent(arrs),
+            ma60=ma[-1],
+            signal_time=self._signal_time(df, as_of),
+        )
+
+    def _build_signal(self, code: str, name: str, conditions: Dict[str, bool],
+                      entry_price: float, candle_low: float,
+                      candle_50pct: float, ma60: float,
+                      signal_time: datetime) -> Signal:
+        """조건 충족 시 Signal 객체 생성"""
+        # 손절가: 장대양봉 저가
+        stop_loss = candle_low * 0.99  # 저가 -1%
+
+        # 익절가: 진입가 대비 목표 수익률 또는 60선 이격 중 높은 값
+        ma_based_target = ma60 * (1 + self.params['ma_divergence_threshold'])
+        price_based_target = entry_price * 1.05  # 최소 5% 수익 목표
+        take_profit = max(ma_based_target, price_based_target)
+
+        # 신호 강도 계산 (조건 충족 개수 기반)
+        strength = sum(conditions.values()) / len(conditions)
+
+        return Signal(
+            code=code,
+            name=name,
+            datetime=signal_time,
+            signal_type=SignalType.BUY,
+            strategy=self.name,
+            price=entry_price,
+            stop_loss=stop_loss,
+            take_profit=take_profit,
+            reason=self.get_signal_reason(conditions),
+            strength=strength,
+            metadata={
+                'candle_low': candle_low,
+                'candle_50pct': candle_50pct,
+                'ma60': ma60,
+                'conditions': conditions,
+            }
+        )
 
     def check_sell_conditions(self, df: pd.DataFrame,
                               entry_price: float = None,
@@ -211,16 +285,12 @@ class Minute15Strategy(BaseStrategy):
         Returns:
             각 조건별 충족 여부
         """
-        cols = self._get_columns(df)
-        current_price = df[cols['close']].iloc[-1]
+        current_price = get_views(df)['close'][-1]
 
         conditions = {}
 
         # MA60 확인
-        if 'ma60' not in df.columns:
-            df = calculate_all_ma(df, [60])
-
-        ma60 = df['ma60'].iloc[-1]
+        ma60 = self._ma_array(df, 60)[-1]
 
         # 손절 조건 1: 장대양봉 저가 이탈
         if candle_low:
@@ -237,15 +307,12 @@ class Minute15Strategy(BaseStrategy):
 
     def calculate_stop_loss(self, df: pd.DataFrame, entry_price: float) -> float:
         """손절가 계산 (장대양봉 저가)"""
-        candle_low = self._get_candle_low(df)
+        candle_low = self._get_candle_low(get_views(df))
         return candle_low * 0.99  # 저가 -1% 여유
 
     def calculate_take_profit(self, df: pd.DataFrame, entry_price: float) -> float:
         """익절가 계산 (60선 대비 10% 이격)"""
-        if 'ma60' not in df.columns:
-            df = calculate_all_ma(df, [60])
-
-        ma60 = df['ma60'].iloc[-1]
+        ma60 = self._ma_array(df, 60)[-1]
         return ma60 * (1 + self.params['ma_divergence_threshold'])
 
 
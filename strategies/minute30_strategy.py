@@ -3,19 +3,68 @@
 PDF 기준: 30분봉 60선(=일봉 5일선) 지지 매매
 """
 
+import numpy as np
 import pandas as pd
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 from pathlib import Path
 import sys
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 from config import SignalType, Minute30StrategyParams
-from strategies.base_strategy import BaseStrategy, Signal, register_strategy
-from indicators import (
-    calculate_all_ma,
-)
+from strategies.base_strategy import BaseStrategy, IndicatorCache, Signal, register_strategy
+from indicators._numba_kernels import njit
+from indicators._views import get_clean_view, get_views
+
+
+@njit(cache=True)
+def _buy_conditions_njit(open_, low, close, volume, ma, near_thr,
+                         support_lookback, low_lookback):
+    """
+    30분봉 매수 조건 수치 계산 (마지막 캔들 기준)
+
+    Args:
+        open_, low, close: float64 가격 배열 (결측 없음)
+        volume: 거래량 배열 (float64 또는 int64)
+        ma: MA60 배열 (앞부분 NaN 허용)
+        near_thr: 60선 근접 기준
+        support_lookback: 지지 확인 캔들 수
+        low_lookback: 돌파 캔들 저가 탐색 캔들 수
+
+    Returns:
+        (60선 위, 60선 지지, 거래량 증가, 양봉, 돌파 캔들 저가)
+    """
+    n = close.size
+    c = close[n - 1]
+
+    above_ma60 = c >= ma[n - 1]
+    bullish = c > open_[n - 1]
+
+    # 60선 지지 캔들: 지지 확인은 최근 support_lookback개,
+    # 돌파 캔들 저가는 최근 low_lookback개 중 가장 먼저 나온 캔들
+    support = False
+    found = False
+    breakout_low = low[n - 1]
+    start = min(max(n - support_lookback, 0), max(n - low_lookback, 0))
+    for i in range(start, n):
+        if low[i] <= ma[i] * (1 + near_thr) and close[i] > ma[i]:
+            if i >= n - support_lookback:
+                support = True
+            if not found and i >= n - low_lookback:
+                breakout_low = low[i]
+                found = True
+
+    # 현재 거래량 vs 직전 5캔들 평균
+    m = min(n - 1, 5)
+    vol_increase = False
+    if m > 0:
+        vsum = 0.0
+        for i in range(n - 1 - m, n - 1):
+            vsum += volume[i]
+        vol_increase = volume[n - 1] > vsum / m
+
+    return above_ma60, support, vol_increase, bullish, breakout_low
 
 
 class Minute30Strategy(BaseStrategy):
@@ -51,124 +100,133 @@ class Minute30Strategy(BaseStrategy):
 
         super().__init__(name='minute30', params=strategy_params)
 
-    def _get_columns(self, df: pd.DataFrame) -> Dict[str, str]:
-        """컬럼명 매핑"""
-        col_lower = {c.lower(): c for c in df.columns}
-        return {
-            'open': col_lower.get('open', 'Open'),
-            'high': col_lower.get('high', 'High'),
-            'low': col_lower.get('low', 'Low'),
-            'close': col_lower.get('close', 'Close'),
-            'volume': col_lower.get('volume', 'Volume'),
-        }
-
-    def _ensure_ma(self, df: pd.DataFrame) -> pd.DataFrame:
-        """MA60 계산 확인"""
-        ma_col = f"ma{self.params['ma_period']}"
-        if ma_col not in df.columns:
-            df = calculate_all_ma(df, [self.params['ma_period']])
-        return df
+    def _ma_values(self, df: pd.DataFrame) -> np.ndarray:
+        """MA60 값 배열 (없으면 계산)"""
+        return self._ma_array(df, self.params['ma_period'])
 
-    def _check_price_above_ma60(self, df: pd.DataFrame) -> bool:
+    def _check_price_above_ma60(self, arrs: Dict[str, np.ndarray], ma: np.ndarray) -> bool:
         """현재가가 60선 위에 있는지 확인"""
-        cols = self._get_columns(df)
-        df = self._ensure_ma(df)
-
-        ma_col = f"ma{self.params['ma_period']}"
-        current_price = df[cols['close']].iloc[-1]
-        ma60 = df[ma_col].iloc[-1]
+        return arrs['close'][-1] >= ma[-1]
 
-        return current_price >= ma60
-
-    def _check_ma60_support(self, df: pd.DataFrame, lookback: int = 3) -> bool:
+    def _support_candle_mask(self, arrs: Dict[str, np.ndarray], ma: np.ndarray,
+                             lookback: int = 5) -> np.ndarray:
         """
-        60선 지지 확인 (최근 N캔들 내에서 60선 터치 후 반등)
+        최근 lookback 캔들의 60선 지지 여부 마스크
 
         지지 패턴:
-        - 저가가 60선 근처까지 내려왔다가
+        - 저가가 60선 근처까지 내려왔다가 (아래 또는 약간 위)
         - 종가가 60선 위에서 마감
         """
-        cols = self._get_columns(df)
-        df = self._ensure_ma(df)
-
-        ma_col = f"ma{self.params['ma_period']}"
         near_threshold = self.params['near_ma_threshold']
+        lows = arrs['low'][-lookback:]
+        mas = ma[-lookback:]
+        return (lows <= mas * (1 + near_threshold)) & (arrs['close'][-lookback:] > mas)
 
-        # 최근 lookback 캔들 확인
-        for i in range(-lookback, 0):
-            try:
-                low = df[cols['low']].iloc[i]
-                close = df[cols['close']].iloc[i]
-                ma60 = df[ma_col].iloc[i]
-
-                # 저가가 60선 근처 (아래 또는 약간 위)
-                low_near_ma = low <= ma60 * (1 + near_threshold)
-
-                # 종가가 60선 위
-                close_above_ma = close > ma60
-
-                if low_near_ma and close_above_ma:
-                    return True
-            except IndexError:
-                continue
+    def _check_ma60_support(self, arrs: Dict[str, np.ndarray], ma: np.ndarray,
+                            lookback: int = 3,
+                            mask: Optional[np.ndarray] = None) -> bool:
+        """
+        60선 지지 확인 (최근 N캔들 내에서 60선 터치 후 반등)
 
-        return False
+        Args:
+            mask: 미리 계산한 지지 캔들 마스크 (lookback 이상 길이, 없으면 계산)
+        """
+        if mask is None:
+            mask = self._support_candle_mask(arrs, ma, lookback)
+        return bool(mask[-lookback:].any())
 
-    def _check_volume_increase(self, df: pd.DataFrame) -> bool:
+    def _check_volume_increase(self, arrs: Dict[str, np.ndarray],
+                               cache: Optional[IndicatorCache] = None) -> bool:
         """거래량 증가 확인"""
-        cols = self._get_columns(df)
+        cache = cache or IndicatorCache(arrs)
 
         # 현재 거래량 vs 이전 5캔들 평균
-        current_volume = df[cols['volume']].iloc[-1]
-        avg_volume = df[cols['volume']].iloc[-6:-1].mean()
+        current_volume = cache.arrs['vol'][-1]
+        avg_volume = cache.vol_mean(5)
 
         return current_volume > avg_volume
 
-    def _check_bullish_candle(self, df: pd.DataFrame) -> bool:
+    def _check_bullish_candle(self, arrs: Dict[str, np.ndarray]) -> bool:
         """양봉 확인"""
-        cols = self._get_columns(df)
-        return df[cols['close']].iloc[-1] > df[cols['open']].iloc[-1]
+        return arrs['close'][-1] > arrs['open'][-1]
 
-    def _get_breakout_candle_low(self, df: pd.DataFrame, lookback: int = 5) -> float:
+    def _get_breakout_candle_low(self, arrs: Dict[str, np.ndarray], ma: np.ndarray,
+                                 lookback: int = 5,
+                                 mask: Optional[np.ndarray] = None) -> float:
         """
         돌파 캔들(60선 지지 확인된 캔들)의 저가 찾기
+
+        Args:
+            mask: 미리 계산한 지지 캔들 마스크 (길이 lookback, 없으면 계산)
         """
-        cols = self._get_columns(df)
-        df = self._ensure_ma(df)
+        low = arrs['low']
+        if mask is None:
+            mask = self._support_candle_mask(arrs, ma, lookback)
 
-        ma_col = f"ma{self.params['ma_period']}"
-        near_threshold = self.params['near_ma_threshold']
+        # 최근 캔들 중 가장 먼저 나온 60선 지지 캔들
+        hits = np.flatnonzero(mask)
+        if hits.size:
+            return low[len(low) - len(mask) + hits[0]]
 
-        # 최근 캔들 중 60선 지지 캔들 찾기
-        for i in range(-lookback, 0):
-            try:
-                low = df[cols['low']].iloc[i]
-                close = df[cols['close']].iloc[i]
-                ma60 = df[ma_col].iloc[i]
+        # 찾지 못하면 현재 저가 반환
+        return low[-1]
 
-                if low <= ma60 * (1 + near_threshold) and close > ma60:
-                    return low
-            except IndexError:
-                continue
+    def check_buy_conditions(self, df: pd.DataFrame,
+                             cache: Optional[IndicatorCache] = None) -> Dict[str, bool]:
+        """
+        매수 조건 확인
 
-        # 찾지 못하면 현재 저가 반환
-        return df[cols['low']].iloc[-1]
+        Args:
+            df: OHLCV DataFrame (30분봉)
+            cache: 종목 지표 캐시 (있으면 캐시의 OHLCV 배열을 그대로 사용)
+        """
+        ma = self._ma_values(df)
+        result = self._kernel_buy_conditions(df, ma)
+        if result is not None:
+            return result[0]
 
-    def check_buy_conditions(self, df: pd.DataFrame) -> Dict[str, bool]:
-        """매수 조건 확인"""
-        df = self._ensure_ma(df)
+        arrs = cache.arrs if cache is not None else get_views(df)
+        return self._evaluate_buy_conditions(arrs, ma, cache)
 
+    def _kernel_buy_conditions(self, df: pd.DataFrame,
+                               ma: np.ndarray) -> Optional[Tuple[Dict[str, bool], float]]:
+        """
+        JIT 커널로 매수 조건 평가
+
+        Returns:
+            (조건 딕셔너리, 돌파 캔들 저가), 결측치가 있으면 None
+        """
+        arrays = [get_clean_view(df, name) for name in ('open', 'low', 'close', 'vol')]
+        if any(arr is None for arr in arrays):
+            return None
+
+        (above_ma60, support, vol_increase, bullish,
+         breakout_low) = _buy_conditions_njit(
+            *arrays, ma, self.params['near_ma_threshold'], 3, 5
+        )
         conditions = {
-            'price_above_ma60': self._check_price_above_ma60(df),
-            'ma60_support': self._check_ma60_support(df),
-            'volume_increase': self._check_volume_increase(df),
-            'bullish_candle': self._check_bullish_candle(df),
+            'price_above_ma60': above_ma60,
+            'ma60_support': support,
+            'volume_increase': vol_increase,
+            'bullish_candle': bullish,
         }
+        return conditions, breakout_low
 
-        return conditions
+    def _evaluate_buy_conditions(self, arrs: Dict[str, np.ndarray], ma: np.ndarray,
+                                 cache: Optional[IndicatorCache] = None,
+                                 mask: Optional[np.ndarray] = None) -> Dict[str, bool]:
+        """OHLCV/MA60 배열로 매수 조건 평가"""
+        return {
+            'price_above_ma60': self._check_price_above_ma60(arrs, ma),
+            'ma60_support': self._check_ma60_support(arrs, ma, mask=mask),
+            'volume_increase': self._check_volume_increase(arrs, cache),
+            'bullish_candle': self._check_bullish_candle(arrs),
+        }
 
     def generate_signal(self, df: pd.DataFrame, code: str = "",
-                        name: str = "") -> Optional[Signal]:
+                        name: str = "",
+                        cache: Optional[IndicatorCache] = None,
+                        as_of: Optional[datetime] = None) -> Optional[Signal]:
         """
         매매 신호 생성
 
@@ -176,6 +234,8 @@ class Minute30Strategy(BaseStrategy):
             df: OHLCV DataFrame (30분봉)
             code: 종목 코드
             name: 종목명
+            cache: 종목 지표 캐시 (여러 전략이 공유, 없으면 df로 생성)
+            as_of: 신호 시각 (없으면 DatetimeIndex의 마지막 봉 시각, 그 외에는 현재 시각)
 
         Returns:
             Signal 또는 None
@@ -183,21 +243,29 @@ class Minute30Strategy(BaseStrategy):
         if len(df) < 60:  # 최소 데이터 필요
             return None
 
-        df = self._ensure_ma(df)
-
-        # 매수 조건 확인
-        conditions = self.check_buy_conditions(df)
+        # OHLCV/MA60 배열은 한 번만 준비해 모든 조건 확인에 사용
+        arrs = cache.arrs if cache is not None else get_views(df)
+        ma = self._ma_values(df)
+
+        # 매수 조건 확인 (결측치가 없으면 JIT 커널, 있으면 NumPy 경로)
+        result = self._kernel_buy_conditions(df, ma)
+        if result is not None:
+            conditions, breakout_low = result
+        else:
+            # 지지 캔들 마스크는 최근 5캔들에 대해 한 번만 계산해
+            # 지지 확인(최근 3캔들)과 돌파 캔들 저가 조회에 함께 사용
+            mask = self._support_candle_mask(arrs, ma)
+            conditions = self._evaluate_buy_conditions(arrs, ma, cache, mask)
+            breakout_low = None
 
         # 모든 조건 충족 시 매수 신호
         if all(conditions.values()):
-            cols = self._get_columns(df)
-            ma_col = f"ma{self.params['ma_period']}"
-
-            entry_price = df[cols['close']].iloc[-1]
-            ma60 = df[ma_col].iloc[-1]
+            entry_price = arrs['close'][-1]
+            ma60 = ma[-1]
 
             # 손절가: 돌파 캔들 저가 또는 60선 -2%
-            breakout_low = self._get_breakout_candle_low(df)
+            if breakout_low is None:
+                breakout_low = self._get_breakout_candle_low(arrs, ma, mask=mask)
             stop_loss = min(breakout_low * 0.99, ma60 * 0.98)
 
             # 익절가: 진입가 대비 목표 수익률 또는 60선 이격 중 높은 값
@@ -211,7 +279,7 @@ class Minute30Strategy(BaseStrategy):
             return Signal(
                 code=code,
                 name=name,
-                datetime=datetime.now(),
+                datetime=self._signal_time(df, as_of),
                 signal_type=SignalType.BUY,
                 strategy=self.name,
                 price=entry_price,
@@ -243,12 +311,8 @@ class Minute30Strategy(BaseStrategy):
         Returns:
             각 조건별 충족 여부
         """
-        cols = self._get_columns(df)
-        df = self._ensure_ma(df)
-
-        current_price = df[cols['close']].iloc[-1]
-        ma_col = f"ma{self.params['ma_period']}"
-        ma60 = df[ma_col].iloc[-1]
+        current_price = get_views(df)['close'][-1]
+        ma60 = self._ma_values(df)[-1]
 
         conditions = {}
 
@@ -267,18 +331,14 @@ class Minute30Strategy(BaseStrategy):
 
     def calculate_stop_loss(self, df: pd.DataFrame, entry_price: float) -> float:
         """손절가 계산"""
-        df = self._ensure_ma(df)
-        ma_col = f"ma{self.params['ma_period']}"
-        ma60 = df[ma_col].iloc[-1]
+        ma = self._ma_values(df)
 
-        breakout_low = self._get_breakout_candle_low(df)
-        return min(breakout_low * 0.99, ma60 * 0.98)
+        breakout_low = self._get_breakout_candle_low(get_views(df), ma)
+        return min(breakout_low * 0.99, ma[-1] * 0.98)
 
     def calculate_take_profit(self, df: pd.DataFrame, entry_price: float) -> float:
         """익절가 계산"""
-        df = self._ensure_ma(df)
-        ma_col = f"ma{self.params['ma_period']}"
-        ma60 = df[ma_col].iloc[-1]
+        ma60 = self._ma_values(df)[-1]
 
         return ma60 * (1 + self.params['ma_divergence_threshold'])
 
@@ -0,0 +1,57 @@
+"""
+테스트 공용 픽스처
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+
+
+def random_ohlcv(seed: int, n: int = 80) -> pd.DataFrame:
+    """급등 봉과 거래량 급증이 섞인 상승 추세 랜덤 일봉 데이터"""
+    rng = np.random.default_rng(seed)
+    change = rng.normal(0.002, 0.02, n)
+    spikes = rng.random(n) < 0.1
+    change[spikes] += rng.uniform(0.05, 0.12, spikes.sum())
+    closes = 10000 * np.cumprod(1 + change)
+    opens = closes / (1 + change)
+    volumes = rng.integers(100000, 200000, n)
+    volumes[spikes] *= 5
+    return pd.DataFrame(
+        {
+            "Open": opens,
+            "High": np.maximum(opens, closes) * (1 + rng.uniform(0, 0.01, n)),
+            "Low": np.minimum(opens, closes) * (1 - rng.uniform(0, 0.01, n)),
+            "Close": closes,
+            "Volume": volumes,
+        },
+        index=pd.date_range(start="2024-01-01", periods=n, freq="D"),
+    )
+
+
+@pytest.fixture
+def make_ohlcv():
+    """랜덤 OHLCV 생성 함수 (seed, n)"""
+    return random_ohlcv
+
+
+@pytest.fixture
+def edge_frames(make_ohlcv):
+    """결측/0/짧은 구간을 포함한 종목 데이터 (커널 경로 비교용)"""
+    frames = [make_ohlcv(i) for i in range(20)]
+
+    short = make_ohlcv(100, n=5)
+    nan_volume = make_ohlcv(101).astype({"Volume": float})
+    nan_volume.iloc[-3:, 4] = np.nan
+    nan_close = make_ohlcv(102)
+    nan_close.iloc[-10, 3] = np.nan
+    zero_volume = make_ohlcv(103)
+    zero_volume["Volume"] = 0
+    zero_low = make_ohlcv(104)
+    zero_low.iloc[-5:, 2] = 0.0
+    zero_open = make_ohlcv(105)
+    zero_open.iloc[-1, 0] = 0.0
+    rising_volume = make_ohlcv(106)
+    rising_volume["Volume"] = np.arange(len(rising_volume)) * 1000 + 200000
+
+    return frames + [short, nan_volume, nan_close, zero_volume, zero_low, zero_open, rising_volume]
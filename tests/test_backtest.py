@@ -26,6 +26,7 @@ from backtest import (
     calculate_win_rate,
     calculate_all_metrics,
     format_metrics_report,
+    precompute_indicators,
 )
 
 
@@ -259,6 +260,18 @@ class TestBacktester:
         assert isinstance(report, str)
         assert '백테스트' in report
 
+    def test_precompute_indicators(self, sample_stock_data):
+        """사전 계산 지표가 전략이 읽는 ma60만 추가하고 종목별 계산과 같은지 테스트"""
+        result = precompute_indicators(sample_stock_data)
+
+        for code, df in sample_stock_data.items():
+            assert list(result[code].columns) == list(df.columns) + ['ma60']
+            expected = df['Close'].rolling(60, min_periods=1).mean()
+            pd.testing.assert_series_equal(result[code]['ma60'], expected, check_names=False)
+
+        with_volume = precompute_indicators(sample_stock_data, ma_periods=[5], volume_period=20)
+        assert {'ma5', 'volume_ma20'} <= set(with_volume['005930'].columns)
+
 
 class TestFormatReport:
     """보고서 포맷팅 테스트"""
@@ -0,0 +1,98 @@
+"""
+데이터 모듈 테스트
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from config import INDICATOR_CACHE
+from data import DatabaseManager, compute_indicators, invalidate_cache, load_or_compute
+from data.indicator_cache import PARQUET_AVAILABLE
+
+pytestmark = pytest.mark.skipif(not PARQUET_AVAILABLE, reason="pyarrow/fastparquet 미설치")
+
+
+@pytest.fixture
+def daily_ohlcv():
+    """테스트용 일봉 데이터"""
+    np.random.seed(7)
+    closes = 10000 * np.cumprod(1 + np.random.normal(0.001, 0.02, 120))
+    return pd.DataFrame(
+        {
+            "Open": closes * 0.99,
+            "High": closes * 1.02,
+            "Low": closes * 0.97,
+            "Close": closes,
+            "Volume": np.random.randint(100000, 500000, 120),
+        },
+        index=pd.date_range(start="2024-01-01", periods=120, freq="D"),
+    )
+
+
+class _CountingCompute:
+    """compute_indicators 호출 횟수 기록"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, df):
+        self.calls += 1
+        return compute_indicators(df)
+
+
+class TestIndicatorCache:
+    """지표 캐시 테스트"""
+
+    def test_cache_hit(self, daily_ohlcv, tmp_path):
+        """같은 마지막 날짜/행 수면 저장된 지표를 재사용하는지 테스트"""
+        compute = _CountingCompute()
+        first = load_or_compute("005930", daily_ohlcv, compute, cache_dir=tmp_path)
+        second = load_or_compute("005930", daily_ohlcv, compute, cache_dir=tmp_path)
+
+        assert compute.calls == 1
+        pd.testing.assert_frame_equal(second, first, check_freq=False)
+
+    def test_cache_miss_on_new_bar(self, daily_ohlcv, tmp_path):
+        """새 봉이 추가되면(슬라이딩 구간 포함) 다시 계산하는지 테스트"""
+        compute = _CountingCompute()
+        load_or_compute("005930", daily_ohlcv.iloc[:-1], compute, cache_dir=tmp_path)
+        result = load_or_compute("005930", daily_ohlcv.iloc[1:], compute, cache_dir=tmp_path)
+
+        assert compute.calls == 2
+        pd.testing.assert_frame_equal(
+            result, daily_ohlcv.iloc[1:].assign(**compute_indicators(daily_ohlcv.iloc[1:]))
+        )
+
+    def test_stale_history_invalidated(self, daily_ohlcv, tmp_path):
+        """과거 봉 변경 후 캐시 삭제 시 새 데이터로 다시 계산하는지 테스트"""
+        compute = _CountingCompute()
+        load_or_compute("005930", daily_ohlcv, compute, cache_dir=tmp_path)
+
+        # 수정주가 반영: 과거 가격 전체 변경 (마지막 날짜/행 수는 동일)
+        adjusted = daily_ohlcv.assign(Close=daily_ohlcv["Close"] / 2)
+        invalidate_cache("005930", cache_dir=tmp_path)
+        result = load_or_compute("005930", adjusted, compute, cache_dir=tmp_path)
+
+        assert compute.calls == 2
+        np.testing.assert_allclose(result["ma20"], adjusted["Close"].rolling(20, min_periods=1).mean())
+
+    def test_insert_daily_ohlcv_invalidates(self, daily_ohlcv, tmp_path, monkeypatch):
+        """DB에 일봉을 저장하면 종목 지표 캐시가 삭제되는지 테스트"""
+        monkeypatch.setitem(INDICATOR_CACHE, "path", tmp_path / "cache")
+        load_or_compute("005930", daily_ohlcv)
+        cached = list((tmp_path / "cache").glob("005930_*.parquet"))
+        assert cached
+
+        db = DatabaseManager(tmp_path / "stock.db")
+        db.insert_daily_ohlcv_df("005930", daily_ohlcv)
+
+        assert not any(path.exists() for path in cached)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
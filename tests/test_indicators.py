@@ -15,6 +15,7 @@ from indicators import (
     calculate_sma,
     calculate_ema,
     calculate_all_ma,
+    calculate_all_ma_batch,
     get_ma_values,
     get_ma_status,
     detect_golden_cross,
@@ -103,6 +104,15 @@ class TestMovingAverage:
         # 첫 5개 이후부터는 NaN이 아님
         assert not sma.iloc[4:].isna().any()
 
+    def test_calculate_sma_long_series(self):
+        """긴 시계열 SMA (누적합 커널 경로) 테스트"""
+        np.random.seed(0)
+        close = pd.Series(np.random.uniform(1000, 2000, 3000))
+        sma = calculate_sma(close, period=20)
+        expected = close.rolling(window=20, min_periods=1).mean()
+
+        assert np.allclose(sma.values, expected.values)
+
     def test_calculate_ema(self, sample_ohlcv):
         """EMA 계산 테스트"""
         ema = calculate_ema(sample_ohlcv, period=5)
@@ -117,6 +127,32 @@ class TestMovingAverage:
         assert "ma5" in df.columns
         assert "ma20" in df.columns
 
+    def test_check_ma_alignment(self):
+        """마지막 행 기준 이동평균 정/역배열 테스트"""
+        from indicators.moving_average import check_ma_alignment
+
+        df = pd.DataFrame({
+            "ma5": [100.0, 110.0],
+            "ma20": [105.0, 105.0],
+            "ma60": [110.0, 100.0],
+        })
+        assert check_ma_alignment(df)
+        assert not check_ma_alignment(df, ascending=False)
+        assert check_ma_alignment(df.iloc[:1], ascending=False)
+        assert not check_ma_alignment(df, periods=[5, 120])
+
+    def test_calculate_all_ma_batch(self, sample_ohlcv):
+        """종목 일괄 MA 계산 테스트"""
+        closes = {
+            "A": sample_ohlcv["Close"].values,
+            "B": sample_ohlcv["Close"].values[:50],
+        }
+        result = calculate_all_ma_batch(closes, periods=[5, 20])
+        expected = calculate_all_ma(sample_ohlcv, periods=[5, 20])
+
+        assert len(result["B"][20]) == 50
+        assert np.allclose(result["A"][20], expected["ma20"].values)
+
     def test_get_ma_values(self, sample_ohlcv):
         """MA 값 조회 테스트"""
         df = calculate_all_ma(sample_ohlcv, periods=[5, 20])
@@ -171,6 +207,18 @@ class TestVolume:
 
         assert len(vol_ratio) == len(sample_ohlcv)
 
+    def test_calculate_volume_change_zero_base(self):
+        """기준 거래량이 0일 때 pandas pct_change와 같은 inf/NaN인지 테스트"""
+        from indicators.volume import calculate_volume_change
+
+        volumes = np.array([0, 5, 0, 0, 3, 2, 0], dtype=np.int64)
+        df = pd.DataFrame({"Close": np.arange(7.0) + 1, "Volume": volumes})
+
+        for periods in (1, 2):
+            result = calculate_volume_change(df, periods=periods)
+            expected = df["Volume"].pct_change(periods=periods)
+            np.testing.assert_allclose(result.to_numpy(), expected.to_numpy())
+
     def test_detect_volume_spike(self, volume_spike_data):
         """거래량 급증 감지 테스트"""
         spike = detect_volume_spike(volume_spike_data, threshold=2.0, period=20)
@@ -237,6 +285,28 @@ class TestSupportResistance:
         for level in resistances:
             assert level > 0
 
+    def test_find_levels_num_levels(self, sample_ohlcv):
+        """레벨 수 제한 및 지지선 정렬 순서 테스트"""
+        supports = find_support_levels(sample_ohlcv, lookback=30, num_levels=2)
+        assert supports == sorted(supports, reverse=True)
+        assert len(supports) <= 2
+
+        for n in (0, -1):
+            assert find_support_levels(sample_ohlcv, num_levels=n) == []
+            assert find_resistance_levels(sample_ohlcv, num_levels=n) == []
+
+    def test_nearest_levels_unsorted(self):
+        """정렬되지 않은 레벨 리스트에서 가장 가까운 지지/저항 테스트"""
+        from indicators.support_resistance import get_nearest_support, get_nearest_resistance
+
+        levels = [120.0, 90.0, 110.0, 80.0, 100.0]
+        assert get_nearest_support(105.0, levels) == 100.0
+        assert get_nearest_resistance(105.0, levels) == 110.0
+        assert get_nearest_support(100.0, levels) == 90.0
+        assert get_nearest_resistance(100.0, levels) == 110.0
+        assert get_nearest_support(70.0, levels) is None
+        assert get_nearest_resistance(130.0, levels) is None
+
     def test_find_box_range(self, sample_ohlcv):
         """박스권 찾기 테스트"""
         box = find_box_range(sample_ohlcv, lookback=10, variance=0.10)
@@ -260,6 +330,61 @@ class TestSupportResistance:
 
         assert isinstance(result, (bool, np.bool_))
 
+    def test_column_lookup_after_columns_reassigned(self, sample_ohlcv):
+        """컬럼 재할당 후 이전 매핑이 재사용되지 않는지 테스트"""
+        from indicators.support_resistance import get_price_columns
+        from indicators.volume import get_volume_column
+
+        df = sample_ohlcv.copy()
+        for i in range(200):
+            names = ["Open", "High", "Low", "Close", "Volume"]
+            if i % 2:
+                names = [c.lower() for c in names]
+            df.columns = names
+
+            assert get_price_columns(df)["close"] == names[3]
+            assert get_volume_column(df) == names[4]
+            assert "_price_cols_cache" not in df.attrs
+
+
+class TestOHLCVViews:
+    """OHLCV 뷰 캐시 테스트"""
+
+    def test_views_after_block_replaced(self, sample_ohlcv):
+        """값 블록이 교체되면(컬럼 재할당, copy-on-write 복사) 새 값을 반환하는지 테스트"""
+        from indicators._views import get_views
+
+        df = sample_ohlcv.copy()
+        get_views(df)
+
+        df["Close"] = df["Close"].to_numpy() + 1.0
+        assert get_views(df)["close"][-1] == df["Close"].iloc[-1]
+
+        close = df["Close"]  # 블록 참조를 잡아 두어 copy-on-write 환경에서 수정 시 복사 유도
+        df.loc[df.index[-1], "Close"] = 50.0
+        assert get_views(df)["close"][-1] == 50.0
+        del close
+
+    def test_views_after_in_place_edit_converted(self, sample_ohlcv):
+        """형 변환된(정수 가격) 뷰도 제자리 수정 값을 반환하는지 테스트"""
+        from indicators._views import get_views
+
+        df = sample_ohlcv.round().astype({"Close": np.int64})
+        assert get_views(df)["close"].dtype == np.float64
+
+        df.iloc[-1, df.columns.get_loc("Close")] = 50
+        assert get_views(df)["close"][-1] == 50.0
+
+    def test_clean_view_after_nan_edit(self, sample_ohlcv):
+        """첫 조회 이후 결측치를 넣으면 JIT 입력에서 제외되는지 테스트"""
+        from indicators._views import get_clean_view
+
+        df = sample_ohlcv.copy()
+        assert get_clean_view(df, "close") is not None
+
+        df.loc[df.index[-2], "Close"] = np.nan
+        assert get_clean_view(df, "close") is None
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
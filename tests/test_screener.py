@@ -0,0 +1,111 @@
+"""
+스크리너 모듈 테스트
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from screener.screener import StockScreener
+
+
+@pytest.fixture
+def stock_data(make_ohlcv):
+    """스크리닝 입력 데이터 (60종목)"""
+    return {
+        f"{i:06d}": {"df": make_ohlcv(i), "name": f"종목{i}"}
+        for i in range(60)
+    }
+
+
+class TestStockScreener:
+    """스크리너 테스트"""
+
+    @staticmethod
+    def _keys(results):
+        return sorted((r.code, r.strategy, r.signal.price) for r in results)
+
+    def test_screen_stocks_process_pool(self, stock_data):
+        """프로세스 풀 스크리닝이 스레드 풀과 같은 결과인지 테스트 (프리셋 사전 필터 포함)"""
+        threaded = StockScreener().set_filter_preset("default").screen_stocks(
+            stock_data, max_workers=2, chunk_size=10
+        )
+        processed = StockScreener().set_filter_preset("default").screen_stocks(
+            stock_data, max_workers=2, chunk_size=10, use_processes=True
+        )
+
+        assert threaded
+        assert self._keys(processed) == self._keys(threaded)
+
+
+class TestFilterKernel:
+    """통합 필터 커널과 벡터화 필터의 일치 여부 테스트"""
+
+    CASES = [
+        ("min_volume", {"min_volume": 300000, "days": 5}),
+        ("price_range", {"min_price": 9000, "max_price": 20000}),
+        ("price_above_ma", {"period": 20}),
+        ("volume_spike", {"spike_ratio": 1.2, "lookback": 20}),
+        ("ma_alignment", {"periods": [5, 20, 60]}),
+        ("ma_alignment", {"periods": [5, 20], "ascending": False}),
+        ("box_range", {"lookback": 10, "variance": 0.15}),
+        ("volume_increase", {"increase_days": 2}),
+    ]
+
+    @pytest.mark.parametrize("filter_name,params", CASES)
+    def test_kernel_matches_vectorized(self, filter_name, params, edge_frames):
+        """필터별 커널 판정이 vec_filter_*와 같은지 테스트"""
+        from screener.filters import (
+            FilterFactory, KERNEL_FILTERS, VECTORIZED_FILTERS, build_panels,
+        )
+        from screener._filter_kernel import NUMBA_AVAILABLE, fused_filter_mask
+
+        if not NUMBA_AVAILABLE:
+            pytest.skip("numba 미설치")
+
+        f = FilterFactory.create(filter_name, **params)
+        vec_func, window = VECTORIZED_FILTERS[f.filter_func]
+        op, to_params = KERNEL_FILTERS[f.filter_func]
+        panels = build_panels(edge_frames, window(**f.params))
+
+        expected = vec_func(panels, **f.params)
+        result = fused_filter_mask([op], [to_params(**f.params)], panels)[:, 0]
+
+        np.testing.assert_array_equal(result, expected)
+
+    def test_compiled_preset_matches_vectorized(self, edge_frames):
+        """프리셋 사전 필터(커널 경로)가 벡터화 필터 곱과 같은지 테스트"""
+        from screener.filters import (
+            FilterFactory, VECTORIZED_FILTERS, build_panels, panel_lookback,
+        )
+
+        filters = FilterFactory.create_preset("default")
+        panels = build_panels(edge_frames, panel_lookback(filters))
+
+        expected = np.logical_and.reduce([
+            VECTORIZED_FILTERS[f.filter_func][0](panels, **f.params)
+            for f in filters if f.filter_func in VECTORIZED_FILTERS
+        ])
+        np.testing.assert_array_equal(FilterFactory.compile_preset("default")(panels), expected)
+
+    @pytest.mark.parametrize("filter_name,params", CASES)
+    def test_kernel_matches_single_stock_filter(self, filter_name, params, edge_frames):
+        """커널 판정이 종목별 기존 필터(filter_*) 판정과 같은지 테스트"""
+        from screener.filters import FilterFactory, KERNEL_FILTERS, VECTORIZED_FILTERS, build_panels
+        from screener._filter_kernel import NUMBA_AVAILABLE, fused_filter_mask
+
+        if not NUMBA_AVAILABLE:
+            pytest.skip("numba 미설치")
+
+        f = FilterFactory.create(filter_name, **params)
+        op, to_params = KERNEL_FILTERS[f.filter_func]
+        panels = build_panels(edge_frames, VECTORIZED_FILTERS[f.filter_func][1](**f.params))
+
+        expected = [bool(f.apply(df).passed) for df in edge_frames]
+        result = fused_filter_mask([op], [to_params(**f.params)], panels)[:, 0]
+
+        assert result.tolist() == expected
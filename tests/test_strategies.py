@@ -211,6 +211,19 @@ class TestStrategyRegistry:
         strategies = get_all_strategies()
         assert len(strategies) >= 4
 
+    def test_generate_all_signals_batch(self, sample_daily_data, breakout_data):
+        """종목 묶음 신호 생성이 종목별 생성과 같은지 테스트"""
+        from strategies.base_strategy import strategy_manager
+
+        data = {"000001": sample_daily_data, "000002": breakout_data}
+        batch = strategy_manager.generate_all_signals_batch(data, max_workers=2, chunk_size=1)
+
+        assert list(batch) == list(data)
+        for code, df in data.items():
+            expected = strategy_manager.generate_all_signals(df, code)
+            assert [(s.strategy, s.price) for s in batch[code]] == \
+                   [(s.strategy, s.price) for s in expected]
+
 
 class TestMinute15Strategy:
     """15분봉 전략 테스트"""
@@ -230,6 +243,97 @@ class TestMinute15Strategy:
             assert signal.strategy == "minute15"
             assert signal.signal_type == SignalType.BUY
 
+    @staticmethod
+    def _long_candle_data():
+        """마지막 봉이 9% 장대양봉 + 거래량 5배인 15분봉 데이터"""
+        closes = np.linspace(10000, 10300, 61)
+        opens = closes.copy()
+        volumes = np.full(61, 100000)
+        opens[-1] = closes[-2]
+        closes[-1] = opens[-1] * 1.09
+        volumes[-1] = 500000
+        return pd.DataFrame({
+            "Open": opens,
+            "High": np.maximum(opens, closes) + 10,
+            "Low": np.minimum(opens, closes) - 10,
+            "Close": closes,
+            "Volume": volumes,
+        })
+
+    def test_generate_signal_zero_open(self):
+        """시가 0인 봉에서 JIT 경로가 오류 없이 pandas 경로와 같은 결과인지 테스트"""
+        strategy = Minute15Strategy()
+        df = self._long_candle_data()
+        df.loc[df.index[-1], "Open"] = 0.0
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            expected = strategy._generate_signal_pandas(df, "005930", "삼성전자")
+        signal = strategy.generate_signal(df, "005930", "삼성전자")
+
+        assert (signal is None) == (expected is None)
+
+    def test_generate_signal_uses_ma60_column(self):
+        """JIT 경로가 기존 ma60 컬럼을 사용하는지 테스트"""
+        strategy = Minute15Strategy()
+        df = self._long_candle_data()
+        assert strategy.generate_signal(df) is not None
+
+        # 현재가보다 높은 ma60 컬럼이 있으면 60선 조건 미충족
+        df["ma60"] = df["Close"].iloc[-1] * 1.1
+        assert strategy.generate_signal(df) is None
+        assert strategy._generate_signal_pandas(df, "", "") is None
+
+    def test_kernel_matches_pandas(self, make_ohlcv):
+        """JIT 신호가 pandas 경로 신호와 같은지 테스트"""
+        strategy = Minute15Strategy()
+        frames = [make_ohlcv(seed) for seed in range(40)] + [self._long_candle_data()]
+
+        hits = 0
+        for df in frames:
+            signal = strategy.generate_signal(df, "005930")
+            expected = strategy._generate_signal_pandas(df, "005930", "")
+            assert (signal is None) == (expected is None)
+            if signal is not None:
+                hits += 1
+                assert signal.price == pytest.approx(expected.price)
+                assert signal.stop_loss == pytest.approx(expected.stop_loss)
+                assert signal.take_profit == pytest.approx(expected.take_profit)
+        assert hits > 0
+
+    def test_kernel_matches_baseline_indicators(self, edge_frames):
+        """JIT 조건이 기존 지표 함수(detect_volume_spike, rolling 평균) 판정과 같은지 테스트"""
+        from indicators import detect_volume_spike
+        from indicators._views import get_clean_view
+        from strategies.minute15_strategy import _generate_signal_njit
+
+        strategy = Minute15Strategy()
+        ratio = strategy.params["volume_spike_ratio"]
+        checked = 0
+        for df in edge_frames:
+            arrays = [get_clean_view(df, name) for name in ("open", "low", "close", "vol")]
+            if len(df) < 60 or any(arr is None for arr in arrays):
+                continue
+
+            (bullish, _, vol_spike, above_ma60, *_rest) = _generate_signal_njit(
+                *arrays, strategy.params["long_candle_threshold"], ratio, False, np.nan
+            )
+            ma60 = df["Close"].rolling(60, min_periods=1).mean().iloc[-1]
+            assert vol_spike == bool(detect_volume_spike(df, threshold=ratio).iloc[-1])
+            assert above_ma60 == (df["Close"].iloc[-1] > ma60)
+            assert bullish == (df["Close"].iloc[-1] > df["Open"].iloc[-1])
+            checked += 1
+        assert checked > 20
+
+    def test_generate_signal_with_nan(self):
+        """결측치가 있으면 pandas 경로로 처리되는지 테스트"""
+        strategy = Minute15Strategy()
+        df = self._long_candle_data()
+        df.loc[df.index[5], "Close"] = np.nan
+
+        signal = strategy.generate_signal(df, "005930")
+        expected = strategy._generate_signal_pandas(df, "005930", "")
+        assert (signal is None) == (expected is None)
+
 
 class TestMinute30Strategy:
     """30분봉 전략 테스트"""
@@ -247,6 +351,39 @@ class TestMinute30Strategy:
         if signal:
             assert signal.strategy == "minute30"
 
+    def test_ma_values_after_in_place_edit(self, sample_daily_data):
+        """봉 값을 제자리 수정하면 MA60이 다시 계산되는지 테스트"""
+        strategy = Minute30Strategy()
+        df = sample_daily_data.copy()
+        strategy._ma_values(df)
+
+        df.loc[df.index[-1], "Close"] = 50.0
+        expected = df["Close"].rolling(60, min_periods=1).mean().iloc[-1]
+        assert strategy._ma_values(df)[-1] == pytest.approx(expected)
+
+    def test_kernel_matches_numpy(self, make_ohlcv):
+        """JIT 매수 조건이 NumPy 경로 조건과 같은지 테스트"""
+        from indicators._views import get_views
+
+        strategy = Minute30Strategy()
+        for seed in range(40):
+            df = make_ohlcv(seed)
+            ma = strategy._ma_values(df)
+            kernel_conditions, _ = strategy._kernel_buy_conditions(df, ma)
+            assert kernel_conditions == strategy._evaluate_buy_conditions(get_views(df), ma)
+
+    def test_zero_volume(self, make_ohlcv):
+        """거래량이 모두 0이어도 두 경로 조건이 같은지 테스트"""
+        from indicators._views import get_views
+
+        strategy = Minute30Strategy()
+        df = make_ohlcv(0)
+        df["Volume"] = 0
+        ma = strategy._ma_values(df)
+        kernel_conditions, _ = strategy._kernel_buy_conditions(df, ma)
+        assert kernel_conditions == strategy._evaluate_buy_conditions(get_views(df), ma)
+        assert not kernel_conditions["volume_increase"]
+
 
 class TestLimitUpStrategy:
     """상한가 전략 테스트"""
@@ -276,6 +413,20 @@ class TestLimitUpStrategy:
             assert signal.stop_loss < signal.price
             assert signal.take_profit > signal.price
 
+    def test_generate_signals_batch(self, sample_daily_data, limit_up_data):
+        """종목 일괄 신호 생성이 종목별 생성과 같은지 테스트"""
+        strategy = LimitUpStrategy()
+        data = {"000001": sample_daily_data, "000002": limit_up_data}
+
+        batch = strategy.generate_signals_batch(data)
+        expected = [
+            signal for code, df in data.items()
+            if (signal := strategy.generate_signal(df, code)) is not None
+        ]
+
+        assert [(s.code, s.price, s.stop_loss) for s in batch] == \
+               [(s.code, s.price, s.stop_loss) for s in expected]
+
 
 class TestBreakoutStrategy:
     """돌파 전략 테스트"""
@@ -303,6 +454,38 @@ class TestBreakoutStrategy:
             assert signal.strategy == "breakout"
             assert signal.stop_loss < signal.price
 
+    @staticmethod
+    def _assert_same_conditions(strategy, df):
+        from indicators._views import get_views
+
+        result = strategy.check_buy_conditions(df)
+        expected = strategy._check_buy_conditions_pandas(get_views(df))
+        keys = ["reference_candle", "consolidation", "breakout", "ma_alignment", "volume_increase"]
+        assert {k: bool(result[k]) for k in keys} == {k: bool(expected[k]) for k in keys}
+        if expected["reference_candle"]:
+            ref, ref_expected = (r["metadata"]["reference_candle"] for r in (result, expected))
+            assert ref["index"] == ref_expected["index"]
+            assert ref["change_rate"] == pytest.approx(ref_expected["change_rate"])
+            assert ref["volume_ratio"] == pytest.approx(ref_expected["volume_ratio"])
+        return result
+
+    def test_kernel_matches_pandas(self, breakout_data, make_ohlcv):
+        """JIT 매수 조건이 pandas 경로 조건과 같은지 테스트"""
+        strategy = BreakoutStrategy()
+        frames = [make_ohlcv(seed) for seed in range(40)] + [breakout_data]
+
+        found = [self._assert_same_conditions(strategy, df)["reference_candle"] for df in frames]
+        assert any(found)
+
+    def test_zero_open(self, breakout_data):
+        """시가 0인 봉에서 JIT 경로가 오류 없이 pandas 경로와 같은지 테스트"""
+        strategy = BreakoutStrategy()
+        df = breakout_data.astype({"Open": float})
+        df.iloc[20, 0] = 0.0
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            self._assert_same_conditions(strategy, df)
+
 
 class TestBaseStrategy:
     """BaseStrategy 테스트"""
@@ -35,6 +35,7 @@ from .helpers import (
     ensure_datetime_index,
     resample_ohlcv,
     normalize_column_names,
+    normalize_ohlcv,
     normalize_stock_code,
     is_valid_stock_code,
     chunk_list,
@@ -86,6 +87,7 @@ __all__ = [
     'ensure_datetime_index',
     'resample_ohlcv',
     'normalize_column_names',
+    'normalize_ohlcv',
     'normalize_stock_code',
     'is_valid_stock_code',
     'chunk_list',
@@ -171,6 +171,14 @@ def normalize_column_names(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
+def normalize_ohlcv(df: pd.DataFrame) -> pd.DataFrame:
+    """OHLCV 컬럼명 소문자 통일 (복사 없이 제자리 변경, 이미 소문자면 그대로 반환)"""
+    if all(c == c.lower() for c in df.columns if isinstance(c, str)):
+        return df
+    df.columns = [c.lower() if isinstance(c, str) else c for c in df.columns]
+    return df
+
+
 # =========================================================
 # 종목 코드 관련 함수
 # =========================================================